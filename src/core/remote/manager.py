@@ -61,9 +61,13 @@ class RemoteManager:
         """
         return self.ps_remote.is_connected()
         
-    def refresh_connections(self):
-        """Refresh the list of saved connections."""
-        self.ps_remote.refresh_connections()
+    def refresh_connections(self, force=False):
+        """Refresh the list of saved connections.
+        
+        Args:
+            force: Test every connection even if the last refresh is recent
+        """
+        self.ps_remote.refresh_connections(force)
         
     def get_connections(self):
         """Get list of saved connections.
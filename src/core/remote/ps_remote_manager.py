@@ -44,11 +44,18 @@ class PSRemoteConnection:
 class PSRemoteManager:
     """Manages connections to remote PCs using PowerShell Remoting (WinRM)."""
     
+    # Seconds a connection status refresh stays valid
+    STATUS_CACHE_TTL = 5.0
+    
     def __init__(self):
         """Initialize the PowerShell Remoting manager."""
         self.logger = setup_logger(self.__class__.__name__)
         self.connections: Dict[str, PSRemoteConnection] = {}
         self.current_connection: Optional[PSRemoteConnection] = None
+        # Hostname -> (username, password) last stored for it with cmdkey
+        self._stored_credentials: Dict[str, Tuple[str, str]] = {}
+        # Time of the last status refresh, None when it must run again
+        self._last_refresh: Optional[float] = None
         self.connections_file = self._get_connections_file_path()
         self._load_connections()
         
@@ -162,9 +169,13 @@ class PSRemoteManager:
             # First store the credentials using cmdkey (Windows credential manager)
             cmdkey_command = f'cmdkey /add:{hostname} /user:{username} /pass:{password}'
             try:
-                # Store credentials temporarily
-                subprocess.run(cmdkey_command, shell=True, check=True, capture_output=True)
-                self.logger.debug(f"Stored temporary credentials for {hostname}")
+                # cmdkey keeps one credential per host, so store again whenever
+                # another user or password was stored for the host since
+                credentials = (username, password)
+                if self._stored_credentials.get(hostname) != credentials:
+                    subprocess.run(cmdkey_command, shell=True, check=True, capture_output=True)
+                    self._stored_credentials[hostname] = credentials
+                    self.logger.debug(f"Stored temporary credentials for {hostname}")
                 
                 # Now create a simple PowerShell command that uses the stored credentials
                 ps_script = f'''
@@ -210,12 +221,19 @@ class PSRemoteManager:
             if process.stderr:
                 self.logger.error(f"PowerShell stderr: {process.stderr}")
             
+            # The cmdkey entry may have been removed or replaced outside the
+            # app, so store the credentials again on the next command
+            if process.returncode:
+                self._stored_credentials.pop(hostname, None)
+            
             return process.returncode, process.stdout, process.stderr
             
         except subprocess.TimeoutExpired:
+            self._stored_credentials.pop(hostname, None)
             self.logger.error(f"Command timed out after {timeout + 5} seconds")
             return 1, "", f"Command timed out after {timeout + 5} seconds"
         except Exception as e:
+            self._stored_credentials.pop(hostname, None)
             self.logger.error(f"Error executing remote PowerShell command: {str(e)}")
             return 1, "", str(e)
     
@@ -289,6 +307,7 @@ class PSRemoteManager:
             
             # Save connections to file
             self._save_connections()
+            self.invalidate_status_cache()
             
             self.logger.info(f"Added connection '{name}' to {hostname}")
             return True
@@ -350,6 +369,7 @@ class PSRemoteManager:
                 
             connection.is_connected = True
             self.current_connection = connection
+            self.invalidate_status_cache()
             self.logger.info(f"Connected to {name}")
             return True
             
@@ -371,6 +391,7 @@ class PSRemoteManager:
             # Just clear the current connection
             self.current_connection.is_connected = False
             self.current_connection = None
+            self.invalidate_status_cache()
             self.logger.info("Disconnected from remote PC")
             return True
             
@@ -395,11 +416,13 @@ class PSRemoteManager:
             if self.current_connection and self.current_connection.name == name:
                 self.disconnect()
                 
-            # Remove the connection
-            del self.connections[name]
+            # Remove the connection and forget the credentials stored for it
+            connection = self.connections.pop(name)
+            self._stored_credentials.pop(connection.hostname, None)
             
             # Save connections to file
             self._save_connections()
+            self.invalidate_status_cache()
             
             self.logger.info(f"Removed connection: {name}")
             return True
@@ -427,8 +450,23 @@ class PSRemoteManager:
         """
         return self.connections.get(name)
     
-    def refresh_connections(self) -> None:
-        """Refresh all connections and update their status."""
+    def invalidate_status_cache(self) -> None:
+        """Make the next refresh_connections call test every connection."""
+        self._last_refresh = None
+        
+    def refresh_connections(self, force: bool = False) -> None:
+        """Refresh all connections and update their status.
+        
+        Statuses tested within the last STATUS_CACHE_TTL seconds are kept
+        unless force is set.
+        
+        Args:
+            force: Test every connection even if the last refresh is recent
+        """
+        if (not force and self._last_refresh is not None
+                and time.monotonic() - self._last_refresh < self.STATUS_CACHE_TTL):
+            return
+            
         for name, connection in list(self.connections.items()):
             try:
                 # Test connection
@@ -449,6 +487,8 @@ class PSRemoteManager:
             except Exception as e:
                 self.logger.error(f"Error refreshing connection {name}: {str(e)}")
                 connection.is_connected = False
+                
+        self._last_refresh = time.monotonic()
     
     def execute_command(self, command: str) -> Tuple[int, str, str]:
         """Execute a PowerShell command on the remote PC.
@@ -1,8 +1,9 @@
 """Remote PC Connection Dialog."""
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
-                          QPushButton, QLineEdit, QTreeWidget, QTreeWidgetItem,
+                          QPushButton, QLineEdit, QTreeView, QHeaderView, QAbstractItemView,
                           QMessageBox, QLabel, QCheckBox, QGroupBox, QGridLayout)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import (Qt, QThread, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel)
 from PyQt6.QtGui import QColor
 import subprocess
 import socket
@@ -10,6 +11,11 @@ import time
 from src.core.remote.ps_remote_manager import PSRemoteManager
 from src.ui.dialogs.enable_winrm_dialog import EnableWinRMDialog
 
+# Status text colors, shared by every row
+_STATUS_OK_COLOR = QColor(0, 128, 0)  # Green
+_STATUS_ERROR_COLOR = QColor(255, 0, 0)  # Red
+_STATUS_IDLE_COLOR = QColor(128, 128, 128)  # Gray
+
 class PingTestThread(QThread):
     """Thread for running ping tests."""
     result_signal = pyqtSignal(bool, str)
@@ -154,6 +160,25 @@ class AddConnectionThread(QThread):
             self.result_signal.emit(False, f"Error connecting to {self.hostname}: {str(e)}")
 
 
+class RemoveConnectionThread(QThread):
+    """Thread for removing a saved connection without blocking the UI."""
+    
+    result_signal = pyqtSignal(str, bool)  # name, success
+    
+    def __init__(self, remote_manager, name):
+        super().__init__()
+        self.remote_manager = remote_manager
+        self.name = name
+        
+    def run(self):
+        """Remove the connection."""
+        try:
+            success = self.remote_manager.remove_connection(self.name)
+        except Exception:
+            success = False
+        self.result_signal.emit(self.name, success)
+
+
 class ConnectThread(QThread):
     """Thread for connecting to a PC without blocking the UI."""
     
@@ -208,6 +233,133 @@ class DisconnectThread(QThread):
             self.result_signal.emit(self.name, False, f"Error disconnecting from {self.name}: {str(e)}")
 
 
+class RefreshConnectionsThread(QThread):
+    """Thread for re-testing saved connections without blocking the UI."""
+    
+    result_signal = pyqtSignal(list)  # connections
+    
+    def __init__(self, remote_manager, force=False):
+        super().__init__()
+        self.remote_manager = remote_manager
+        self.force = force
+        
+    def run(self):
+        """Test every saved connection and report the updated list."""
+        try:
+            self.remote_manager.refresh_connections(self.force)
+        except Exception:
+            # Report the last known state if the status check fails
+            pass
+        self.result_signal.emit(list(self.remote_manager.get_connections()))
+
+
+class ConnectionsModel(QAbstractTableModel):
+    """Table model listing saved remote PC connections."""
+    
+    HEADERS = ["Name", "Hostname", "Username", "Status"]
+    STATUS_COLUMN = 3
+    # Status text indexed by is_connected
+    STATUS_TEXT = ("Disconnected", "Connected")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Each row is [name, hostname, username, status, status_color]
+        self._rows = []
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Get the number of connections."""
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        """Get the number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Get cell data for visible cells."""
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[index.column()]
+        if role == Qt.ItemDataRole.ForegroundRole and index.column() == self.STATUS_COLUMN:
+            return row[4]
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Get column header labels."""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+        
+    def set_connections(self, connections):
+        """Update the listed connections to match a new snapshot.
+        
+        Only rows that were removed, added or changed are reported to the
+        view, so unchanged rows are neither rebuilt nor repainted.
+        
+        Args:
+            connections: Connection objects with name, hostname, username and
+                is_connected attributes
+        """
+        new_rows = {
+            pc.name: [pc.name, pc.hostname, pc.username,
+                      self.STATUS_TEXT[bool(pc.is_connected)], None]
+            for pc in connections
+        }
+        
+        # Remove rows of connections that no longer exist, bottom up
+        for i in range(len(self._rows) - 1, -1, -1):
+            if self._rows[i][0] not in new_rows:
+                self.beginRemoveRows(QModelIndex(), i, i)
+                del self._rows[i]
+                self.endRemoveRows()
+                
+        # Update changed rows in place
+        existing = set()
+        last_column = len(self.HEADERS) - 1
+        for i, row in enumerate(self._rows):
+            new_row = new_rows[row[0]]
+            existing.add(row[0])
+            if row != new_row:
+                self._rows[i] = new_row
+                self.dataChanged.emit(self.index(i, 0), self.index(i, last_column))
+                
+        # Append new connections
+        added = [row for name, row in new_rows.items() if name not in existing]
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+        
+    def name_at(self, row):
+        """Get the connection name shown in a row.
+        
+        Args:
+            row: Row number
+            
+        Returns:
+            str: Connection name
+        """
+        return self._rows[row][0]
+        
+    def set_status(self, name, status, color=None):
+        """Update the status cell of a connection.
+        
+        Args:
+            name: Connection name
+            status: Status text
+            color: Optional QColor for the status text
+        """
+        for i, row in enumerate(self._rows):
+            if row[0] == name:
+                row[3] = status
+                row[4] = color
+                index = self.index(i, self.STATUS_COLUMN)
+                self.dataChanged.emit(index, index)
+                break
+
+
 class ConnectionDialog(QDialog):
     """Dialog for managing remote PC connections."""
     
@@ -217,6 +369,14 @@ class ConnectionDialog(QDialog):
         # Create PSRemoteManager instance if not already available
         if not hasattr(self.remote_manager, 'ps_remote'):
             self.remote_manager.ps_remote = PSRemoteManager()
+        self.refresh_thread = None
+        self._refresh_pending = False
+        self._refresh_force = False
+        # Coalesces refreshes requested in quick succession into one
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(120)
+        self._refresh_timer.timeout.connect(self._do_refresh)
         self.setWindowTitle("Remote PC Connections")
         self.setup_ui()
         
@@ -234,16 +394,29 @@ class ConnectionDialog(QDialog):
         layout.addWidget(info_label)
         
         # Connection list
-        self.connections_tree = QTreeWidget()
-        self.connections_tree.setHeaderLabels([
-            "Name",
-            "Hostname",
-            "Username",
-            "Status"
-        ])
+        self.connections_model = ConnectionsModel(self)
+        self.connections_tree = QTreeView()
+        # Sorting reorders proxy indices; the model's rows are never rebuilt
+        self.connections_proxy = QSortFilterProxyModel(self)
+        self.connections_proxy.setSourceModel(self.connections_model)
+        self.connections_tree.setModel(self.connections_proxy)
+        self.connections_tree.setSortingEnabled(True)
+        self.connections_tree.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        self.connections_tree.setRootIsDecorated(False)
         self.connections_tree.setAlternatingRowColors(True)
+        # All rows are single-line text, so row heights need no measuring
+        self.connections_tree.setUniformRowHeights(True)
+        self.connections_tree.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        
+        # Fixed and interactive sections never measure the rows' contents
+        header = self.connections_tree.header()
+        header.setStretchLastSection(False)
         for i, width in enumerate([150, 150, 150, 100]):
-            self.connections_tree.setColumnWidth(i, width)
+            header.resizeSection(i, width)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(ConnectionsModel.STATUS_COLUMN, QHeaderView.ResizeMode.Fixed)
             
         layout.addWidget(self.connections_tree)
         
@@ -338,12 +511,53 @@ class ConnectionDialog(QDialog):
         # Connect signals
         self.add_btn.clicked.connect(self.add_connection)
         self.remove_btn.clicked.connect(self.remove_connection)
-        self.refresh_btn.clicked.connect(self.refresh_connections)
+        self.refresh_btn.clicked.connect(lambda: self.refresh_connections(force=True))
         self.close_btn.clicked.connect(self.accept)
         
-        # Initial load
+        # Show the saved connections right away, then test them in the background
+        self.connections_model.set_connections(self.remote_manager.get_connections())
         self.refresh_connections()
         
+    def _show_message(self, icon, title, text):
+        """Show a message box without blocking the event loop.
+        
+        Args:
+            icon: QMessageBox.Icon of the message
+            title: Window title
+            text: Message text
+            
+        Returns:
+            QMessageBox: The opened message box
+        """
+        box = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
+        return box
+        
+    def _ask(self, title, text, on_yes, on_no=None):
+        """Ask a yes/no question without blocking the event loop.
+        
+        Args:
+            title: Window title
+            text: Question text
+            on_yes: Callable run if the user answers Yes
+            on_no: Optional callable run for any other answer
+        """
+        box = QMessageBox(
+            QMessageBox.Icon.Question, title, text,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self
+        )
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        
+        def handle_finished(_result):
+            if box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Yes:
+                on_yes()
+            elif on_no is not None:
+                on_no()
+                
+        box.finished.connect(handle_finished)
+        box.open()
+        
     def add_connection(self):
         """Add a new remote PC connection."""
         name = self.name_edit.text().strip()
@@ -352,7 +566,7 @@ class ConnectionDialog(QDialog):
         password = self.password_edit.text()
         
         if not all([name, hostname, username, password]):
-            QMessageBox.warning(self, "Warning", "Please fill in all fields")
+            self._show_message(QMessageBox.Icon.Warning, "Warning", "Please fill in all fields")
             return
         
         # Update log to show we're connecting
@@ -396,44 +610,101 @@ class ConnectionDialog(QDialog):
             
     def remove_connection(self):
         """Remove the selected connection."""
-        current_item = self.connections_tree.currentItem()
-        if not current_item:
+        current = self.connections_tree.currentIndex()
+        if not current.isValid():
             return
             
-        name = current_item.text(0)
+        name = self.connections_model.name_at(self.connections_proxy.mapToSource(current).row())
         
-        reply = QMessageBox.question(
-            self,
+        self._ask(
             "Confirm Remove",
             f"Are you sure you want to remove the connection to '{name}'?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            lambda: self._start_remove_connection(name)
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
-            if self.remote_manager.remove_connection(name):
-                self.refresh_connections()
-            else:
-                QMessageBox.critical(self, "Error", f"Failed to remove connection to {name}")
+    def _start_remove_connection(self, name):
+        """Remove a confirmed connection in the background.
+        
+        Args:
+            name: Connection name
+        """
+        # Disconnecting and saving the connections file run in the background
+        self.remove_btn.setEnabled(False)
+        self.remove_thread = RemoveConnectionThread(self.remote_manager, name)
+        self.remove_thread.result_signal.connect(self._handle_remove_connection_result)
+        self.remove_thread.start()
+        
+
+    def _handle_remove_connection_result(self, name, success):
+        """Handle connection removal result."""
+        self.remove_btn.setEnabled(True)
+        if success:
+            self.refresh_connections()
+        else:
+            self._show_message(QMessageBox.Icon.Critical, "Error", f"Failed to remove connection to {name}")
                 
-    def refresh_connections(self):
-        """Refresh the connections list."""
-        self.connections_tree.clear()
-        self.remote_manager.refresh_connections()
-        
-        for pc in self.remote_manager.get_connections():
-            item = QTreeWidgetItem([
-                pc.name,
-                pc.hostname,
-                pc.username,
-                "Connected" if pc.is_connected else "Disconnected"
-            ])
-            self.connections_tree.addTopLevelItem(item)
+    def refresh_connections(self, force=False):
+        """Refresh the connections list.
+        
+        Refreshes requested within a short interval of each other run once.
+        A forced refresh runs immediately.
+        
+        Args:
+            force: Re-test connections even if their status is recent
+        """
+        if force:
+            self._refresh_timer.stop()
+            self._do_refresh(force=True)
+        else:
+            self._refresh_timer.start()
+            
+    def _do_refresh(self, force=False):
+        """Start refreshing the connections list.
+        
+        Connection status is tested in a background thread. A refresh
+        requested while one is running is started once it finishes.
+        
+        Args:
+            force: Re-test connections even if their status is recent
+        """
+        if self.refresh_thread is not None and self.refresh_thread.isRunning():
+            self._refresh_pending = True
+            self._refresh_force = self._refresh_force or force
+            return
+            
+        self._refresh_pending = False
+        self._refresh_force = False
+        self.refresh_btn.setEnabled(False)
+        self.refresh_btn.setText("Refreshing...")
+        
+        self.refresh_thread = RefreshConnectionsThread(self.remote_manager, force)
+        self.refresh_thread.result_signal.connect(self._handle_refresh_result)
+        self.refresh_thread.finished.connect(self._handle_refresh_finished)
+        self.refresh_thread.start()
+        
+    def _handle_refresh_result(self, connections):
+        """Handle refreshed connection list."""
+        # Repaint once after all row changes instead of once per change
+        viewport = self.connections_tree.viewport()
+        viewport.setUpdatesEnabled(False)
+        try:
+            self.connections_model.set_connections(connections)
+        finally:
+            viewport.setUpdatesEnabled(True)
+        
+    def _handle_refresh_finished(self):
+        """Re-enable refreshing and run a refresh requested meanwhile."""
+        self.refresh_btn.setEnabled(True)
+        self.refresh_btn.setText("Refresh")
+        
+        if self._refresh_pending:
+            self._do_refresh(self._refresh_force)
             
     def ping_test(self):
         """Test ping to the specified hostname."""
         hostname = self.hostname_edit.text().strip()
         if not hostname:
-            QMessageBox.warning(self, "Warning", "Please enter a hostname")
+            self._show_message(QMessageBox.Icon.Warning, "Warning", "Please enter a hostname")
             return
             
         self.log_output.setHtml(f"<span style='color: blue;'>[RUNNING]</span> Pinging {hostname}...")
@@ -462,7 +733,7 @@ class ConnectionDialog(QDialog):
         password = self.password_edit.text()
         
         if not all([hostname, username, password]):
-            QMessageBox.warning(self, "Warning", "Please fill in hostname, username, and password")
+            self._show_message(QMessageBox.Icon.Warning, "Warning", "Please fill in hostname, username, and password")
             return
             
         self.log_output.setHtml(f"<span style='color: blue;'>[RUNNING]</span> Testing credentials for {username}@{hostname}...")
@@ -488,7 +759,7 @@ class ConnectionDialog(QDialog):
         """Test if WinRM is enabled on the remote PC."""
         hostname = self.hostname_edit.text().strip()
         if not hostname:
-            QMessageBox.warning(self, "Warning", "Please enter a hostname")
+            self._show_message(QMessageBox.Icon.Warning, "Warning", "Please enter a hostname")
             return
             
         self.log_output.setHtml(f"<span style='color: blue;'>[RUNNING]</span> Testing WinRM on {hostname}...")
@@ -517,21 +788,26 @@ class ConnectionDialog(QDialog):
         password = self.password_edit.text()
         
         if not all([hostname, username, password]):
-            QMessageBox.warning(self, "Warning", "Please fill in hostname, username, and password")
+            self._show_message(QMessageBox.Icon.Warning, "Warning", "Please fill in hostname, username, and password")
             return
         
         # Confirm action
-        reply = QMessageBox.question(
-            self,
+        self._ask(
             "Confirm Action",
             f"This will enable PowerShell Remoting on {hostname}.\n\nContinue?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            lambda: self._start_winrm_enable(hostname, username, password),
+            lambda: self.log_output.setHtml(
+                f"<span style='color: orange;'>[CANCELLED]</span> WinRM enablement cancelled by user")
         )
         
-        if reply != QMessageBox.StandardButton.Yes:
-            self.log_output.setHtml(f"<span style='color: orange;'>[CANCELLED]</span> WinRM enablement cancelled by user")
-            return
+    def _start_winrm_enable(self, hostname, username, password):
+        """Enable WinRM on a host after the user confirmed it.
         
+        Args:
+            hostname: Remote hostname
+            username: Username for authentication
+            password: Password for authentication
+        """
         # Disable button and update log
         self.enable_winrm_btn.setEnabled(False)
         self.enable_winrm_btn.setText("Enabling...")
@@ -560,10 +836,12 @@ class ConnectionDialog(QDialog):
             
     def connect_selected(self):
         """Connect to the selected PC(s) using background threads."""
-        selected_items = self.connections_tree.selectedItems()
-        if not selected_items:
-            QMessageBox.warning(self, "Warning", "Please select one or more PCs to connect to")
+        # The list is single selection, so the current row is the selection
+        current = self.connections_tree.currentIndex()
+        if not current.isValid():
+            self._show_message(QMessageBox.Icon.Warning, "Warning", "Please select a PC to connect to")
             return
+        names = [self.connections_model.name_at(self.connections_proxy.mapToSource(current).row())]
             
         # Disable the connect button while operations are in progress
         self.connect_btn.setEnabled(False)
@@ -572,15 +850,14 @@ class ConnectionDialog(QDialog):
         
         # Track results
         self.connect_results = []
-        self.connect_total = len(selected_items)
+        self.connect_total = len(names)
         self.connect_completed = 0
         self.connect_success = 0
         self.connect_fail = 0
         
         # Create and start a thread for each connection
         self.connect_threads = []
-        for item in selected_items:
-            name = item.text(0)  # First column is the name
+        for name in names:
             thread = ConnectThread(self.remote_manager, name)
             thread.result_signal.connect(self.handle_connect_result)
             self.connect_threads.append(thread)
@@ -588,10 +865,11 @@ class ConnectionDialog(QDialog):
         
     def disconnect_selected(self):
         """Disconnect from the selected PC(s) using background threads."""
-        selected_items = self.connections_tree.selectedItems()
-        if not selected_items:
-            QMessageBox.warning(self, "Warning", "Please select one or more PCs to disconnect from")
+        current = self.connections_tree.currentIndex()
+        if not current.isValid():
+            self._show_message(QMessageBox.Icon.Warning, "Warning", "Please select a PC to disconnect from")
             return
+        names = [self.connections_model.name_at(self.connections_proxy.mapToSource(current).row())]
             
         # Disable the disconnect button while operations are in progress
         self.disconnect_btn.setEnabled(False)
@@ -600,15 +878,14 @@ class ConnectionDialog(QDialog):
         
         # Track results
         self.disconnect_results = []
-        self.disconnect_total = len(selected_items)
+        self.disconnect_total = len(names)
         self.disconnect_completed = 0
         self.disconnect_success = 0
         self.disconnect_fail = 0
         
         # Create and start a thread for each disconnection
         self.disconnect_threads = []
-        for item in selected_items:
-            name = item.text(0)  # First column is the name
+        for name in names:
             # Check if this PC is the current connection
             current_conn = self.remote_manager.ps_remote.current_connection
             is_current = current_conn and current_conn.name == name
@@ -622,17 +899,11 @@ class ConnectionDialog(QDialog):
         """Handle the result of a connect operation."""
         self.connect_completed += 1
         
-        # Update the status in the tree widget
-        for i in range(self.connections_tree.topLevelItemCount()):
-            item = self.connections_tree.topLevelItem(i)
-            if item.text(0) == name:
-                if success:
-                    item.setText(3, "Connected")
-                    item.setForeground(3, QColor(0, 128, 0))  # Green
-                else:
-                    item.setText(3, "Failed to connect")
-                    item.setForeground(3, QColor(255, 0, 0))  # Red
-                break
+        # Update the status in the connections list
+        if success:
+            self.connections_model.set_status(name, "Connected", _STATUS_OK_COLOR)
+        else:
+            self.connections_model.set_status(name, "Failed to connect", _STATUS_ERROR_COLOR)
         
         if success:
             self.connect_success += 1
@@ -659,17 +930,11 @@ class ConnectionDialog(QDialog):
         """Handle the result of a disconnect operation."""
         self.disconnect_completed += 1
         
-        # Update the status in the tree widget
-        for i in range(self.connections_tree.topLevelItemCount()):
-            item = self.connections_tree.topLevelItem(i)
-            if item.text(0) == name:
-                if success:
-                    item.setText(3, "Disconnected")
-                    item.setForeground(3, QColor(128, 128, 128))  # Gray
-                else:
-                    item.setText(3, "Failed to disconnect")
-                    item.setForeground(3, QColor(255, 0, 0))  # Red
-                break
+        # Update the status in the connections list
+        if success:
+            self.connections_model.set_status(name, "Disconnected", _STATUS_IDLE_COLOR)
+        else:
+            self.connections_model.set_status(name, "Failed to disconnect", _STATUS_ERROR_COLOR)
         
         if success:
             self.disconnect_success += 1
@@ -84,9 +84,13 @@ class RemoteHandler:
         """Check if connected to remote system."""
         return self.remote_manager.is_connected()
         
-    def refresh_connections(self):
-        """Refresh the list of saved connections."""
-        return self.remote_manager.refresh_connections()
+    def refresh_connections(self, force=False):
+        """Refresh the list of saved connections.
+        
+        Args:
+            force: Test every connection even if the last refresh is recent
+        """
+        return self.remote_manager.refresh_connections(force)
         
     def get_connections(self):
         """Get list of saved connections.
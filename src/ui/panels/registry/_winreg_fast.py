@@ -0,0 +1,236 @@
+"""Registry enumeration through advapi32 with preallocated buffers.
+
+winreg.EnumKey and winreg.EnumValue size a fresh buffer for every call and
+signal the end of a key by raising an exception. The functions here query
+the subkey/value counts and the maximum data length once, then enumerate
+into buffers that are reused for every entry. Name buffers are sized for
+the longest name the registry allows and kept per thread.
+"""
+import ctypes
+import threading
+import winreg
+from ctypes import wintypes
+
+ERROR_SUCCESS = 0
+ERROR_MORE_DATA = 234
+ERROR_NO_MORE_ITEMS = 259
+
+# Longest key name and value name the registry allows, plus the terminator
+MAX_KEY_NAME = 256
+MAX_VALUE_NAME = 16384
+
+# Per-thread name buffers reused across enumerations
+_TLS = threading.local()
+
+_advapi32 = ctypes.WinDLL('advapi32')
+_LPDWORD = ctypes.POINTER(wintypes.DWORD)
+
+_RegQueryInfoKeyW = _advapi32.RegQueryInfoKeyW
+_RegQueryInfoKeyW.restype = wintypes.LONG
+_RegQueryInfoKeyW.argtypes = [
+    wintypes.HKEY, wintypes.LPWSTR, _LPDWORD, _LPDWORD,
+    _LPDWORD, _LPDWORD, _LPDWORD, _LPDWORD, _LPDWORD, _LPDWORD,
+    _LPDWORD, ctypes.POINTER(wintypes.FILETIME)
+]
+
+_RegEnumKeyExW = _advapi32.RegEnumKeyExW
+_RegEnumKeyExW.restype = wintypes.LONG
+_RegEnumKeyExW.argtypes = [
+    wintypes.HKEY, wintypes.DWORD, wintypes.LPWSTR, _LPDWORD, _LPDWORD,
+    wintypes.LPWSTR, _LPDWORD, ctypes.POINTER(wintypes.FILETIME)
+]
+
+_RegEnumValueW = _advapi32.RegEnumValueW
+_RegEnumValueW.restype = wintypes.LONG
+_RegEnumValueW.argtypes = [
+    wintypes.HKEY, wintypes.DWORD, wintypes.LPWSTR, _LPDWORD, _LPDWORD,
+    _LPDWORD, ctypes.c_void_p, _LPDWORD
+]
+
+
+def _get_name_buf(attr, size):
+    """Get this thread's reusable name buffer.
+    
+    Args:
+        attr: Attribute the buffer is stored under
+        size: Buffer size in characters
+    
+    Returns:
+        ctypes.Array: Unicode buffer
+    """
+    buf = getattr(_TLS, attr, None)
+    if buf is None:
+        buf = ctypes.create_unicode_buffer(size)
+        setattr(_TLS, attr, buf)
+    return buf
+
+
+def _hkey(key):
+    """Get the raw handle of a winreg key.
+    
+    Args:
+        key: winreg.HKEYType or integer handle
+    
+    Returns:
+        wintypes.HKEY: Raw handle
+    """
+    return wintypes.HKEY(int(key))
+
+
+def query_info(key):
+    """Query the counts and maximum lengths of a key.
+    
+    Args:
+        key: Open registry key
+    
+    Returns:
+        tuple: (subkey_count, max_subkey_len, value_count,
+                max_value_name_len, max_value_len)
+    
+    Raises:
+        OSError: If the query fails
+    """
+    subkeys = wintypes.DWORD()
+    max_subkey_len = wintypes.DWORD()
+    values = wintypes.DWORD()
+    max_value_name_len = wintypes.DWORD()
+    max_value_len = wintypes.DWORD()
+    rc = _RegQueryInfoKeyW(
+        _hkey(key), None, None, None,
+        ctypes.byref(subkeys), ctypes.byref(max_subkey_len), None,
+        ctypes.byref(values), ctypes.byref(max_value_name_len),
+        ctypes.byref(max_value_len), None, None
+    )
+    if rc != ERROR_SUCCESS:
+        raise ctypes.WinError(rc)
+    return (subkeys.value, max_subkey_len.value, values.value,
+            max_value_name_len.value, max_value_len.value)
+
+
+def enum_subkeys(key, start=0, limit=None):
+    """Enumerate the subkey names of an open key.
+    
+    Args:
+        key: Open registry key
+        start: Index of the first subkey to return
+        limit: Maximum number of names to return, or None for all
+    
+    Returns:
+        list: Subkey names
+    
+    Raises:
+        OSError: If the enumeration fails
+    """
+    count = query_info(key)[0]
+    if limit is not None:
+        count = min(count, start + limit)
+    hkey = _hkey(key)
+    buf = _get_name_buf('key_name_buf', MAX_KEY_NAME)
+    size = wintypes.DWORD()
+    
+    names = []
+    for i in range(start, count):
+        size.value = MAX_KEY_NAME
+        rc = _RegEnumKeyExW(hkey, i, buf, ctypes.byref(size), None, None, None, None)
+        if rc == ERROR_NO_MORE_ITEMS:
+            # Subkeys were removed while enumerating
+            break
+        if rc != ERROR_SUCCESS:
+            raise ctypes.WinError(rc)
+        names.append(buf[:size.value])
+    return names
+
+
+def _convert_data(data, reg_type):
+    """Convert raw value data the way winreg.EnumValue does.
+    
+    Args:
+        data: Raw data bytes
+        reg_type: Registry value type
+    
+    Returns:
+        Converted value
+    """
+    if reg_type in (winreg.REG_SZ, winreg.REG_EXPAND_SZ):
+        text = data.decode('utf-16-le', errors='replace')
+        return text.split('\0', 1)[0]
+    if reg_type == winreg.REG_MULTI_SZ:
+        text = data.decode('utf-16-le', errors='replace')
+        strings = []
+        for s in text.split('\0'):
+            if not s:
+                break
+            strings.append(s)
+        return strings
+    if reg_type == winreg.REG_DWORD:
+        return int.from_bytes(data[:4].ljust(4, b'\0'), 'little')
+    if reg_type == winreg.REG_QWORD:
+        return int.from_bytes(data[:8].ljust(8, b'\0'), 'little')
+    return data or None
+
+
+def enum_values(key, type_filter=None):
+    """Enumerate the values of an open key.
+    
+    When a type filter is given, each value's type is read first and the
+    data of values with other types is never fetched or decoded.
+    
+    Args:
+        key: Open registry key
+        type_filter: Set of value types to include, or None for all
+    
+    Returns:
+        list: (name, value, type) tuples, as returned by winreg.EnumValue
+    
+    Raises:
+        OSError: If the enumeration fails
+    """
+    _, _, count, _, max_data_len = query_info(key)
+    hkey = _hkey(key)
+    name_buf = _get_name_buf('value_name_buf', MAX_VALUE_NAME)
+    data_buf = ctypes.create_string_buffer(max(max_data_len, 1))
+    name_size = wintypes.DWORD()
+    data_size = wintypes.DWORD()
+    reg_type = wintypes.DWORD()
+    
+    values = []
+    i = 0
+    while i < count:
+        if type_filter is not None:
+            # Peek at the type without reading the data
+            name_size.value = MAX_VALUE_NAME
+            rc = _RegEnumValueW(
+                hkey, i, name_buf, ctypes.byref(name_size), None,
+                ctypes.byref(reg_type), None, None
+            )
+            if rc == ERROR_NO_MORE_ITEMS:
+                break
+            if rc != ERROR_SUCCESS:
+                raise ctypes.WinError(rc)
+            if reg_type.value not in type_filter:
+                i += 1
+                continue
+                
+        name_size.value = MAX_VALUE_NAME
+        data_size.value = len(data_buf)
+        rc = _RegEnumValueW(
+            hkey, i, name_buf, ctypes.byref(name_size), None,
+            ctypes.byref(reg_type), data_buf, ctypes.byref(data_size)
+        )
+        if rc == ERROR_NO_MORE_ITEMS:
+            # Values were removed while enumerating
+            break
+        if rc == ERROR_MORE_DATA:
+            # The value grew since the key was queried; retry with room for it
+            data_buf = ctypes.create_string_buffer(max(data_size.value, len(data_buf) * 2))
+            continue
+        if rc != ERROR_SUCCESS:
+            raise ctypes.WinError(rc)
+        if type_filter is None or reg_type.value in type_filter:
+            values.append((
+                name_buf[:name_size.value],
+                _convert_data(data_buf.raw[:data_size.value], reg_type.value),
+                reg_type.value
+            ))
+        i += 1
+    return values
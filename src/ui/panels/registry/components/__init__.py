@@ -4,8 +4,9 @@ from .add_button import AddButton
 from .edit_button import EditButton
 from .delete_button import DeleteButton
 from .refresh_button import RefreshButton
+from .import_button import ImportButton
 from .values_view import ValuesView
 from .dialog_factory import DialogFactory
 from .registry_operations import RegistryOperations
 
-__all__ = ['AddButton', 'EditButton', 'DeleteButton', 'RefreshButton', 'ButtonBar', 'ValuesView', 'DialogFactory', 'RegistryOperations']
+__all__ = ['AddButton', 'EditButton', 'DeleteButton', 'RefreshButton', 'ImportButton', 'ButtonBar', 'ValuesView', 'DialogFactory', 'RegistryOperations']
@@ -51,6 +51,7 @@ class AddButton(QPushButton):
                 winreg.CloseKey(key)
                 
                 # Refresh the values view to show the new value
+                self.panel.values_view.invalidate(path)
                 self.panel.values_view.load_values(path)
                 
                 self.logger.info(f"Added registry entry: {path}\\{name}")
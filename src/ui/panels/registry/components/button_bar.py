@@ -5,6 +5,7 @@ from .add_button import AddButton
 from .edit_button import EditButton
 from .delete_button import DeleteButton
 from .refresh_button import RefreshButton
+from .import_button import ImportButton
 
 class ButtonBar(QWidget):
     """Button bar containing all action buttons for registry panel."""
@@ -36,6 +37,9 @@ class ButtonBar(QWidget):
         self.delete_button = DeleteButton(self.panel)
         layout.addWidget(self.delete_button)
         
+        self.import_button = ImportButton(self.panel)
+        layout.addWidget(self.import_button)
+        
         self.refresh_button = RefreshButton(self.panel)
         layout.addWidget(self.refresh_button)
         
@@ -44,6 +48,7 @@ class ButtonBar(QWidget):
         self.add_button.connect_signals()
         self.edit_button.connect_signals()
         self.delete_button.connect_signals()
+        self.import_button.connect_signals()
         self.refresh_button.connect_signals()
         
     def update_button_states(self, has_selection=False):
@@ -1,7 +1,6 @@
 """Delete registry entry button component."""
 import winreg
 from PyQt6.QtWidgets import QPushButton, QMessageBox, QTreeWidgetItem
-from PyQt6.QtCore import Qt
 from src.core.logger import setup_logger
 
 class DeleteButton(QPushButton):
@@ -60,6 +59,7 @@ class DeleteButton(QPushButton):
                     self._delete_registry_value(path, name)
                     self.logger.info(f"Deleted registry value: {path}\\{name}")
                     # Refresh the values view
+                    self.panel.values_view.invalidate(path)
                     self.panel.values_view.load_values(path)
                 else:
                     # Delete a key
@@ -68,10 +68,11 @@ class DeleteButton(QPushButton):
                     
                     # Refresh the tree
                     parent_path = self._get_parent_path(path)
+                    self.panel.values_view.invalidate(path)
                     if parent_path:
+                        self.panel.tree.registry_model.invalidate(parent_path)
                         # Select the parent key
-                        for i in range(self.panel.tree.topLevelItemCount()):
-                            self._find_and_select_key(self.panel.tree.topLevelItem(i), parent_path)
+                        self.panel.tree.select_path(parent_path)
                     else:
                         # This was a root key, just refresh everything
                         self.panel.refresh_entries()
@@ -153,28 +154,3 @@ class DeleteButton(QPushButton):
         else:
             # Nested key
             return f"{root_key_name}\\{subkey[:last_backslash]}"
-    
-    def _find_and_select_key(self, item, path):
-        """Find a registry key item by path and select it.
-        
-        Args:
-            item: QTreeWidgetItem to start search from
-            path: Registry path to find
-            
-        Returns:
-            bool: True if found and selected, False otherwise
-        """
-        # Check if this is the item we're looking for
-        item_path = item.data(0, Qt.ItemDataRole.UserRole)
-        if item_path == path:
-            # Found it, select it
-            self.panel.tree.setCurrentItem(item)
-            return True
-            
-        # Check children recursively
-        for i in range(item.childCount()):
-            child = item.child(i)
-            if self._find_and_select_key(child, path):
-                return True
-                    
-        return False
@@ -75,6 +75,8 @@ class EditButton(QPushButton):
                 winreg.CloseKey(key)
                 
                 # Refresh the values view to show the updated value
+                self.panel.values_view.invalidate(path)
+                self.panel.values_view.invalidate(new_path)
                 if path != new_path:
                     # Path changed, need to refresh the new path
                     self.panel.values_view.load_values(new_path)
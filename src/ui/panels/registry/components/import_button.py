@@ -0,0 +1,119 @@
+"""Import .reg file button component."""
+from PyQt6.QtWidgets import QPushButton, QFileDialog, QMessageBox
+from PyQt6.QtCore import QThread, pyqtSignal
+from src.core.logger import setup_logger
+from ..reg_file import parse_reg_file
+from .registry_operations import RegistryOperations
+
+class RegImportWorker(QThread):
+    """Worker thread for parsing and applying a .reg file in the background."""
+    
+    import_finished = pyqtSignal(int, list)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, registry_ops, file_path, parent=None):
+        super().__init__(parent)
+        self.registry_ops = registry_ops
+        self.file_path = file_path
+        
+    def run(self):
+        """Parse the file and apply it in one transaction in background thread."""
+        try:
+            operations, skipped_keys = parse_reg_file(self.file_path)
+            count = self.registry_ops.batch_apply(operations)
+            self.import_finished.emit(count, skipped_keys)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+class ImportButton(QPushButton):
+    """Button for importing a .reg file in a single registry transaction."""
+    
+    def __init__(self, parent=None):
+        """Initialize import button.
+        
+        Args:
+            parent: Parent widget (RegistryPanel)
+        """
+        super().__init__("Import .reg", parent)
+        self.logger = setup_logger(self.__class__.__name__)
+        self.panel = parent
+        self.worker = None
+        
+    def connect_signals(self):
+        """Connect button signals."""
+        self.clicked.connect(self.on_clicked)
+        
+    def on_clicked(self):
+        """Handle button click event."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self.panel,
+            "Import Registry File",
+            "",
+            "Registry Files (*.reg);;All Files (*.*)"
+        )
+        if not file_path:
+            return
+            
+        # Don't start a second import while one is running
+        if self.worker and self.worker.isRunning():
+            self.logger.warning("A registry file is already being imported")
+            return
+            
+        # The worker gets its own operations object, so refreshes on the GUI
+        # thread never touch its caches
+        self.worker = RegImportWorker(RegistryOperations(self.panel), file_path, self)
+        self.worker.import_finished.connect(
+            lambda count, skipped_keys: self.on_import_finished(file_path, count, skipped_keys)
+        )
+        self.worker.error_occurred.connect(
+            lambda error_msg: self.on_import_error(file_path, error_msg)
+        )
+        self.worker.finished.connect(self.on_worker_finished)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.setEnabled(False)
+        self.worker.start()
+        
+    def on_worker_finished(self):
+        """Release the finished worker and allow the next import."""
+        self.worker = None
+        self.setEnabled(True)
+        
+    def on_import_finished(self, file_path, count, skipped_keys):
+        """Report a completed import and show the imported values.
+        
+        Args:
+            file_path: Path of the imported file
+            count: Number of values set or deleted
+            skipped_keys: Key deletions that were not applied
+        """
+        self.logger.info(f"Imported {count} registry entries from {file_path}")
+        message = f"Imported {count} registry entries."
+        if skipped_keys:
+            self.logger.warning(f"Skipped {len(skipped_keys)} key deletions in {file_path}")
+            message += f"\n\nSkipped {len(skipped_keys)} key deletion(s):\n" + "\n".join(skipped_keys)
+        QMessageBox.information(self.panel, "Import Complete", message)
+        
+        # Show the imported values
+        self.panel.refresh_entries()
+        path = self.panel.tree.get_selected_key_path()
+        if path:
+            self.panel.values_view.load_values(path)
+            
+    def on_import_error(self, file_path, error_msg):
+        """Report a failed import.
+        
+        Args:
+            file_path: Path of the file that failed to import
+            error_msg: Error message
+        """
+        self.logger.error(f"Failed to import registry file {file_path}: {error_msg}")
+        QMessageBox.critical(
+            self.panel,
+            "Error",
+            f"Failed to import registry file. No changes were made.\n\n{error_msg}"
+        )
+        
+    def wait_for_worker(self):
+        """Block until a running import has finished."""
+        if self.worker and self.worker.isRunning():
+            self.worker.wait()
@@ -1,6 +1,8 @@
 """Registry operations component."""
 import winreg
 from src.core.logger import setup_logger
+from src.ui.panels.registry.manager import RegistryManager
+from src.ui.panels.registry import transaction
 
 class RegistryOperations:
     """Encapsulates registry operations for the Registry Panel."""
@@ -14,6 +16,9 @@ class RegistryOperations:
         'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG
     }
     
+    # Registry value type names
+    VALUE_TYPES = RegistryManager.VALUE_TYPES
+    
     def __init__(self, panel):
         """Initialize registry operations.
         
@@ -23,6 +28,9 @@ class RegistryOperations:
         self.panel = panel
         self.logger = setup_logger(self.__class__.__name__)
         
+        # Key existence results, kept until the next refresh
+        self._key_exists_cache = {}
+        
     @property
     def tree(self):
         """Get registry tree widget."""
@@ -41,11 +49,11 @@ class RegistryOperations:
     def add_entry(self):
         """Add a new registry entry."""
         # Get the currently selected key path
-        if not self.tree or not self.tree.currentItem():
+        if not self.tree or not self.tree.has_selection():
             self.dialog_factory.show_warning("Please select a registry key first")
             return
             
-        path = self.tree.get_selected_path()
+        path = self.tree.get_selected_key_path()
         if not path:
             self.dialog_factory.show_warning("Please select a registry key first")
             return
@@ -69,8 +77,11 @@ class RegistryOperations:
                 self._set_registry_value(key, name, reg_type, value)
                 winreg.CloseKey(key)
                 
-                # Refresh values view
-                self.refresh_values(path)
+                # Show the new value without re-enumerating the key
+                self.values_view.invalidate(path)
+                self.values_view.update_value(
+                    path, name, value, RegistryManager.NAME_TO_TYPE.get(reg_type, winreg.REG_SZ)
+                )
                 self.logger.info(f"Added registry value: {name} to {path}")
             except Exception as e:
                 self.logger.error(f"Error adding registry value: {str(e)}")
@@ -85,9 +96,9 @@ class RegistryOperations:
             
         item = self.values_view.currentItem()
         name = item.text(0)
-        value = item.text(1)
-        reg_type = item.text(2)
-        path = self.tree.get_selected_path()
+        reg_type = item.text(1)
+        value = item.text(2)
+        path = self.tree.get_selected_key_path()
         
         # Create and show dialog
         dialog = self.dialog_factory.create_add_value_dialog(name, value, reg_type)
@@ -105,15 +116,23 @@ class RegistryOperations:
                     winreg.KEY_SET_VALUE
                 )
                 
-                # If name changed, delete old value and create new one
-                if name != new_name:
-                    self._delete_registry_value(path, name)
+                try:
+                    # If name changed, delete old value and create new one
+                    if name != new_name:
+                        winreg.DeleteValue(key, name)
+                        
+                    self._set_registry_value(key, new_name, new_reg_type, new_value)
+                finally:
+                    winreg.CloseKey(key)
                 
-                self._set_registry_value(key, new_name, new_reg_type, new_value)
-                winreg.CloseKey(key)
-                
-                # Refresh values view
-                self.refresh_values(path)
+                # Update the edited row without re-enumerating the key
+                self.values_view.invalidate(path)
+                if name != new_name:
+                    self.values_view.remove_value(path, name)
+                self.values_view.update_value(
+                    path, new_name, new_value,
+                    RegistryManager.NAME_TO_TYPE.get(new_reg_type, winreg.REG_SZ)
+                )
                 self.logger.info(f"Updated registry value: {new_name} in {path}")
             except Exception as e:
                 self.logger.error(f"Error updating registry value: {str(e)}")
@@ -128,7 +147,7 @@ class RegistryOperations:
             
         item = self.values_view.currentItem()
         name = item.text(0)
-        path = self.tree.get_selected_path()
+        path = self.tree.get_selected_key_path()
         
         # Confirm deletion
         if self.dialog_factory.confirm_delete(name, "Registry Value"):
@@ -136,8 +155,9 @@ class RegistryOperations:
                 # Delete registry value
                 self._delete_registry_value(path, name)
                 
-                # Refresh values view
-                self.refresh_values(path)
+                # Drop the deleted row without re-enumerating the key
+                self.values_view.invalidate(path)
+                self.values_view.remove_value(path, name)
                 self.logger.info(f"Deleted registry value: {name} from {path}")
             except Exception as e:
                 self.logger.error(f"Error deleting registry value: {str(e)}")
@@ -145,9 +165,15 @@ class RegistryOperations:
     
     def refresh_entries(self):
         """Refresh registry entries list."""
+        self._key_exists_cache.clear()
         if self.tree:
-            self.tree.clear_entries()
-            self.logger.info("Registry entries refreshed successfully")
+            self.tree.begin_bulk_update()
+            try:
+                self.tree.clear_entries()
+            finally:
+                self.tree.end_bulk_update()
+            # The selection was cleared while signals were blocked
+            self.panel.update_button_states()
     
     def refresh_values(self, path):
         """Refresh registry values for the selected key.
@@ -158,6 +184,73 @@ class RegistryOperations:
         if self.values_view:
             self.values_view.load_values(path)
     
+    def key_exists(self, path):
+        """Check whether a registry key exists.
+        
+        Results are cached until the next refresh_entries call.
+        
+        Args:
+            path: Registry key path
+            
+        Returns:
+            bool: True if the key exists
+        """
+        exists = self._key_exists_cache.get(path)
+        if exists is None:
+            try:
+                root_key_name, subkey = self._split_path(path)
+                winreg.CloseKey(
+                    winreg.OpenKey(self.ROOT_KEYS[root_key_name], subkey, 0, winreg.KEY_READ)
+                )
+                exists = True
+            except (OSError, ValueError):
+                exists = False
+            self._key_exists_cache[path] = exists
+        return exists
+        
+    def get_registry_values(self, path):
+        """Get all values of a registry key.
+        
+        The key is opened once and its values are enumerated in a single
+        pass sized by QueryInfoKey.
+        
+        Args:
+            path: Registry key path
+            
+        Returns:
+            list: Value dictionaries with name, type and value
+        """
+        try:
+            root_key_name, subkey = self._split_path(path)
+            key = winreg.OpenKey(self.ROOT_KEYS[root_key_name], subkey, 0, winreg.KEY_READ)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Failed to open registry key {path}: {str(e)}")
+            return []
+            
+        try:
+            _, count, _ = winreg.QueryInfoKey(key)
+            values = [None] * count
+            found = 0
+            for i in range(count):
+                try:
+                    name, value, reg_type = winreg.EnumValue(key, i)
+                except OSError:
+                    # Value removed while enumerating
+                    continue
+                values[found] = {
+                    'name': name,
+                    'type': self.VALUE_TYPES.get(reg_type, f'Unknown ({reg_type})'),
+                    'value': value
+                }
+                found += 1
+            del values[found:]
+            return values
+        except OSError as e:
+            self.logger.error(f"Failed to enumerate registry values of {path}: {str(e)}")
+            return []
+        finally:
+            winreg.CloseKey(key)
+    
     def _split_path(self, path):
         """Split registry path into root key and subkey.
         
@@ -170,13 +263,16 @@ class RegistryOperations:
         Raises:
             ValueError: If path format is invalid
         """
-        parts = path.split('\\', 1)
-        if len(parts) != 2 or parts[0] not in self.ROOT_KEYS:
+        if path in self.ROOT_KEYS:
+            return path, ""
+            
+        root_key_name, sep, subkey = path.partition('\\')
+        if not sep or root_key_name not in self.ROOT_KEYS:
             raise ValueError(
                 f"Invalid registry path. Must start with one of: "
                 f"{', '.join(self.ROOT_KEYS.keys())}"
             )
-        return parts[0], parts[1]
+        return root_key_name, subkey
         
     def _set_registry_value(self, key, name, reg_type, value):
         """Set registry value with proper type conversion.
@@ -185,22 +281,26 @@ class RegistryOperations:
             key: Registry key handle
             name: Value name
             reg_type: Registry value type
-            value: String value to convert and set
+            value: String or already-converted value to set
         """
         if reg_type == 'REG_DWORD':
-            value = int(value, 0)
+            if isinstance(value, str):
+                value = int(value, 0)
             winreg.SetValueEx(key, name, 0, winreg.REG_DWORD, value)
             
         elif reg_type == 'REG_QWORD':
-            value = int(value, 0)
+            if isinstance(value, str):
+                value = int(value, 0)
             winreg.SetValueEx(key, name, 0, winreg.REG_QWORD, value)
             
         elif reg_type == 'REG_BINARY':
-            value = bytes.fromhex(value.replace(' ', ''))
+            if isinstance(value, str):
+                value = bytes.fromhex(value)
             winreg.SetValueEx(key, name, 0, winreg.REG_BINARY, value)
             
         elif reg_type == 'REG_MULTI_SZ':
-            value = value.split(';')
+            if isinstance(value, str):
+                value = value.split(';')
             winreg.SetValueEx(key, name, 0, winreg.REG_MULTI_SZ, value)
             
         elif reg_type == 'REG_EXPAND_SZ':
@@ -209,6 +309,64 @@ class RegistryOperations:
         else:  # REG_SZ
             winreg.SetValueEx(key, name, 0, winreg.REG_SZ, value)
             
+    def set_registry_values_bulk(self, path, entries):
+        """Set several registry values under one key.
+        
+        The key is created or opened once for the whole batch.
+        
+        Args:
+            path: Registry key path
+            entries: List of (name, reg_type, value) tuples
+            
+        Returns:
+            int: Number of values written
+            
+        Raises:
+            ValueError: If the path is invalid
+            OSError: If the key cannot be created or opened
+        """
+        root_key_name, subkey = self._split_path(path)
+        key = winreg.CreateKey(self.ROOT_KEYS[root_key_name], subkey)
+        self._key_exists_cache[path] = True
+        
+        written = 0
+        try:
+            for name, reg_type, value in entries:
+                try:
+                    self._set_registry_value(key, name, reg_type, value)
+                    written += 1
+                except (OSError, ValueError, TypeError) as e:
+                    self.logger.warning(f"Failed to set registry value {path}\\{name}: {str(e)}")
+        finally:
+            winreg.CloseKey(key)
+            
+        return written
+        
+    def batch_apply(self, operations):
+        """Apply registry writes atomically in a single transaction.
+        
+        Args:
+            operations: List of (path, name, reg_type, value) tuples, where
+                reg_type is a type constant, a name of None only creates the
+                key and a value of None deletes the named value
+                
+        Returns:
+            int: Number of values set or deleted
+            
+        Raises:
+            ValueError: If a path is invalid
+            OSError: If any write fails; no changes are kept in that case
+        """
+        ops = []
+        for path, name, reg_type, value in operations:
+            root_key_name, subkey = self._split_path(path)
+            ops.append((self.ROOT_KEYS[root_key_name], subkey, name, reg_type, value))
+            
+        count = transaction.batch_apply(ops)
+        for path, _, _, _ in operations:
+            self._key_exists_cache[path] = True
+        return count
+        
     def _delete_registry_value(self, path, name):
         """Delete registry value.
         
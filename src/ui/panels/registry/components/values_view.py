@@ -1,8 +1,122 @@
 """Registry values view component."""
 import winreg
+from functools import lru_cache
 from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QHeaderView
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from src.core.logger import setup_logger
+from src.ui.panels.registry import _winreg_fast
+from src.ui.panels.registry.enum_cache import EnumerationCache
+from src.ui.panels.registry.manager import RegistryManager
+
+# Map root key name to handle
+ROOT_KEYS = {
+    'HKEY_LOCAL_MACHINE': winreg.HKEY_LOCAL_MACHINE,
+    'HKEY_CURRENT_USER': winreg.HKEY_CURRENT_USER,
+    'HKEY_CLASSES_ROOT': winreg.HKEY_CLASSES_ROOT,
+    'HKEY_USERS': winreg.HKEY_USERS,
+    'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG
+}
+
+# Map value type constant to display name
+VALUE_TYPE_NAMES = RegistryManager.VALUE_TYPES
+
+
+@lru_cache(maxsize=2048)
+def _format_number(value, reg_type):
+    """Format a DWORD or QWORD value, memoized for repeated values.
+    
+    Args:
+        value: Integer value
+        reg_type: Registry value type
+        
+    Returns:
+        str: Formatted value
+    """
+    if reg_type == winreg.REG_DWORD:
+        return f"0x{value:08x}"
+    if reg_type == winreg.REG_QWORD:
+        return f"0x{value:016x}"
+    return str(value)
+
+
+def format_registry_value(value, reg_type):
+    """Format registry value for display based on type.
+    
+    Args:
+        value: Registry value
+        reg_type: Registry value type
+        
+    Returns:
+        Formatted string representation of value
+    """
+    if isinstance(value, int):
+        return _format_number(value, reg_type)
+    if reg_type == winreg.REG_BINARY:
+        return bytes(value or b'').hex(' ')
+    elif reg_type == winreg.REG_MULTI_SZ:
+        return ';'.join(value)
+    else:
+        return str(value)
+
+
+class ValueItem(QTreeWidgetItem):
+    """Registry value row that formats its value column on demand."""
+    
+    def __init__(self, name, type_name, value, reg_type):
+        """Initialize value item.
+        
+        Args:
+            name: Display name of the value
+            type_name: Registry type name
+            value: Raw registry value
+            reg_type: Registry value type
+        """
+        super().__init__([name, type_name])
+        self.raw_value = value
+        self.reg_type = reg_type
+        self._value_text = None
+        
+    def data(self, column, role):
+        """Get item data, formatting the value column on first use."""
+        if column == 2 and role == Qt.ItemDataRole.DisplayRole:
+            if self._value_text is None:
+                self._value_text = format_registry_value(self.raw_value, self.reg_type)
+            return self._value_text
+        return super().data(column, role)
+
+
+class ValueLoadWorker(QThread):
+    """Worker thread for enumerating registry values in the background."""
+    
+    values_loaded = pyqtSignal(list)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, path, type_filter=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.type_filter = type_filter
+        
+    def run(self):
+        """Enumerate values in background thread."""
+        try:
+            # Split path into root key and subkey
+            root_key_name, _, subkey = self.path.partition('\\')
+            
+            if root_key_name not in ROOT_KEYS:
+                raise ValueError(f"Invalid root key: {root_key_name}")
+                
+            # Open the key
+            key = winreg.OpenKey(ROOT_KEYS[root_key_name], subkey, 0, winreg.KEY_READ)
+            
+            # Enumerate values
+            try:
+                values = _winreg_fast.enum_values(key, self.type_filter)
+            finally:
+                winreg.CloseKey(key)
+                
+            self.values_loaded.emit(values)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
 
 class ValuesView(QTreeWidget):
     """Tree widget for displaying registry values."""
@@ -15,6 +129,23 @@ class ValuesView(QTreeWidget):
         """
         super().__init__(parent)
         self.logger = setup_logger(self.__class__.__name__)
+        
+        # Path of the loaded key and its value items keyed by (path, name)
+        self._path = None
+        self._index = {}
+        
+        # Config item ids ("registry:<path>\\<name>") to highlight on load
+        self.imported_keys = frozenset()
+        
+        # Running value workers; only the latest load request is shown
+        self._workers = set()
+        self._load_id = 0
+        
+        # Recently enumerated values keyed by registry path
+        self._enum_cache = EnumerationCache()
+        
+        # Value types to show, or None for all types
+        self.type_filter = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -35,10 +166,70 @@ class ValuesView(QTreeWidget):
         # Enable selection of items
         self.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
         
+    def clear(self):
+        """Remove all values from the view."""
+        super().clear()
+        self._index.clear()
+        
     def clear_values(self):
         """Clear all values from the view."""
         self.clear()
         
+    def find_entry(self, path, name):
+        """Find the item showing a registry value.
+        
+        Args:
+            path: Registry key path
+            name: Value name
+            
+        Returns:
+            QTreeWidgetItem or None if the value is not shown
+        """
+        return self._index.get((path, name))
+        
+    def update_value(self, path, name, value, reg_type):
+        """Show a written registry value without reloading the key.
+        
+        Updates the row of an existing value in place, or appends a row for a
+        new one. Nothing happens if path is not the key being shown.
+        
+        Args:
+            path: Registry key path
+            name: Value name
+            value: Value as written to the registry
+            reg_type: Registry value type constant
+        """
+        if path != self._path:
+            return
+            
+        type_name = VALUE_TYPE_NAMES.get(reg_type, f'Unknown ({reg_type})')
+        item = self._index.get((path, name))
+        if isinstance(item, ValueItem):
+            item.raw_value = value
+            item.reg_type = reg_type
+            item._value_text = None
+            item.setText(1, type_name)
+            item.emitDataChanged()
+            return
+            
+        if item is not None:
+            self.remove_value(path, name)
+        item = ValueItem(name if name else "(Default)", type_name, value, reg_type)
+        item.setData(0, Qt.ItemDataRole.UserRole, f"registry:{path}\\{name}")
+        self.addTopLevelItem(item)
+        self._index[(path, name)] = item
+        
+    def remove_value(self, path, name):
+        """Remove the row of a deleted registry value.
+        
+        Args:
+            path: Registry key path
+            name: Value name
+        """
+        item = self._index.pop((path, name), None)
+        if item is not None:
+            self.takeTopLevelItem(self.indexOfTopLevelItem(item))
+            
     def load_values(self, path):
         """Load registry values for a given key.
         
@@ -46,83 +237,160 @@ class ValuesView(QTreeWidget):
             path: Registry path to load values from
         """
         self.clear()
+        self._path = path
+        self._load_id += 1
         
         if not path:
             return
             
-        try:
-            # Split path into root key and subkey
-            parts = path.split('\\', 1)
-            if len(parts) == 1:
-                root_key_name = parts[0]
-                subkey = ""
-            else:
-                root_key_name, subkey = parts
-                
-            # Map root key name to handle
-            root_keys = {
-                'HKEY_LOCAL_MACHINE': winreg.HKEY_LOCAL_MACHINE,
-                'HKEY_CURRENT_USER': winreg.HKEY_CURRENT_USER,
-                'HKEY_CLASSES_ROOT': winreg.HKEY_CLASSES_ROOT,
-                'HKEY_USERS': winreg.HKEY_USERS,
-                'HKEY_CURRENT_CONFIG': winreg.HKEY_CURRENT_CONFIG
-            }
-            
-            if root_key_name not in root_keys:
-                self.logger.error(f"Invalid root key: {root_key_name}")
-                return
-                
-            root_key = root_keys[root_key_name]
+        load_id = self._load_id
+        values = self._enum_cache.get(path)
+        if values is not None:
+            self._on_values_loaded(load_id, path, values)
+            return
             
-            # Open the key
-            key = winreg.OpenKey(root_key, subkey, 0, winreg.KEY_READ)
+        # Parented to the view and deleted by Qt once the thread has stopped
+        worker = ValueLoadWorker(path, self.type_filter, self)
+        worker.values_loaded.connect(
+            lambda values: self._on_values_loaded(load_id, path, values)
+        )
+        worker.error_occurred.connect(
+            lambda error_msg: self._on_load_error(load_id, path, error_msg)
+        )
+        worker.finished.connect(lambda: self._workers.discard(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._workers.add(worker)
+        worker.start()
+        
+    def _on_values_loaded(self, load_id, path, values):
+        """Show values enumerated by a ValueLoadWorker.
+        
+        Args:
+            load_id: Load request the values belong to
+            path: Registry key path
+            values: List of (name, value, type) tuples
+        """
+        if load_id != self._load_id:
+            return
             
-            # Enumerate values
-            try:
-                i = 0
-                while True:
-                    name, value, reg_type = winreg.EnumValue(key, i)
-                    # Format value for display
-                    value_str = self._format_registry_value(value, reg_type)
-                    reg_type_str = self._get_reg_type_name(reg_type)
-                    
-                    # Create value item
-                    value_item = QTreeWidgetItem([name if name else "(Default)", reg_type_str, value_str])
-                    self.addTopLevelItem(value_item)
-                    
-                    i += 1
-            except WindowsError:
-                # No more values
-                pass
+        # Filtered enumerations are incomplete, so only full ones are cached
+        type_filter = self.type_filter
+        if type_filter is None:
+            self._enum_cache.put(path, values)
+            
+        items = []
+        type_names = VALUE_TYPE_NAMES
+        for name, value, reg_type in values:
+            if type_filter is not None and reg_type not in type_filter:
+                continue
                 
-            winreg.CloseKey(key)
+            # The value column is formatted when it is first displayed
+            value_item = ValueItem(
+                name if name else "(Default)",
+                type_names.get(reg_type, f'Unknown ({reg_type})'),
+                value,
+                reg_type
+            )
+            item_key = f"registry:{path}\\{name}"
+            value_item.setData(0, Qt.ItemDataRole.UserRole, item_key)
+            if item_key in self.imported_keys:
+                self._apply_highlight(value_item)
+            items.append(value_item)
+            self._index[(path, name)] = value_item
             
-        except Exception as e:
-            self.logger.warning(f"Failed to load registry values for {path}: {str(e)}")
-            error_item = QTreeWidgetItem([f"Error: {str(e)}", "", ""])
-            self.addTopLevelItem(error_item)
+        # Insert all rows in one batch with a single repaint
+        sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        self.setUpdatesEnabled(False)
+        try:
+            self.addTopLevelItems(items)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.setSortingEnabled(sorting)
             
-    def _format_registry_value(self, value, reg_type):
-        """Format registry value for display based on type.
+    def set_type_filter(self, type_filter):
+        """Show only values of the given types and reload the current key.
         
         Args:
-            value: Registry value
-            reg_type: Registry value type
+            type_filter: Set of value types to show, or None for all types
+        """
+        self.type_filter = frozenset(type_filter) if type_filter is not None else None
+        if self._path:
+            self.load_values(self._path)
             
-        Returns:
-            Formatted string representation of value
+    def invalidate(self, path=None):
+        """Drop cached values so the next load reads the registry.
+        
+        Call this after adding, changing or deleting a value of path.
+        
+        Args:
+            path: Registry key path, or None to drop every cached key
         """
-        if reg_type == winreg.REG_BINARY:
-            return ' '.join(f'{b:02x}' for b in value)
-        elif reg_type == winreg.REG_MULTI_SZ:
-            return ';'.join(value)
-        elif reg_type == winreg.REG_DWORD:
-            return f"0x{value:08x}"
-        elif reg_type == winreg.REG_QWORD:
-            return f"0x{value:016x}"
+        if path is None:
+            self._enum_cache.clear()
         else:
-            return str(value)
-    
+            self._enum_cache.invalidate(path)
+            
+    def _on_load_error(self, load_id, path, error_msg):
+        """Show an error raised by a ValueLoadWorker.
+        
+        Args:
+            load_id: Load request the error belongs to
+            path: Registry key path
+            error_msg: Error message
+        """
+        if load_id != self._load_id:
+            return
+            
+        self.logger.warning(f"Failed to load registry values for {path}: {error_msg}")
+        error_item = QTreeWidgetItem([f"Error: {error_msg}", "", ""])
+        self.addTopLevelItem(error_item)
+        
+    def wait_for_workers(self):
+        """Block until all running value workers have finished."""
+        for worker in list(self._workers):
+            worker.wait()
+            
+    def highlight(self, path, name):
+        """Highlight a displayed registry value as imported from configuration.
+        
+        Args:
+            path: Registry key path
+            name: Value name
+            
+        Returns:
+            bool: True if the value is shown and was highlighted
+        """
+        item = self.find_entry(path, name)
+        if item is None:
+            return False
+            
+        self._apply_highlight(item)
+        return True
+        
+    def _apply_highlight(self, item):
+        """Apply imported-item styling to every column of an item.
+        
+        For an item already in the view, the per-column changes are
+        reported to the view as a single dataChanged notification.
+        
+        Args:
+            item: QTreeWidgetItem to style
+        """
+        in_view = item.treeWidget() is not None
+        if in_view:
+            self.model().blockSignals(True)
+        try:
+            for col in range(3):
+                item.setBackground(col, Qt.GlobalColor.cyan)
+                item.setForeground(col, Qt.GlobalColor.darkBlue)
+                item.setFont(col, self.font())
+                item.setToolTip(col, "Imported from configuration file")
+        finally:
+            if in_view:
+                self.model().blockSignals(False)
+                item.emitDataChanged()
+            
     def add_virtual_value(self, name, value, reg_type):
         """Add a virtual registry value that doesn't exist in the system yet.
         
@@ -148,7 +416,7 @@ class ValuesView(QTreeWidget):
             elif isinstance(value, list) and reg_type == 'REG_MULTI_SZ':
                 value_str = ';'.join(value)
             elif isinstance(value, bytes) and reg_type == 'REG_BINARY':
-                value_str = ' '.join(f'{b:02x}' for b in value)
+                value_str = value.hex(' ')
             else:
                 value_str = str(value)
             
@@ -156,35 +424,12 @@ class ValuesView(QTreeWidget):
             item = QTreeWidgetItem([name if name else "(Default)", reg_type, value_str])
             
             # Apply special styling for imported items
-            for col in range(3):
-                item.setBackground(col, Qt.GlobalColor.cyan)
-                item.setForeground(col, Qt.GlobalColor.darkBlue)
-                item.setFont(col, self.font())
-                item.setToolTip(col, "Imported from configuration file")
+            self._apply_highlight(item)
                 
             self.addTopLevelItem(item)
+            self._index[(self._path, name)] = item
             return item
             
         except Exception as e:
             self.logger.error(f"Error adding virtual registry value: {str(e)}")
             return None
-    
-    def _get_reg_type_name(self, reg_type):
-        """Get registry type name from type value.
-        
-        Args:
-            reg_type: Registry type value
-            
-        Returns:
-            Registry type name
-        """
-        type_map = {
-            winreg.REG_SZ: 'REG_SZ',
-            winreg.REG_EXPAND_SZ: 'REG_EXPAND_SZ',
-            winreg.REG_BINARY: 'REG_BINARY',
-            winreg.REG_DWORD: 'REG_DWORD',
-            winreg.REG_QWORD: 'REG_QWORD',
-            winreg.REG_MULTI_SZ: 'REG_MULTI_SZ',
-            winreg.REG_NONE: 'REG_NONE'
-        }
-        return type_map.get(reg_type, f'Unknown ({reg_type})')
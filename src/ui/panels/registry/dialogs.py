@@ -1,20 +1,89 @@
 """Dialogs for registry management."""
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                           QLineEdit, QComboBox, QPushButton, QMessageBox)
+from PyQt6.QtCore import QStringListModel
 from src.core.logger import setup_logger
 
+# Registry value types
+_REG_TYPES = (
+    'REG_SZ',
+    'REG_EXPAND_SZ',
+    'REG_MULTI_SZ',
+    'REG_DWORD',
+    'REG_QWORD',
+    'REG_BINARY'
+)
+
+# Type list model shared by every dialog's type selector, built on first use
+_reg_types_model = None
+
+
+def _get_reg_types_model():
+    """Get the shared registry type list model.
+    
+    Returns:
+        QStringListModel: Model containing the registry value types
+    """
+    global _reg_types_model
+    if _reg_types_model is None:
+        _reg_types_model = QStringListModel(list(_REG_TYPES))
+    return _reg_types_model
+
+
+def _validate_reg_value(value, reg_type):
+    """Validate registry value based on type.
+    
+    Args:
+        value: Value to validate
+        reg_type: Registry value type
+        
+    Returns:
+        The value converted to its native type (int, bytes, list or str)
+        
+    Raises:
+        ValueError: If value is invalid for type
+    """
+    if not value:
+        raise ValueError("Value cannot be empty.")
+        
+    try:
+        if reg_type == 'REG_DWORD':
+            # Validate DWORD (32-bit integer)
+            int_val = int(value, 0)  # Base 0 allows hex with 0x prefix
+            if not (0 <= int_val <= 0xFFFFFFFF):
+                raise ValueError
+            return int_val
+                
+        elif reg_type == 'REG_QWORD':
+            # Validate QWORD (64-bit integer)
+            int_val = int(value, 0)
+            if not (0 <= int_val <= 0xFFFFFFFFFFFFFFFF):
+                raise ValueError
+            return int_val
+                
+        elif reg_type == 'REG_BINARY':
+            # Validate binary string (hex pairs, whitespace between pairs is ignored)
+            return bytes.fromhex(value)
+                
+        elif reg_type == 'REG_MULTI_SZ':
+            # Validate multi-string (semicolon separated)
+            if ';' not in value:
+                raise ValueError("Multi-string values must be semicolon-separated.")
+            return value.split(';')
+                
+    except ValueError:
+        raise ValueError(
+            f"Invalid value format for type {reg_type}."
+        )
+        
+    return value
+
+
 class AddRegistryValueDialog(QDialog):
     """Dialog for adding/editing registry values."""
     
     # Registry value types
-    REG_TYPES = [
-        'REG_SZ',
-        'REG_EXPAND_SZ',
-        'REG_MULTI_SZ',
-        'REG_DWORD',
-        'REG_QWORD',
-        'REG_BINARY'
-    ]
+    REG_TYPES = _REG_TYPES
     
     def __init__(self, parent=None, name="", value="", reg_type="REG_SZ"):
         """Initialize dialog.
@@ -30,6 +99,7 @@ class AddRegistryValueDialog(QDialog):
         self.name = name
         self.value = value
         self.reg_type = reg_type
+        self._coerced = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -49,7 +119,7 @@ class AddRegistryValueDialog(QDialog):
         type_layout = QHBoxLayout()
         type_label = QLabel("Type:")
         self.type_combo = QComboBox()
-        self.type_combo.addItems(self.REG_TYPES)
+        self.type_combo.setModel(_get_reg_types_model())
         self.type_combo.setCurrentText(self.reg_type)
         type_layout.addWidget(type_label)
         type_layout.addWidget(self.type_combo)
@@ -89,7 +159,7 @@ class AddRegistryValueDialog(QDialog):
         # Validate value based on type
         reg_type = self.type_combo.currentText()
         try:
-            self._validate_value(value, reg_type)
+            self._coerced = _validate_reg_value(value, reg_type)
         except ValueError as e:
             QMessageBox.warning(
                 self,
@@ -104,71 +174,24 @@ class AddRegistryValueDialog(QDialog):
         """Get the registry value details.
         
         Returns:
-            tuple: (name, value, type)
+            tuple: (name, value, type), with value converted to its
+                native type once the dialog has been accepted
         """
+        value = self._coerced
+        if value is None:
+            value = self.value_edit.text().strip()
         return (
             self.name_edit.text().strip(),
-            self.value_edit.text().strip(),
+            value,
             self.type_combo.currentText()
         )
-        
-    def _validate_value(self, value, reg_type):
-        """Validate registry value based on type.
-        
-        Args:
-            value: Value to validate
-            reg_type: Registry value type
-            
-        Raises:
-            ValueError: If value is invalid for type
-        """
-        if not value:
-            raise ValueError("Value cannot be empty.")
-            
-        try:
-            if reg_type == 'REG_DWORD':
-                # Validate DWORD (32-bit integer)
-                int_val = int(value, 0)  # Base 0 allows hex with 0x prefix
-                if not (0 <= int_val <= 0xFFFFFFFF):
-                    raise ValueError
-                    
-            elif reg_type == 'REG_QWORD':
-                # Validate QWORD (64-bit integer)
-                int_val = int(value, 0)
-                if not (0 <= int_val <= 0xFFFFFFFFFFFFFFFF):
-                    raise ValueError
-                    
-            elif reg_type == 'REG_BINARY':
-                # Validate binary string (hex pairs)
-                value = value.replace(' ', '')
-                if not all(c in '0123456789ABCDEFabcdef' for c in value):
-                    raise ValueError
-                if len(value) % 2 != 0:
-                    raise ValueError
-                    
-            elif reg_type == 'REG_MULTI_SZ':
-                # Validate multi-string (semicolon separated)
-                if ';' not in value:
-                    raise ValueError("Multi-string values must be semicolon-separated.")
-                    
-        except ValueError:
-            raise ValueError(
-                f"Invalid value format for type {reg_type}."
-            )
 
 
 class AddRegistryDialog(QDialog):
     """Dialog for adding/editing registry entries."""
     
     # Registry value types
-    REG_TYPES = [
-        'REG_SZ',
-        'REG_EXPAND_SZ',
-        'REG_MULTI_SZ',
-        'REG_DWORD',
-        'REG_QWORD',
-        'REG_BINARY'
-    ]
+    REG_TYPES = _REG_TYPES
     
     def __init__(self, parent=None, path="", name="", reg_type="REG_SZ", value=""):
         """Initialize dialog.
@@ -186,6 +209,7 @@ class AddRegistryDialog(QDialog):
         self.name = name
         self.reg_type = reg_type
         self.value = value
+        self._coerced = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -213,7 +237,7 @@ class AddRegistryDialog(QDialog):
         type_layout = QHBoxLayout()
         type_label = QLabel("Type:")
         self.type_combo = QComboBox()
-        self.type_combo.addItems(self.REG_TYPES)
+        self.type_combo.setModel(_get_reg_types_model())
         self.type_combo.setCurrentText(self.reg_type)
         type_layout.addWidget(type_label)
         type_layout.addWidget(self.type_combo)
@@ -262,7 +286,7 @@ class AddRegistryDialog(QDialog):
         # Validate value based on type
         reg_type = self.type_combo.currentText()
         try:
-            self._validate_value(value, reg_type)
+            self._coerced = _validate_reg_value(value, reg_type)
         except ValueError as e:
             QMessageBox.warning(
                 self,
@@ -277,55 +301,15 @@ class AddRegistryDialog(QDialog):
         """Get the registry entry details.
         
         Returns:
-            tuple: (path, name, type, value)
+            tuple: (path, name, type, value), with value converted to its
+                native type once the dialog has been accepted
         """
+        value = self._coerced
+        if value is None:
+            value = self.value_edit.text().strip()
         return (
             self.path_edit.text().strip(),
             self.name_edit.text().strip(),
             self.type_combo.currentText(),
-            self.value_edit.text().strip()
+            value
         )
-        
-    def _validate_value(self, value, reg_type):
-        """Validate registry value based on type.
-        
-        Args:
-            value: Value to validate
-            reg_type: Registry value type
-            
-        Raises:
-            ValueError: If value is invalid for type
-        """
-        if not value:
-            raise ValueError("Value cannot be empty.")
-            
-        try:
-            if reg_type == 'REG_DWORD':
-                # Validate DWORD (32-bit integer)
-                int_val = int(value, 0)  # Base 0 allows hex with 0x prefix
-                if not (0 <= int_val <= 0xFFFFFFFF):
-                    raise ValueError
-                    
-            elif reg_type == 'REG_QWORD':
-                # Validate QWORD (64-bit integer)
-                int_val = int(value, 0)
-                if not (0 <= int_val <= 0xFFFFFFFFFFFFFFFF):
-                    raise ValueError
-                    
-            elif reg_type == 'REG_BINARY':
-                # Validate binary string (hex pairs)
-                value = value.replace(' ', '')
-                if not all(c in '0123456789ABCDEFabcdef' for c in value):
-                    raise ValueError
-                if len(value) % 2 != 0:
-                    raise ValueError
-                    
-            elif reg_type == 'REG_MULTI_SZ':
-                # Validate multi-string (semicolon separated)
-                if ';' not in value:
-                    raise ValueError("Multi-string values must be semicolon-separated.")
-                    
-        except ValueError:
-            raise ValueError(
-                f"Invalid value format for type {reg_type}."
-            )
@@ -0,0 +1,68 @@
+"""Bounded cache for registry enumeration results."""
+import time
+from collections import OrderedDict
+
+
+class EnumerationCache:
+    """LRU cache of enumerated registry keys with a short time to live.
+    
+    Entries are keyed by registry path. The least recently used entry is
+    evicted once the cache is full, and entries older than the time to live
+    are treated as missing.
+    """
+    
+    def __init__(self, max_size=128, ttl=5.0):
+        """Initialize enumeration cache.
+        
+        Args:
+            max_size: Maximum number of cached keys
+            ttl: Seconds an entry stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+    
+    def get(self, path):
+        """Get the cached enumeration of a key.
+        
+        Args:
+            path: Registry key path
+        
+        Returns:
+            list: Cached result, or None on a miss
+        """
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        
+        result, stamp = entry
+        if time.monotonic() - stamp > self.ttl:
+            del self._entries[path]
+            return None
+        
+        self._entries.move_to_end(path)
+        return result
+    
+    def put(self, path, result):
+        """Store the enumeration of a key.
+        
+        Args:
+            path: Registry key path
+            result: Enumerated names or values
+        """
+        self._entries[path] = (result, time.monotonic())
+        self._entries.move_to_end(path)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, path):
+        """Drop the cached enumeration of a key.
+        
+        Args:
+            path: Registry key path
+        """
+        self._entries.pop(path, None)
+    
+    def clear(self):
+        """Drop every cached enumeration."""
+        self._entries.clear()
@@ -1,5 +1,7 @@
 """Windows Registry management."""
+import operator
 import winreg
+from collections import OrderedDict
 from typing import Optional, Dict, List, Tuple, Any
 from src.core.logger import setup_logger
 
@@ -26,10 +28,24 @@ class RegistryManager:
         winreg.REG_NONE: 'REG_NONE'
     }
     
+    # Reverse lookup of value type constants by name
+    NAME_TO_TYPE = {v: k for k, v in VALUE_TYPES.items()}
+    
+    # Access masks for open_key
+    _ACCESS_RW = winreg.KEY_READ | winreg.KEY_WRITE
+    _ACCESS_R = winreg.KEY_READ
+    
+    # Most key handles kept open by the handle cache
+    MAX_CACHED_HANDLES = 32
+    
     def __init__(self):
         """Initialize registry manager."""
         self.logger = setup_logger(self.__class__.__name__)
         
+        # Open key handles keyed by (root_key, sub_key, write), least
+        # recently used first
+        self._handle_cache: "OrderedDict[Tuple[str, str, bool], winreg.HKEYType]" = OrderedDict()
+        
     def get_root_keys(self) -> List[str]:
         """Get list of root keys.
         
@@ -55,7 +71,7 @@ class RegistryManager:
                 self.logger.error(f"Invalid root key: {root_key}")
                 return None
                 
-            access = winreg.KEY_READ | winreg.KEY_WRITE if write else winreg.KEY_READ
+            access = self._ACCESS_RW if write else self._ACCESS_R
             key = winreg.OpenKey(root, sub_key, 0, access)
             return key
             
@@ -63,12 +79,60 @@ class RegistryManager:
             self.logger.error(f"Failed to open key {root_key}\\{sub_key}: {str(e)}")
             return None
             
-    def list_subkeys(self, root_key: str, sub_key: str) -> List[str]:
+    def _get_key(self, root_key: str, sub_key: str, write: bool = False) -> Optional[winreg.HKEYType]:
+        """Get a cached registry key handle, opening it if needed.
+        
+        Once MAX_CACHED_HANDLES handles are cached, the least recently used
+        handle is closed to make room.
+        
+        Args:
+            root_key: Root key name
+            sub_key: Sub key path
+            write: True to open with write access
+            
+        Returns:
+            winreg.HKEYType: Registry key handle or None if failed
+        """
+        cache_key = (root_key, sub_key, write)
+        key = self._handle_cache.get(cache_key)
+        if key is not None:
+            self._handle_cache.move_to_end(cache_key)
+            return key
+            
+        key = self.open_key(root_key, sub_key, write)
+        if key:
+            self._handle_cache[cache_key] = key
+            while len(self._handle_cache) > self.MAX_CACHED_HANDLES:
+                _, evicted = self._handle_cache.popitem(last=False)
+                winreg.CloseKey(evicted)
+        return key
+        
+    def invalidate(self, root_key: str, sub_key: str):
+        """Close cached handles for a key and its subkeys.
+        
+        Args:
+            root_key: Root key name
+            sub_key: Sub key path
+        """
+        prefix = sub_key + '\\'
+        for cache_key in list(self._handle_cache):
+            root, sub, _ = cache_key
+            if root == root_key and (sub == sub_key or sub.startswith(prefix)):
+                winreg.CloseKey(self._handle_cache.pop(cache_key))
+                
+    def close_all(self):
+        """Close all cached registry key handles."""
+        for key in self._handle_cache.values():
+            winreg.CloseKey(key)
+        self._handle_cache.clear()
+        
+    def list_subkeys(self, root_key: str, sub_key: str, sort: bool = True) -> List[str]:
         """List subkeys of a registry key.
         
         Args:
             root_key: Root key name
             sub_key: Sub key path
+            sort: False to return subkeys in registry order
             
         Returns:
             list: List of subkey names
@@ -79,18 +143,17 @@ class RegistryManager:
                 return []
                 
             try:
+                num_subkeys, _, _ = winreg.QueryInfoKey(key)
                 subkeys = []
-                index = 0
-                
-                while True:
+                for i in range(num_subkeys):
                     try:
-                        subkey = winreg.EnumKey(key, index)
-                        subkeys.append(subkey)
-                        index += 1
-                    except WindowsError:
-                        break
-                        
-                return sorted(subkeys)
+                        subkeys.append(winreg.EnumKey(key, i))
+                    except OSError:
+                        # Subkey removed while enumerating
+                        continue
+                if sort:
+                    subkeys.sort()
+                return subkeys
                 
             finally:
                 winreg.CloseKey(key)
@@ -99,52 +162,49 @@ class RegistryManager:
             self.logger.error(f"Failed to list subkeys of {root_key}\\{sub_key}: {str(e)}")
             return []
             
-    def list_values(self, root_key: str, sub_key: str) -> List[Dict[str, Any]]:
+    def list_values(self, root_key: str, sub_key: str, sort: bool = True) -> List[Dict[str, Any]]:
         """List values in a registry key.
         
         Args:
             root_key: Root key name
             sub_key: Sub key path
+            sort: False to return values in registry order
             
         Returns:
             list: List of value dictionaries with name, type, and data
         """
         try:
-            key = self.open_key(root_key, sub_key)
+            key = self._get_key(root_key, sub_key)
             if not key:
                 return []
                 
-            try:
-                values = []
-                index = 0
+            _, num_values, _ = winreg.QueryInfoKey(key)
+            values = []
+            
+            for index in range(num_values):
+                try:
+                    name, data, type_ = winreg.EnumValue(key, index)
+                except OSError:
+                    # Value removed while enumerating
+                    continue
                 
-                while True:
-                    try:
-                        name, data, type_ = winreg.EnumValue(key, index)
-                        
-                        # Format binary data
-                        if type_ == winreg.REG_BINARY:
-                            data = ' '.join([f'{b:02x}' for b in data])
-                            
-                        # Format multi-string data
-                        elif type_ == winreg.REG_MULTI_SZ:
-                            data = '\n'.join(data)
-                            
-                        values.append({
-                            'name': name or '(Default)',
-                            'type': self.VALUE_TYPES.get(type_, 'Unknown'),
-                            'data': str(data)
-                        })
-                        
-                        index += 1
-                        
-                    except WindowsError:
-                        break
-                        
-                return sorted(values, key=lambda v: v['name'])
+                # Format binary data
+                if type_ == winreg.REG_BINARY:
+                    data = data.hex(' ')
+                    
+                # Format multi-string data
+                elif type_ == winreg.REG_MULTI_SZ:
+                    data = '\n'.join(data)
+                    
+                values.append({
+                    'name': name or '(Default)',
+                    'type': self.VALUE_TYPES.get(type_, 'Unknown'),
+                    'data': str(data)
+                })
                 
-            finally:
-                winreg.CloseKey(key)
+            if sort:
+                values.sort(key=operator.itemgetter('name'))
+            return values
                 
         except WindowsError as e:
             self.logger.error(f"Failed to list values in {root_key}\\{sub_key}: {str(e)}")
@@ -162,25 +222,21 @@ class RegistryManager:
             tuple: (value data, value type) or None if failed
         """
         try:
-            key = self.open_key(root_key, sub_key)
+            key = self._get_key(root_key, sub_key)
             if not key:
                 return None
                 
-            try:
-                data, type_ = winreg.QueryValueEx(key, value_name)
+            data, type_ = winreg.QueryValueEx(key, value_name)
+            
+            # Format binary data
+            if type_ == winreg.REG_BINARY:
+                data = data.hex(' ')
                 
-                # Format binary data
-                if type_ == winreg.REG_BINARY:
-                    data = ' '.join([f'{b:02x}' for b in data])
-                    
-                # Format multi-string data
-                elif type_ == winreg.REG_MULTI_SZ:
-                    data = '\n'.join(data)
-                    
-                return data, self.VALUE_TYPES.get(type_, 'Unknown')
+            # Format multi-string data
+            elif type_ == winreg.REG_MULTI_SZ:
+                data = '\n'.join(data)
                 
-            finally:
-                winreg.CloseKey(key)
+            return data, self.VALUE_TYPES.get(type_, 'Unknown')
                 
         except WindowsError as e:
             self.logger.error(
@@ -203,56 +259,52 @@ class RegistryManager:
             bool: True if successful
         """
         try:
-            key = self.open_key(root_key, sub_key, write=True)
+            key = self._get_key(root_key, sub_key, write=True)
             if not key:
                 return False
                 
-            try:
-                # Get type constant from name
-                type_const = None
-                for k, v in self.VALUE_TYPES.items():
-                    if v == type_name:
-                        type_const = k
-                        break
-                        
-                if type_const is None:
-                    self.logger.error(f"Invalid value type: {type_name}")
-                    return False
+            # Get type constant from name
+            type_const = self.NAME_TO_TYPE.get(type_name)
                     
-                # Convert data based on type
-                if type_const == winreg.REG_BINARY:
-                    # Convert hex string to bytes
+            if type_const is None:
+                self.logger.error(f"Invalid value type: {type_name}")
+                return False
+                
+            # Convert data based on type (already-parsed values pass through)
+            if type_const == winreg.REG_BINARY:
+                # Convert hex string to bytes
+                if not isinstance(data, bytes):
                     try:
-                        data = bytes.fromhex(data.replace(' ', ''))
+                        data = bytes.fromhex(data)
                     except ValueError:
                         self.logger.error("Invalid binary data format")
                         return False
-                        
-                elif type_const == winreg.REG_MULTI_SZ:
-                    # Convert newline-separated string to list
-                    data = data.split('\n')
                     
-                elif type_const == winreg.REG_DWORD:
-                    # Convert string to integer
+            elif type_const == winreg.REG_MULTI_SZ:
+                # Convert newline-separated string to list
+                if not isinstance(data, list):
+                    data = data.split('\n')
+                
+            elif type_const == winreg.REG_DWORD:
+                # Convert string to integer (base 0 accepts 0x prefix)
+                if not isinstance(data, int):
                     try:
-                        data = int(data)
+                        data = int(data, 0)
                     except ValueError:
                         self.logger.error("Invalid DWORD value")
                         return False
-                        
-                elif type_const == winreg.REG_QWORD:
-                    # Convert string to integer
+                    
+            elif type_const == winreg.REG_QWORD:
+                # Convert string to integer (base 0 accepts 0x prefix)
+                if not isinstance(data, int):
                     try:
-                        data = int(data)
+                        data = int(data, 0)
                     except ValueError:
                         self.logger.error("Invalid QWORD value")
                         return False
-                        
-                winreg.SetValueEx(key, name, 0, type_const, data)
-                return True
-                
-            finally:
-                winreg.CloseKey(key)
+                    
+            winreg.SetValueEx(key, name, 0, type_const, data)
+            return True
                 
         except WindowsError as e:
             self.logger.error(
@@ -272,16 +324,12 @@ class RegistryManager:
             bool: True if successful
         """
         try:
-            key = self.open_key(root_key, sub_key, write=True)
+            key = self._get_key(root_key, sub_key, write=True)
             if not key:
                 return False
                 
-            try:
-                winreg.DeleteValue(key, name)
-                return True
-                
-            finally:
-                winreg.CloseKey(key)
+            winreg.DeleteValue(key, name)
+            return True
                 
         except WindowsError as e:
             self.logger.error(
@@ -305,6 +353,7 @@ class RegistryManager:
                 self.logger.error(f"Invalid root key: {root_key}")
                 return False
                 
+            self.invalidate(root_key, sub_key)
             winreg.CreateKey(root, sub_key)
             return True
             
@@ -328,6 +377,7 @@ class RegistryManager:
                 self.logger.error(f"Invalid root key: {root_key}")
                 return False
                 
+            self.invalidate(root_key, sub_key)
             winreg.DeleteKey(root, sub_key)
             return True
             
@@ -1,14 +1,63 @@
 """Registry management panel."""
-from PyQt6.QtWidgets import QSplitter, QVBoxLayout, QWidget, QLabel
-from PyQt6.QtCore import Qt
+from collections import defaultdict
+from PyQt6.QtWidgets import (QSplitter, QVBoxLayout, QHBoxLayout, QWidget, QLabel,
+                             QComboBox)
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
 from src.core.logger import setup_logger
 from src.ui.base.base_panel import BasePanel
 from .tree_widget import RegistryTree
+from .manager import RegistryManager
 from .components import ButtonBar, ValuesView, DialogFactory, RegistryOperations
 
+class ApplyConfigWorker(QThread):
+    """Worker thread for writing registry configuration in the background.
+    
+    Unlike a .reg import, configuration is applied best effort rather than
+    through RegistryOperations.batch_apply: one bad value is logged and
+    skipped instead of rolling back every other entry, and the number of
+    values written is reported.
+    """
+    
+    config_applied = pyqtSignal(int, int)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, registry_ops, entries_by_path, total_count):
+        super().__init__()
+        self.registry_ops = registry_ops
+        self.entries_by_path = entries_by_path
+        self.total_count = total_count
+        
+    def run(self):
+        """Write registry values in background thread."""
+        try:
+            success_count = 0
+            for path, entries in self.entries_by_path.items():
+                # Use registry operations to set all values under this key
+                try:
+                    written = self.registry_ops.set_registry_values_bulk(path, entries)
+                except (OSError, ValueError) as e:
+                    self.registry_ops.logger.warning(
+                        f"Failed to set registry values under {path}: {str(e)}"
+                    )
+                    continue
+                    
+                success_count += written
+                if written < len(entries):
+                    self.registry_ops.logger.warning(
+                        f"Set {written} of {len(entries)} registry values under {path}"
+                    )
+                    
+            self.config_applied.emit(success_count, self.total_count)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
 class RegistryPanel(BasePanel):
     """Panel for managing registry entries."""
     
+    # Signal emitted when a background configuration apply has finished,
+    # with True if every entry was written and a summary message
+    config_apply_finished = pyqtSignal(bool, str)
+    
     def __init__(self, main_window):
         """Initialize registry panel.
         
@@ -18,8 +67,10 @@ class RegistryPanel(BasePanel):
         # Initialize components to None first
         self.tree = None
         self.values_view = None
+        self.type_filter_combo = None
         self.button_bar = None
         self.splitter = None
+        self.apply_worker = None
         
         # Set up logger
         self.logger = setup_logger(self.__class__.__name__)
@@ -28,20 +79,35 @@ class RegistryPanel(BasePanel):
         self.dialog_factory = DialogFactory(self)
         self.registry_ops = RegistryOperations(self)
         
-        # Call base class constructor (which calls setup_ui)
+        # Call base class constructor (which calls setup_ui and setup_connections)
         super().__init__(main_window)
         
-        # Connect signals after UI is set up
-        self.setup_connections()
+        # Coalesce back-to-back refresh requests into a single rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
+        # Load values only once key selection settles while browsing
+        self._pending_path = None
+        self._values_timer = QTimer(self)
+        self._values_timer.setSingleShot(True)
+        self._values_timer.setInterval(120)
+        self._values_timer.timeout.connect(self._do_load_values)
         
         # Initialize imported config items
         self.imported_config_items = set()
+        self._imported_frozen = frozenset()
         
     def cleanup(self):
         """Perform cleanup before panel is destroyed.
         
         Override of BasePanel.cleanup to handle specific cleanup tasks.
         """
+        # Drop a pending values load for the last selected key
+        if hasattr(self, '_values_timer'):
+            self._values_timer.stop()
+            
         # Clear references to UI elements to avoid memory leaks
         if hasattr(self, 'tree') and self.tree is not None:
             try:
@@ -57,16 +123,42 @@ class RegistryPanel(BasePanel):
                 # Widget might have been deleted already
                 pass
                 
+        # Wait for any configuration writes or .reg imports still in progress
+        if self.apply_worker and self.apply_worker.isRunning():
+            self.apply_worker.wait()
+        if self.button_bar is not None:
+            self.button_bar.import_button.wait_for_worker()
+            
+        # Wait for background registry enumeration to finish
+        if self.tree is not None:
+            self.tree.registry_model.wait_for_workers()
+        if self.values_view is not None:
+            self.values_view.wait_for_workers()
+                
         # Call the parent class cleanup to clear the main layout
         # This should be called after clearing individual widgets
         super().cleanup()
     
     def setup_ui(self):
-        """Set up the panel UI."""
-        # Clear any existing layout if this is not the initial setup
-        if hasattr(self, 'splitter') and self.splitter is not None:
-            self.cleanup()
+        """Set up the panel UI.
+        
+        Widgets are built once; later calls only reset their contents.
+        """
+        if self.splitter is not None:
+            self.tree.clear_entries()
+            self.values_view.clear()
+            return
+            
+        self._build_ui()
+        
+        # Update button states
+        self.update_button_states()
         
+        # Load registry entries automatically
+        self._do_refresh()
+        
+    def _build_ui(self):
+        """Create the panel widgets."""
         # Create main splitter (horizontal orientation for left/right split)
         self.splitter = QSplitter(Qt.Orientation.Horizontal)
         
@@ -89,10 +181,19 @@ class RegistryPanel(BasePanel):
         self.right_layout = QVBoxLayout(self.right_widget)
         self.right_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Create label for values view
+        # Create label and type filter for values view
+        values_header = QHBoxLayout()
         self.values_label = QLabel("Registry Values")
         self.values_label.setStyleSheet("font-weight: bold;")
-        self.right_layout.addWidget(self.values_label)
+        values_header.addWidget(self.values_label)
+        values_header.addStretch()
+        
+        self.type_filter_combo = QComboBox()
+        self.type_filter_combo.addItem("All Types", None)
+        for reg_type, type_name in RegistryManager.VALUE_TYPES.items():
+            self.type_filter_combo.addItem(type_name, reg_type)
+        values_header.addWidget(self.type_filter_combo)
+        self.right_layout.addLayout(values_header)
         
         # Create values view
         self.values_view = ValuesView()
@@ -120,21 +221,16 @@ class RegistryPanel(BasePanel):
         # Add the main widget to the panel
         self.add_widget(main_widget)
         
-        # Update button states
-        self.update_button_states()
-        
-        # Load registry entries automatically
-        self.refresh_entries()
-        
     def setup_connections(self):
         """Set up signal/slot connections."""
         # Connect tree signals
         self.tree.itemSelectionChanged.connect(self.update_button_states)
         self.tree.keySelected.connect(self.on_key_selected)
+        self.type_filter_combo.currentIndexChanged.connect(self.on_type_filter_changed)
         
     def update_button_states(self):
         """Update button enabled states based on selection."""
-        has_selection = bool(self.tree.selectedItems())
+        has_selection = self.tree.has_selection()
         self.button_bar.update_button_states(has_selection)
         
     def on_key_selected(self, path):
@@ -143,10 +239,25 @@ class RegistryPanel(BasePanel):
         Args:
             path: Selected registry key path
         """
-        if self.values_view:
+        self._pending_path = path
+        self._values_timer.start()
+        
+    def _do_load_values(self):
+        """Load the values of the key selected last."""
+        path = self._pending_path
+        if self.values_view and path:
             self.registry_ops.refresh_values(path)
-            self.update_button_states()
             self.logger.info(f"Selected registry key: {path}")
+            
+
+    def on_type_filter_changed(self, index):
+        """Restrict the values view to the selected value type.
+        
+        Args:
+            index: Index of the selected filter entry
+        """
+        reg_type = self.type_filter_combo.itemData(index)
+        self.values_view.set_type_filter(None if reg_type is None else {reg_type})
         
     def show_error(self, message):
         """Show error message.
@@ -180,10 +291,19 @@ class RegistryPanel(BasePanel):
     def refresh_entries(self):
         """Refresh registry entries list.
         
+        The refresh runs on the next event loop iteration, so repeated
+        requests in a row result in a single rebuild.
+        
         This method is called by the RefreshButton component.
         """
+        self.values_view.invalidate()
+        self._refresh_timer.start()
+        
+    def _do_refresh(self):
+        """Rebuild the registry entries list."""
         self.logger.info("Refreshing registry entries")
         self.registry_ops.refresh_entries()
+        
         self.logger.info("Registry entries refreshed successfully")
         
     def update_remote_state(self, connected):
@@ -202,8 +322,11 @@ class RegistryPanel(BasePanel):
         Args:
             config: Dictionary containing configuration data
             
+        The values are written in a background thread; the outcome is
+        reported through config_apply_finished once it completes.
+        
         Returns:
-            bool: True if configuration was applied successfully, False otherwise
+            bool: True if the writes were started, False otherwise
         """
         self.logger.info("Applying registry configuration")
         
@@ -219,46 +342,71 @@ class RegistryPanel(BasePanel):
                 
             registry_config = config['registry']
             
-            # Process registry entries
-            success_count = 0
-            total_count = 0
+            total_count = len(registry_config)
             
-            for entry in registry_config:
-                total_count += 1
-                
-                # Check if entry has required fields
-                if not all(k in entry for k in ['path', 'name', 'type', 'value']):
-                    self.logger.warning(f"Skipping invalid registry entry: {entry}")
-                    continue
-                    
-                path = entry['path']
-                name = entry['name']
-                value_type = entry['type']
-                value = entry['value']
-                
+            # Group entries by key so each key is opened once
+            entries_by_path = defaultdict(list)
+            for path, name, value_type, value in self._normalize_registry_config(registry_config):
                 self.logger.debug(f"Setting registry value: {path}\\{name} = {value} ({value_type})")
+                entries_by_path[path].append((name, value_type, value))
                 
-                # Use registry operations to set the value
-                if self.registry_ops.set_registry_value(path, name, value_type, value):
-                    success_count += 1
-                else:
-                    self.logger.warning(f"Failed to set registry value: {path}\\{name}")
-            
-            # Refresh the view to show updated entries
-            self.refresh_entries()
-            
-            # Report success rate
-            if total_count > 0:
-                self.logger.info(f"Applied {success_count} of {total_count} registry entries")
-                return success_count > 0
-            else:
+            if total_count == 0:
                 self.logger.warning("No registry entries to apply")
                 return False
                 
+            # Don't start new worker if one is already running
+            if self.apply_worker and self.apply_worker.isRunning():
+                self.logger.warning("Registry configuration is already being applied")
+                return False
+                
+            # Write the values in a background thread with its own operations
+            # object, so refreshes on the GUI thread never touch its caches
+            self.apply_worker = ApplyConfigWorker(
+                RegistryOperations(self), entries_by_path, total_count
+            )
+            self.apply_worker.config_applied.connect(self.on_config_applied)
+            self.apply_worker.error_occurred.connect(self.on_apply_error)
+            self.apply_worker.start()
+            return True
+            
         except Exception as e:
             self.logger.error(f"Error applying registry configuration: {str(e)}")
             return False
             
+    def on_config_applied(self, success_count, total_count):
+        """Handle completion of the background configuration writes.
+        
+        Args:
+            success_count: Number of values written
+            total_count: Number of entries in the configuration
+        """
+        message = f"Applied {success_count} of {total_count} registry entries"
+        self.logger.info(message)
+        
+        # Show the written values for the selected key in one pass
+        self.values_view.invalidate()
+        selected_path = self.tree.get_selected_key_path()
+        if selected_path:
+            self.registry_ops.refresh_values(selected_path)
+            
+        # Refresh the view to show updated entries
+        self.refresh_entries()
+        
+        complete = success_count == total_count
+        if not complete:
+            self.dialog_factory.show_warning(f"{message}. Check logs for details.")
+        self.config_apply_finished.emit(complete, message)
+        
+    def on_apply_error(self, error_msg):
+        """Handle an error raised while applying configuration.
+        
+        Args:
+            error_msg: Error message
+        """
+        self.logger.error(f"Error applying registry configuration: {error_msg}")
+        self.dialog_factory.show_error(f"Error applying registry configuration: {error_msg}")
+        self.config_apply_finished.emit(False, error_msg)
+        
     def mark_config_items(self, config):
         """Mark items from configuration for highlighting without applying changes.
         
@@ -287,54 +435,84 @@ class RegistryPanel(BasePanel):
                 self.logger.warning("No registry entries in configuration")
                 return False
                 
-            registry_config = config['registry']
+            registry_entries = self._normalize_registry_config(config['registry'])
             
             # Process registry entries
-            for entry in registry_config:
-                # Check if entry has required fields
-                if not all(k in entry for k in ['path', 'name', 'type', 'value']):
-                    self.logger.warning(f"Skipping invalid registry entry: {entry}")
-                    continue
-                    
-                path = entry['path']
-                name = entry['name']
+            config_paths = set()
+            config_values = []
+            for path, name, _, _ in registry_entries:
+                config_paths.add(path)
+                config_values.append((path, name))
                 
                 # Mark this registry entry as imported from config for highlighting
                 self.mark_as_imported_config(f"registry:{path}\\{name}")
                 self.logger.debug(f"Marked registry entry for highlighting: {path}\\{name}")
+                
+            # Freeze the marked ids so values loaded later are highlighted too
+            self._imported_frozen = frozenset(self.imported_config_items)
+            self.values_view.imported_keys = self._imported_frozen
             
             # Add virtual entries for registry values that don't exist yet
-            self.add_virtual_entries_for_config(registry_config)
+            self.values_view.setUpdatesEnabled(False)
+            self.values_view.blockSignals(True)
+            try:
+                self.add_virtual_entries_for_config(registry_entries)
+            finally:
+                self.values_view.blockSignals(False)
+                self.values_view.setUpdatesEnabled(True)
             
-            # Refresh the view to show highlighted entries
-            self.refresh_entries()
+            # Highlight the affected rows in place instead of rebuilding the
+            # tree, and open only the branches that lead to configured keys
+            self.values_view.setUpdatesEnabled(False)
+            try:
+                for path, name in config_values:
+                    self.values_view.highlight(path, name)
+            finally:
+                self.values_view.setUpdatesEnabled(True)
+            self.tree.expand_paths(config_paths)
             return True
             
         except Exception as e:
             self.logger.error(f"Error marking registry entries from configuration: {str(e)}")
             return False
     
-    def add_virtual_entries_for_config(self, registry_config):
+    def _normalize_registry_config(self, registry_config):
+        """Validate registry configuration entries in a single pass.
+        
+        Args:
+            registry_config: List of registry entries from configuration
+            
+        Returns:
+            list: (path, name, type, value) tuples for the valid entries
+        """
+        registry_entries = []
+        for entry in registry_config:
+            try:
+                registry_entries.append(
+                    (entry['path'], entry['name'], entry['type'], entry['value'])
+                )
+            except (KeyError, TypeError):
+                self.logger.warning(f"Skipping invalid registry entry: {entry}")
+        return registry_entries
+        
+    def add_virtual_entries_for_config(self, registry_entries):
         """Add virtual entries for registry values that don't exist in the system yet.
         
         This method adds visual entries for registry values that are in the
         configuration but don't exist in the system yet.
         
         Args:
-            registry_config: List of registry entries from configuration
+            registry_entries: (path, name, type, value) tuples from
+                _normalize_registry_config
         """
         try:
             # Group entries by path for efficient processing
-            entries_by_path = {}
-            for entry in registry_config:
-                if not all(k in entry for k in ['path', 'name', 'type', 'value']):
-                    continue
-                    
-                path = entry['path']
-                if path not in entries_by_path:
-                    entries_by_path[path] = []
-                    
-                entries_by_path[path].append(entry)
+            entries_by_path = defaultdict(list)
+            for path, name, value_type, value in registry_entries:
+                entries_by_path[path].append((name, value_type, value))
+            
+            # The selection cannot change while this loop runs
+            selected_path = self.tree.get_selected_key_path()
             
             # For each path, check if it exists and add virtual entries for values
             for path, entries in entries_by_path.items():
@@ -347,15 +525,14 @@ class RegistryPanel(BasePanel):
                 existing_values = {v['name']: v for v in self.registry_ops.get_registry_values(path)}
                 
                 # Add virtual entries for values that don't exist
-                for entry in entries:
-                    name = entry['name']
+                for name, value_type, value in entries:
                     if name not in existing_values:
                         # Add virtual entry to values view if this is the currently selected path
-                        if path == self.tree.get_selected_path():
+                        if path == selected_path:
                             self.values_view.add_virtual_value(
                                 name,
-                                entry['value'],
-                                entry['type']
+                                value,
+                                value_type
                             )
                             self.logger.debug(f"Added virtual entry for registry value: {path}\\{name}")
                         
@@ -375,7 +552,7 @@ class RegistryPanel(BasePanel):
             registry_entries = []
             
             # Get the currently selected key path
-            selected_path = self.tree.get_selected_path()
+            selected_path = self.tree.get_selected_key_path()
             if not selected_path:
                 self.logger.warning("No registry key selected for export")
                 return {'registry': []}
@@ -0,0 +1,180 @@
+"""Parser for regedit .reg export files."""
+import winreg
+
+# Registry type of each hex(n): prefix
+_HEX_TYPES = {
+    '': winreg.REG_BINARY,
+    '0': winreg.REG_NONE,
+    '1': winreg.REG_SZ,
+    '2': winreg.REG_EXPAND_SZ,
+    '3': winreg.REG_BINARY,
+    '4': winreg.REG_DWORD,
+    '7': winreg.REG_MULTI_SZ,
+    'b': winreg.REG_QWORD,
+}
+
+_HEADERS = ('Windows Registry Editor Version 5.00', 'REGEDIT4')
+
+
+def _read_text(file_path):
+    """Read a .reg file, detecting its encoding.
+    
+    Args:
+        file_path: Path to the .reg file
+    
+    Returns:
+        str: File contents
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    if raw.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return raw.decode('utf-16')
+    return raw.decode('utf-8-sig', errors='replace')
+
+
+def _logical_lines(text):
+    """Join backslash-continued lines and drop blanks and comments.
+    
+    Args:
+        text: File contents
+    
+    Yields:
+        str: Complete lines
+    """
+    pending = ""
+    for line in text.splitlines():
+        line = line.strip()
+        if pending:
+            line = pending + line
+            pending = ""
+        if line.endswith('\\') and not line.startswith('['):
+            pending = line[:-1]
+            continue
+        if line and not line.startswith(';'):
+            yield line
+    if pending:
+        yield pending
+
+
+def _parse_quoted(text):
+    """Parse a quoted, backslash-escaped string at the start of text.
+    
+    Args:
+        text: Text starting with a double quote
+    
+    Returns:
+        tuple: (string, rest of text after the closing quote)
+    
+    Raises:
+        ValueError: If the string is not terminated
+    """
+    chars = []
+    i = 1
+    while i < len(text):
+        c = text[i]
+        if c == '\\' and i + 1 < len(text):
+            chars.append(text[i + 1])
+            i += 2
+            continue
+        if c == '"':
+            return ''.join(chars), text[i + 1:]
+        chars.append(c)
+        i += 1
+    raise ValueError(f"Unterminated string: {text}")
+
+
+def _parse_data(data):
+    """Parse the data part of a value line.
+    
+    Args:
+        data: Text after the '=' sign
+    
+    Returns:
+        tuple: (reg_type, value), with value None for a deletion
+    
+    Raises:
+        ValueError: If the data format is not recognized
+    """
+    if data == '-':
+        return winreg.REG_NONE, None
+    if data.startswith('"'):
+        value, _ = _parse_quoted(data)
+        return winreg.REG_SZ, value
+    if data.startswith('dword:'):
+        return winreg.REG_DWORD, int(data[6:], 16)
+    if data.startswith('hex'):
+        prefix, sep, hex_data = data.partition(':')
+        if not sep:
+            raise ValueError(f"Invalid hex data: {data}")
+        type_code = prefix[4:-1].lower() if prefix.startswith('hex(') else ''
+        if type_code in _HEX_TYPES:
+            reg_type = _HEX_TYPES[type_code]
+        else:
+            reg_type = int(type_code, 16)
+        raw = bytes.fromhex(hex_data.replace(',', ' '))
+        
+        if reg_type in (winreg.REG_SZ, winreg.REG_EXPAND_SZ):
+            return reg_type, raw.decode('utf-16-le').split('\0', 1)[0]
+        if reg_type == winreg.REG_MULTI_SZ:
+            strings = raw.decode('utf-16-le').split('\0')
+            return reg_type, [s for s in strings if s]
+        if reg_type in (winreg.REG_DWORD, winreg.REG_QWORD):
+            return reg_type, int.from_bytes(raw, 'little')
+        return reg_type, raw
+    raise ValueError(f"Unsupported value data: {data}")
+
+
+def parse_reg_file(file_path):
+    """Parse a .reg file into registry write operations.
+    
+    Every [KEY] section yields a key creation, so keys without values are
+    imported too. Key deletions ([-KEY]) are not applied; their paths are
+    returned separately so the caller can report them.
+    
+    Args:
+        file_path: Path to the .reg file
+    
+    Returns:
+        tuple: (operations, skipped_keys) where operations is a list of
+            (key_path, name, reg_type, value) tuples, name None meaning the
+            key is only created and value None meaning the value is
+            deleted, and skipped_keys lists key deletions
+    
+    Raises:
+        ValueError: If the file is not a valid .reg file
+    """
+    lines = _logical_lines(_read_text(file_path))
+    header = next(lines, None)
+    if header not in _HEADERS:
+        raise ValueError("Not a registry file: missing 'Windows Registry Editor' header")
+    
+    operations = []
+    skipped_keys = []
+    key_path = None
+    for line in lines:
+        if line.startswith('['):
+            key_path = line[1:line.rindex(']')] if ']' in line else line[1:]
+            if key_path.startswith('-'):
+                skipped_keys.append(key_path[1:])
+                key_path = None
+            else:
+                operations.append((key_path, None, winreg.REG_NONE, None))
+            continue
+        
+        if key_path is None:
+            continue
+        
+        if line.startswith('@='):
+            name, data = "", line[2:]
+        elif line.startswith('"'):
+            name, rest = _parse_quoted(line)
+            if not rest.startswith('='):
+                raise ValueError(f"Invalid value line: {line}")
+            data = rest[1:]
+        else:
+            raise ValueError(f"Invalid value line: {line}")
+        
+        reg_type, value = _parse_data(data.strip())
+        operations.append((key_path, name, reg_type, value))
+    
+    return operations, skipped_keys
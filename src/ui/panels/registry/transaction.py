@@ -0,0 +1,161 @@
+"""Transacted registry writes through the Kernel Transaction Manager.
+
+All writes of a batch are made through key handles opened inside one KTM
+transaction, so they are committed together or not at all.
+"""
+import ctypes
+import winreg
+from ctypes import wintypes
+
+ERROR_SUCCESS = 0
+ERROR_FILE_NOT_FOUND = 2
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+_ktmw32 = ctypes.WinDLL('ktmw32', use_last_error=True)
+_advapi32 = ctypes.WinDLL('advapi32')
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+_CreateTransaction = _ktmw32.CreateTransaction
+_CreateTransaction.restype = wintypes.HANDLE
+_CreateTransaction.argtypes = [
+    ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD, wintypes.DWORD,
+    wintypes.DWORD, wintypes.DWORD, wintypes.LPWSTR
+]
+
+_CommitTransaction = _ktmw32.CommitTransaction
+_CommitTransaction.restype = wintypes.BOOL
+_CommitTransaction.argtypes = [wintypes.HANDLE]
+
+_RollbackTransaction = _ktmw32.RollbackTransaction
+_RollbackTransaction.restype = wintypes.BOOL
+_RollbackTransaction.argtypes = [wintypes.HANDLE]
+
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.restype = wintypes.BOOL
+_CloseHandle.argtypes = [wintypes.HANDLE]
+
+_RegCreateKeyTransactedW = _advapi32.RegCreateKeyTransactedW
+_RegCreateKeyTransactedW.restype = wintypes.LONG
+_RegCreateKeyTransactedW.argtypes = [
+    wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.LPWSTR,
+    wintypes.DWORD, wintypes.DWORD, ctypes.c_void_p,
+    ctypes.POINTER(wintypes.HKEY), ctypes.POINTER(wintypes.DWORD),
+    wintypes.HANDLE, ctypes.c_void_p
+]
+
+_RegSetValueExW = _advapi32.RegSetValueExW
+_RegSetValueExW.restype = wintypes.LONG
+_RegSetValueExW.argtypes = [
+    wintypes.HKEY, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD,
+    ctypes.c_char_p, wintypes.DWORD
+]
+
+_RegDeleteValueW = _advapi32.RegDeleteValueW
+_RegDeleteValueW.restype = wintypes.LONG
+_RegDeleteValueW.argtypes = [wintypes.HKEY, wintypes.LPCWSTR]
+
+_RegCloseKey = _advapi32.RegCloseKey
+_RegCloseKey.restype = wintypes.LONG
+_RegCloseKey.argtypes = [wintypes.HKEY]
+
+
+def _to_bytes(value, reg_type):
+    """Encode a value as raw registry data.
+    
+    Args:
+        value: Value in the form winreg.SetValueEx accepts
+        reg_type: Registry value type
+    
+    Returns:
+        bytes: Raw data
+    """
+    if reg_type in (winreg.REG_SZ, winreg.REG_EXPAND_SZ):
+        return (str(value) + '\0').encode('utf-16-le')
+    if reg_type == winreg.REG_MULTI_SZ:
+        return ''.join(s + '\0' for s in value).encode('utf-16-le') + b'\0\0'
+    if reg_type == winreg.REG_DWORD:
+        return int(value).to_bytes(4, 'little')
+    if reg_type == winreg.REG_QWORD:
+        return int(value).to_bytes(8, 'little')
+    return bytes(value or b'')
+
+
+def _check(rc, action):
+    """Raise an OSError for a failed registry call.
+    
+    Args:
+        rc: Return code of the call
+        action: Description of the failed action
+    
+    Raises:
+        OSError: If rc is not ERROR_SUCCESS
+    """
+    if rc != ERROR_SUCCESS:
+        error = ctypes.WinError(rc)
+        raise OSError(error.errno, f"{action}: {error.strerror}", None, rc)
+
+
+def batch_apply(operations, description="WinOpsTool registry import"):
+    """Apply registry writes as a single transaction.
+    
+    Each key is created or opened once inside the transaction. If any
+    write fails, the transaction is rolled back and nothing is changed.
+    
+    Args:
+        operations: Iterable of (root_key, sub_key, name, reg_type, value)
+            tuples, where root_key is a winreg HKEY_* constant. A name of
+            None only creates the key and a value of None deletes the named
+            value.
+        description: Transaction description shown by system tools
+    
+    Returns:
+        int: Number of values set or deleted
+    
+    Raises:
+        OSError: If the transaction cannot be created or a write fails
+    """
+    # Group by key so every key is opened once
+    by_key = {}
+    for root_key, sub_key, name, reg_type, value in operations:
+        by_key.setdefault((root_key, sub_key), []).append((name, reg_type, value))
+    
+    htx = _CreateTransaction(None, None, 0, 0, 0, 0, description)
+    if not htx or htx == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+    
+    count = 0
+    try:
+        for (root_key, sub_key), entries in by_key.items():
+            hkey = wintypes.HKEY()
+            _check(_RegCreateKeyTransactedW(
+                wintypes.HKEY(root_key), sub_key, 0, None, 0,
+                winreg.KEY_READ | winreg.KEY_WRITE, None,
+                ctypes.byref(hkey), None, htx, None
+            ), f"Failed to open {sub_key}")
+            try:
+                for name, reg_type, value in entries:
+                    if name is None:
+                        # The key itself was created above
+                        continue
+                    if value is None:
+                        # Deleting a value that does not exist is not an error
+                        rc = _RegDeleteValueW(hkey, name)
+                        if rc != ERROR_FILE_NOT_FOUND:
+                            _check(rc, f"Failed to delete {sub_key}\\{name}")
+                    else:
+                        data = _to_bytes(value, reg_type)
+                        _check(_RegSetValueExW(hkey, name, 0, reg_type, data, len(data)),
+                               f"Failed to set {sub_key}\\{name}")
+                    count += 1
+            finally:
+                _RegCloseKey(hkey)
+        
+        if not _CommitTransaction(htx):
+            raise ctypes.WinError(ctypes.get_last_error())
+    except BaseException:
+        _RollbackTransaction(htx)
+        raise
+    finally:
+        _CloseHandle(htx)
+    
+    return count
@@ -1,15 +1,91 @@
-"""Tree widget for registry keys."""
+"""Tree view and lazy model for registry keys."""
 import winreg
-from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QHeaderView
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QTreeView, QHeaderView
+from PyQt6.QtCore import (Qt, pyqtSignal, QAbstractItemModel, QModelIndex,
+                          QItemSelectionModel, QThread, QTimer)
 from src.core.logger import setup_logger
+from src.ui.panels.registry import _winreg_fast
+from src.ui.panels.registry.enum_cache import EnumerationCache
 
-class RegistryTree(QTreeWidget):
-    """Hierarchical tree widget for displaying registry keys."""
+
+# Number of subkeys enumerated per page
+PAGE_SIZE = 1000
+
+
+def _enumerate_subkeys(root_key, subkey, start=0, limit=PAGE_SIZE):
+    """Enumerate one page of the subkey names of a registry key.
     
-    # Signal emitted when a registry key is selected
-    keySelected = pyqtSignal(str)
+    Args:
+        root_key: Root key handle
+        subkey: Sub key path
+        start: Index of the first subkey to enumerate
+        limit: Maximum number of names to return
+        
+    Returns:
+        tuple: (names, has_more)
+    """
+    key = winreg.OpenKey(root_key, subkey, 0, winreg.KEY_READ)
+    try:
+        # Read one extra name to learn whether another page follows
+        names = _winreg_fast.enum_subkeys(key, start, limit + 1)
+    finally:
+        winreg.CloseKey(key)
+    return names[:limit], len(names) > limit
+
+
+class SubkeyLoadWorker(QThread):
+    """Worker thread for enumerating registry subkeys in the background."""
+    
+    subkeys_loaded = pyqtSignal(list, bool)
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, root_key, subkey, start=0, parent=None):
+        super().__init__(parent)
+        self.root_key = root_key
+        self.subkey = subkey
+        self.start_index = start
+        
+    def run(self):
+        """Enumerate subkeys in background thread."""
+        try:
+            names, has_more = _enumerate_subkeys(self.root_key, self.subkey, self.start_index)
+            self.subkeys_loaded.emit(names, has_more)
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class RegistryNode:
+    """Registry key node held by RegistryTreeModel."""
+    
+    __slots__ = ('name', 'path', 'parent', 'row', 'children', 'fetched', 'loading',
+                 'next_index', 'pager')
+    
+    def __init__(self, name, path, parent=None, row=0, fetched=False, pager=False):
+        """Initialize registry node.
+        
+        Args:
+            name: Display name of the key
+            path: Full registry path, or None for error nodes
+            parent: Parent RegistryNode, or None for root keys
+            row: Row of this node under its parent
+            fetched: True if subkeys need not be enumerated
+            pager: True for the placeholder that loads the next page
+        """
+        self.name = name
+        self.path = path
+        self.parent = parent
+        self.row = row
+        self.children = []
+        self.fetched = fetched
+        self.loading = False
+        
+        # Index of the next subkey to enumerate, None once all are loaded
+        self.next_index = None
+        self.pager = pager
+
+
+class RegistryTreeModel(QAbstractItemModel):
+    """Item model that enumerates registry subkeys on demand."""
     
     # Registry root keys
     ROOT_KEYS = {
@@ -21,156 +97,373 @@ class RegistryTree(QTreeWidget):
     }
     
     def __init__(self, parent=None):
-        """Initialize registry tree.
+        """Initialize registry tree model.
         
         Args:
-            parent: Parent widget
+            parent: Parent QObject
         """
         super().__init__(parent)
         self.logger = setup_logger(self.__class__.__name__)
-        self.setup_ui()
+        self._roots = self._create_root_nodes()
         
-    def setup_ui(self):
-        """Set up the tree widget UI."""
-        self.setHeaderLabels(["Registry Keys"])
+        # Running subkey workers; results from before a reset are dropped
+        self._workers = set()
+        self._generation = 0
         
-        # Configure header
-        header = self.header()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        # Recently enumerated subkey names keyed by registry path
+        self._enum_cache = EnumerationCache()
         
-        # Connect selection signal
-        self.itemSelectionChanged.connect(self._on_selection_changed)
+    def _create_root_nodes(self):
+        """Create the root key nodes.
         
-        # Enable selection of items
-        self.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        Returns:
+            list: RegistryNode for each root key
+        """
+        return [
+            RegistryNode(key_name, key_name, row=row)
+            for row, key_name in enumerate(self.ROOT_KEYS)
+        ]
         
-        # Create root key items
-        self._create_root_keys()
+    def _node(self, index):
+        """Get the node for a model index.
         
-    def _create_root_keys(self):
-        """Create root key items in the tree."""
-        for key_name in self.ROOT_KEYS.keys():
-            item = QTreeWidgetItem([key_name, "", ""])
-            item.setData(0, Qt.ItemDataRole.UserRole, key_name)  # Store full path
-            self.addTopLevelItem(item)
-            
-            # Add a placeholder child to show the expand arrow
-            placeholder = QTreeWidgetItem(["Loading...", "", ""])
-            item.addChild(placeholder)
+        Args:
+            index: QModelIndex
             
-        # Connect item expansion signal
-        self.itemExpanded.connect(self._on_item_expanded)
+        Returns:
+            RegistryNode or None for the invisible root
+        """
+        return index.internalPointer() if index.isValid() else None
         
-    def _on_item_expanded(self, item):
-        """Handle item expansion to load subkeys and values.
+    def _children(self, index):
+        """Get the child node list for a model index.
         
         Args:
-            item: The expanded QTreeWidgetItem
+            index: QModelIndex
+            
+        Returns:
+            list: Child nodes
+        """
+        node = self._node(index)
+        return node.children if node is not None else self._roots
+        
+    def index(self, row, column, parent=QModelIndex()):
+        """Create an index for the given row under parent."""
+        children = self._children(parent)
+        if column != 0 or not 0 <= row < len(children):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+        
+    def parent(self, index):
+        """Get the parent index of an index."""
+        node = self._node(index)
+        if node is None or node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Get the number of enumerated subkeys under parent."""
+        return len(self._children(parent))
+        
+    def columnCount(self, parent=QModelIndex()):
+        """Get the number of columns."""
+        return 1
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Get data for an index.
+        
+        DisplayRole returns the key name, UserRole the full registry path.
         """
-        # Check if this is a placeholder item (first expansion)
-        if item.childCount() == 1 and item.child(0).text(0) == "Loading...":
-            # Remove placeholder
-            item.removeChild(item.child(0))
+        node = self._node(index)
+        if node is None:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            if node.loading:
+                return "Loading..." if node.pager else f"{node.name} (Loading...)"
+            return node.name
+        if role == Qt.ItemDataRole.UserRole:
+            return node.path
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Get header label."""
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole and section == 0):
+            return "Registry Keys"
+        return None
+        
+    def hasChildren(self, parent=QModelIndex()):
+        """Report keys as expandable until they are known to be empty."""
+        node = self._node(parent)
+        if node is None:
+            return bool(self._roots)
+        return not node.fetched or bool(node.children)
+        
+    def canFetchMore(self, parent):
+        """Check whether the subkeys of parent still need enumerating."""
+        node = self._node(parent)
+        return node is not None and not node.fetched
+        
+    def fetchMore(self, parent):
+        """Start enumerating the subkeys of parent in a worker thread."""
+        node = self._node(parent)
+        if node is None or node.fetched or node.loading:
+            return
             
-            # Get the full path for this item
-            path = self._get_item_path(item)
+        cached = self._enum_cache.get(node.path)
+        if cached is not None:
+            self._on_subkeys_loaded(node, self._generation, 0, *cached)
+            return
             
-            # Load subkeys and values
-            self._load_registry_key(item, path)
+        self._start_load(node, node, 0)
         
-    def _load_registry_key(self, parent_item, path):
-        """Load registry subkeys and values for a given key.
+    def load_next_page(self, index):
+        """Enumerate the next page of subkeys behind a pager item.
         
         Args:
-            parent_item: Parent QTreeWidgetItem
-            path: Registry path to load
+            index: QModelIndex of the pager item
+        """
+        pager = self._node(index)
+        if pager is None or not pager.pager or pager.loading:
+            return
+            
+        node = pager.parent
+        self._start_load(node, pager, node.next_index)
+        
+    def _start_load(self, node, status_node, start):
+        """Start a worker enumerating one page of the subkeys of a node.
+        
+        Args:
+            node: RegistryNode whose subkeys are enumerated
+            status_node: RegistryNode showing the loading state
+            start: Index of the first subkey to enumerate
         """
         try:
-            # Split path into root key and subkey
-            root_key_name, subkey = self._split_path(path)
-            root_key = self.ROOT_KEYS[root_key_name]
-            
-            # Open the key
-            key = winreg.OpenKey(root_key, subkey if subkey else None, 0, winreg.KEY_READ)
-            
-            # First, enumerate subkeys
-            try:
-                i = 0
-                while True:
-                    subkey_name = winreg.EnumKey(key, i)
-                    # Create subkey item
-                    subkey_item = QTreeWidgetItem([subkey_name])
-                    subkey_item.setData(0, Qt.ItemDataRole.UserRole, f"{path}\\{subkey_name}")
-                    parent_item.addChild(subkey_item)
-                    
-                    # Add placeholder for expandability
-                    placeholder = QTreeWidgetItem(["Loading...", "", ""])
-                    subkey_item.addChild(placeholder)
-                    
-                    i += 1
-            except WindowsError:
-                # No more subkeys
-                pass
-                
-            # We don't enumerate values here anymore - they will be shown in the ValuesView
-                
-            winreg.CloseKey(key)
+            root_key_name, subkey = self._split_path(node.path)
+        except ValueError as e:
+            self._on_load_error(node, self._generation, str(e))
+            return
             
-        except Exception as e:
-            self.logger.warning(f"Failed to load registry key {path}: {str(e)}")
-            error_item = QTreeWidgetItem([f"Error: {str(e)}", "", ""])
-            parent_item.addChild(error_item)
+        status_node.loading = True
+        status_index = self.createIndex(status_node.row, 0, status_node)
+        self.dataChanged.emit(status_index, status_index, [Qt.ItemDataRole.DisplayRole])
+        
+        generation = self._generation
+        # Parented to the model and deleted by Qt once the thread has stopped
+        worker = SubkeyLoadWorker(self.ROOT_KEYS[root_key_name], subkey, start, self)
+        worker.subkeys_loaded.connect(
+            lambda names, has_more, node=node: self._on_subkeys_loaded(
+                node, generation, start, names, has_more
+            )
+        )
+        worker.error_occurred.connect(
+            lambda error_msg, node=node: self._on_load_error(node, generation, error_msg)
+        )
+        worker.finished.connect(lambda worker=worker: self._workers.discard(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._workers.add(worker)
+        worker.start()
+        
+    def _on_subkeys_loaded(self, node, generation, start, names, has_more):
+        """Append an enumerated page of subkeys under their parent node.
+        
+        Args:
+            node: Parent RegistryNode
+            generation: Model generation the enumeration started in
+            start: Index of the first subkey in the page
+            names: Subkey names
+            has_more: True if further subkeys follow the page
+        """
+        if generation != self._generation:
+            return
+        if start == 0:
+            if node.fetched:
+                return
+            self._enum_cache.put(node.path, (names, has_more))
+        elif node.next_index != start:
+            return
+            
+        # Drop the pager that requested this page
+        parent_index = self.createIndex(node.row, 0, node)
+        if node.children and node.children[-1].pager:
+            last = len(node.children) - 1
+            self.beginRemoveRows(parent_index, last, last)
+            node.children.pop()
+            self.endRemoveRows()
             
-    def _get_item_path(self, item):
-        """Get the full registry path for an item.
+        first = len(node.children)
+        children = [
+            RegistryNode(name, f"{node.path}\\{name}", node, row)
+            for row, name in enumerate(names, first)
+        ]
+        if has_more:
+            node.next_index = start + len(names)
+            children.append(RegistryNode(
+                f"Load next {PAGE_SIZE}...", None, node, first + len(names),
+                fetched=True, pager=True
+            ))
+        else:
+            node.next_index = None
+        self._set_children(node, children)
+        
+    def _on_load_error(self, node, generation, error_msg):
+        """Show an enumeration error under its node.
         
         Args:
-            item: QTreeWidgetItem to get path for
+            node: Parent RegistryNode
+            generation: Model generation the enumeration started in
+            error_msg: Error message
+        """
+        if generation != self._generation or (node.fetched and node.next_index is None):
+            return
             
-        Returns:
-            str: Full registry path
+        self.logger.warning(f"Failed to load registry key {node.path}: {error_msg}")
+        
+        # Replace a pending pager with the error
+        if node.children and node.children[-1].pager:
+            last = len(node.children) - 1
+            self.beginRemoveRows(self.createIndex(node.row, 0, node), last, last)
+            node.children.pop()
+            self.endRemoveRows()
+        node.next_index = None
+        self._set_children(node, [
+            RegistryNode(f"Error: {error_msg}", None, node, len(node.children), fetched=True)
+        ])
+        
+    def _set_children(self, node, children):
+        """Mark a node as fetched and append children to it.
+        
+        Args:
+            node: Parent RegistryNode
+            children: Child RegistryNode list
         """
-        # Check if item has stored path
-        path = item.data(0, Qt.ItemDataRole.UserRole)
-        if path:
-            return path
+        node.fetched = True
+        node.loading = False
+        index = self.createIndex(node.row, 0, node)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+        
+        if children:
+            first = len(node.children)
+            self.beginInsertRows(index, first, first + len(children) - 1)
+            node.children.extend(children)
+            self.endInsertRows()
             
-        # If not, it's a value item, get path from parent
-        parent = item.parent()
-        if parent:
-            return parent.data(0, Qt.ItemDataRole.UserRole)
+    def wait_for_workers(self):
+        """Block until all running subkey workers have finished."""
+        for worker in list(self._workers):
+            worker.wait()
             
-        # Fallback for root items
-        return item.text(0)
+    def locate(self, path):
+        """Walk the loaded keys towards a registry key.
         
-    def _on_selection_changed(self):
-        """Handle selection change to emit keySelected signal."""
-        items = self.selectedItems()
-        if not items:
-            return
+        Nothing is enumerated; the walk stops at the first key whose
+        subkeys are not loaded far enough to continue.
+        
+        Args:
+            path: Full registry path
             
-        item = items[0]
-        path = item.data(0, Qt.ItemDataRole.UserRole)
-        if path:
-            self.keySelected.emit(path)
-    
-    def get_selected_key_path(self):
-        """Get the path of the currently selected registry key.
+        Returns:
+            tuple: (node, found) where node is the deepest loaded
+                RegistryNode on the way to the key, or None if the root key
+                is unknown, and found is True if node is the key itself
+        """
+        children = self._roots
+        node = None
+        for part in path.split('\\'):
+            # Registry key names are case-insensitive
+            match = self._find_child(children, part.casefold())
+            if match is None:
+                return node, False
+            node = match
+            children = node.children
+        return node, node is not None
+        
+    def find_index(self, path):
+        """Find the index of a loaded registry key.
         
+        Args:
+            path: Full registry path
+            
         Returns:
-            str: Registry key path or None if no selection
+            QModelIndex: Index of the key, invalid if not found
         """
-        items = self.selectedItems()
-        if not items:
-            return None
+        node, found = self.locate(path)
+        if not found:
+            return QModelIndex()
+        return self.index_for(node)
+        
+    def index_for(self, node):
+        """Create the model index of a node.
+        
+        Args:
+            node: RegistryNode
             
-        item = items[0]
-        return item.data(0, Qt.ItemDataRole.UserRole)
+        Returns:
+            QModelIndex: Index of the node
+        """
+        return self.createIndex(node.row, 0, node)
         
-    def clear_entries(self):
-        """Clear all registry entries from the tree."""
-        self.clear()
-        self._create_root_keys()
+    def fetch_towards(self, node):
+        """Request the subkeys of node that a path walk is waiting for.
+        
+        Starts enumerating the first page of an unfetched key, or the next
+        page of a partially loaded one.
+        
+        Args:
+            node: RegistryNode the walk stopped at
+            
+        Returns:
+            bool: True if subkeys are still to come, False if node is fully
+                loaded
+        """
+        if not node.fetched:
+            self.fetchMore(self.index_for(node))
+            return True
+        if node.next_index is None:
+            return False
+        self.load_next_page(self.index_for(node.children[-1]))
+        return True
+        
+    @staticmethod
+    def _find_child(children, name):
+        """Find a key among child nodes by its casefolded name.
+        
+        Args:
+            children: Child RegistryNode list
+            name: Casefolded key name
+            
+        Returns:
+            RegistryNode or None if no child has that name
+        """
+        return next((
+            child for child in children
+            if child.path is not None and child.name.casefold() == name
+        ), None)
+        
+    def invalidate(self, path):
+        """Drop the cached subkey names of a registry key.
+        
+        Call this after creating or deleting a subkey of path.
+        
+        Args:
+            path: Registry key path
+        """
+        self._enum_cache.invalidate(path)
+        
+    def reload(self):
+        """Discard all enumerated subkeys and recreate the root keys."""
+        self._generation += 1
+        self._enum_cache.clear()
+        self.beginResetModel()
+        self._roots = self._create_root_nodes()
+        self.endResetModel()
+        
+    def clear(self):
+        """Remove every key from the model."""
+        self._generation += 1
+        self.beginResetModel()
+        self._roots = []
+        self.endResetModel()
         
     def _split_path(self, path):
         """Split registry path into root key and subkey.
@@ -187,51 +480,170 @@ class RegistryTree(QTreeWidget):
         if path in self.ROOT_KEYS:
             return path, ""
             
-        parts = path.split('\\', 1)
-        if len(parts) != 2 or parts[0] not in self.ROOT_KEYS:
+        root_key_name, sep, subkey = path.partition('\\')
+        if not sep or root_key_name not in self.ROOT_KEYS:
             raise ValueError(
                 f"Invalid registry path. Must start with one of: "
                 f"{', '.join(self.ROOT_KEYS.keys())}"
             )
-        return parts[0], parts[1]
-        
-    def _format_registry_value(self, value, reg_type):
-        """Format registry value for display based on type.
+        return root_key_name, subkey
+
+
+class RegistryTree(QTreeView):
+    """Hierarchical tree view for displaying registry keys."""
+    
+    # Signal emitted when a registry key is selected
+    keySelected = pyqtSignal(str)
+    
+    # Signal emitted whenever the selection changes
+    itemSelectionChanged = pyqtSignal()
+    
+    # Registry root keys
+    ROOT_KEYS = RegistryTreeModel.ROOT_KEYS
+    
+    def __init__(self, parent=None):
+        """Initialize registry tree.
         
         Args:
-            value: Registry value
-            reg_type: Registry value type
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.logger = setup_logger(self.__class__.__name__)
+        self._bulk_sorting = False
+        
+        # Paths queued by expand_paths whose branches are still loading
+        self._pending_paths = {}
+        self._expansion_scheduled = False
+        self.setup_ui()
+        
+    def setup_ui(self):
+        """Set up the tree view UI."""
+        self.registry_model = RegistryTreeModel(self)
+        self.setModel(self.registry_model)
+        
+        # Configure header
+        header = self.header()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        
+        # Enable selection of items
+        self.setSelectionMode(QTreeView.SelectionMode.SingleSelection)
+        
+        # Connect selection signal
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        
+        # Load the next page of a large key when its pager item is clicked
+        self.clicked.connect(self.registry_model.load_next_page)
+        self.activated.connect(self.registry_model.load_next_page)
+        
+        # Continue queued expansions as enumerated subkeys arrive
+        self.registry_model.rowsInserted.connect(self._schedule_expansion)
+        self.registry_model.modelReset.connect(self._schedule_expansion)
+        
+    def begin_bulk_update(self):
+        """Suspend repaints, signals and sorting ahead of a batch of changes."""
+        self._bulk_sorting = self.isSortingEnabled()
+        self.setSortingEnabled(False)
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        
+    def end_bulk_update(self):
+        """Restore the state saved by begin_bulk_update."""
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.setSortingEnabled(self._bulk_sorting)
+        
+    def _on_selection_changed(self, selected, deselected):
+        """Handle selection change to emit keySelected signal."""
+        self.itemSelectionChanged.emit()
+        
+        path = self.get_selected_key_path()
+        if path:
+            self.keySelected.emit(path)
             
+    def has_selection(self):
+        """Check whether a registry key is selected.
+        
         Returns:
-            Formatted string representation of value
-        """
-        if reg_type == winreg.REG_BINARY:
-            return ' '.join(f'{b:02x}' for b in value)
-        elif reg_type == winreg.REG_MULTI_SZ:
-            return ';'.join(value)
-        elif reg_type == winreg.REG_DWORD:
-            return f"0x{value:08x}"
-        elif reg_type == winreg.REG_QWORD:
-            return f"0x{value:016x}"
-        else:
-            return str(value)
+            bool: True if an item is selected
+        """
+        return self.selectionModel().hasSelection()
     
-    def _get_reg_type_name(self, reg_type):
-        """Get registry type name from type value.
+    def get_selected_key_path(self):
+        """Get the path of the currently selected registry key.
+        
+        Returns:
+            str: Registry key path or None if no selection
+        """
+        indexes = self.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+            
+        return indexes[0].data(Qt.ItemDataRole.UserRole)
+        
+    def select_path(self, path):
+        """Select an already loaded registry key.
         
         Args:
-            reg_type: Registry type value
+            path: Registry key path
             
         Returns:
-            Registry type name
-        """
-        type_map = {
-            winreg.REG_SZ: 'REG_SZ',
-            winreg.REG_EXPAND_SZ: 'REG_EXPAND_SZ',
-            winreg.REG_BINARY: 'REG_BINARY',
-            winreg.REG_DWORD: 'REG_DWORD',
-            winreg.REG_QWORD: 'REG_QWORD',
-            winreg.REG_MULTI_SZ: 'REG_MULTI_SZ',
-            winreg.REG_NONE: 'REG_NONE'
-        }
-        return type_map.get(reg_type, f'Unknown ({reg_type})')
+            bool: True if the key was found and selected
+        """
+        index = self.registry_model.find_index(path)
+        if not index.isValid():
+            return False
+            
+        self.selectionModel().setCurrentIndex(
+            index, QItemSelectionModel.SelectionFlag.ClearAndSelect
+        )
+        self.scrollTo(index)
+        return True
+        
+    def expand_paths(self, paths):
+        """Expand the branches leading to the given registry keys.
+        
+        Only the ancestors of each key are enumerated and expanded. Subkeys
+        are enumerated by worker threads, so paths that are not loaded yet
+        stay queued and the walk continues as their rows arrive.
+        
+        Args:
+            paths: Iterable of registry key paths
+        """
+        self._pending_paths.update(dict.fromkeys(paths))
+        self._continue_expansion()
+        
+    def _schedule_expansion(self, *args):
+        """Continue queued expansions once control returns to the event loop."""
+        if self._pending_paths and not self._expansion_scheduled:
+            self._expansion_scheduled = True
+            QTimer.singleShot(0, self._continue_expansion)
+            
+    def _continue_expansion(self):
+        """Expand the loaded part of each queued path and request the rest."""
+        self._expansion_scheduled = False
+        model = self.registry_model
+        self.setUpdatesEnabled(False)
+        try:
+            for path in list(self._pending_paths):
+                node, found = model.locate(path)
+                
+                # Keep the path queued while the subkeys it needs are loading;
+                # a fully loaded key without the next part ends the walk
+                if found or node is None or not model.fetch_towards(node):
+                    del self._pending_paths[path]
+                    
+                # Expand the loaded ancestors; the key itself stays collapsed
+                ancestor = node.parent if found else node
+                while ancestor is not None:
+                    self.expand(model.index_for(ancestor))
+                    ancestor = ancestor.parent
+        finally:
+            self.setUpdatesEnabled(True)
+            
+    def clear(self):
+        """Remove all registry keys from the tree."""
+        self.registry_model.clear()
+        
+    def clear_entries(self):
+        """Clear all registry entries from the tree."""
+        self.registry_model.reload()
@@ -1,15 +1,33 @@
-"""Scheduler panel package for Windows Task Scheduler management."""
-
-from .panel import SchedulerPanel
-from .manager import SchedulerManager
-from .tree_widget import SchedulerTreeWidget
-from .dialogs import TaskDetailsDialog, CreateTaskDialog, ConfirmTaskActionDialog
-
-__all__ = [
-    'SchedulerPanel',
-    'SchedulerManager', 
-    'SchedulerTreeWidget',
-    'TaskDetailsDialog',
-    'CreateTaskDialog',
-    'ConfirmTaskActionDialog'
-]
+"""Scheduler panel package for Windows Task Scheduler management.
+
+Submodules are imported on first access to one of their names, so
+importing the package does not load the panel's widgets.
+"""
+import importlib
+
+# Submodule that defines each exported name
+_EXPORTS = {
+    'SchedulerPanel': '.panel',
+    'SchedulerManager': '.manager',
+    'TaskDetails': '.manager',
+    'SchedulerTreeWidget': '.tree_widget',
+    'TaskDetailsDialog': '.dialogs',
+    'CreateTaskDialog': '.dialogs',
+    'ConfirmTaskActionDialog': '.dialogs'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import an exported name from its submodule on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the module's attributes including not yet imported exports."""
+    return sorted(list(globals()) + __all__)
@@ -6,13 +6,56 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import Qt, QDateTime
 from src.core.logger import setup_logger
 
+# (label, task_data key) of each row of a details tab
+_GENERAL_ROWS = (
+    ("Name:", 'name'),
+    ("Status:", 'status'),
+    ("Author:", 'author'),
+    ("Description:", 'comment'),
+    ("Last Run:", 'last_run'),
+    ("Next Run:", 'next_run'),
+    ("Last Result:", 'last_result'),
+)
+
+_SCHEDULE_ROWS = (
+    ("Schedule Type:", 'schedule_type'),
+    ("Schedule:", 'schedule'),
+    ("Start Time:", 'start_time'),
+    ("Start Date:", 'start_date'),
+    ("End Date:", 'end_date'),
+    ("Days:", 'days'),
+    ("Months:", 'months'),
+)
+
+_SETTINGS_ROWS = (
+    ("Run As User:", 'run_as_user'),
+    ("Task State:", 'scheduled_task_state'),
+    ("Power Management:", 'power_management'),
+    ("Idle Time:", 'idle_time'),
+    ("Delete if not rescheduled:", 'delete_task_if_not_rescheduled'),
+    ("Stop if runs too long:", 'stop_task_if_runs_x_hours_and_x_mins'),
+)
+
+# Trigger types offered when creating a task
+_TRIGGER_TYPES = (
+    "Daily",
+    "Weekly",
+    "Monthly",
+    "Once",
+    "At startup",
+    "At logon",
+    "When idle",
+)
+
 class TaskDetailsDialog(QDialog):
     """Dialog for viewing detailed task information."""
     
+    # Shared by every instance so opening a dialog does not set up a logger
+    logger = setup_logger("TaskDetailsDialog")
+    
     def __init__(self, task_data, parent=None):
         super().__init__(parent)
         self.task_data = task_data
-        self.logger = setup_logger(self.__class__.__name__)
         self.setup_ui()
         
     def setup_ui(self):
@@ -23,26 +66,72 @@ class TaskDetailsDialog(QDialog):
         
         layout = QVBoxLayout(self)
         
-        # Create tab widget for different sections
-        tab_widget = QTabWidget()
+        # Create tab widget for different sections. Tab contents are built
+        # the first time a tab is shown.
+        self.tab_widget = QTabWidget()
+        self._tab_builders = [
+            ("General", self._build_general),
+            ("Actions", self._build_actions),
+            ("Schedule", self._build_schedule),
+            ("Settings", self._build_settings),
+        ]
+        self._built_tabs = set()
+        for title, _ in self._tab_builders:
+            self.tab_widget.addTab(QWidget(), title)
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
+        
+        layout.addWidget(self.tab_widget)
         
-        # General tab
-        general_tab = QWidget()
-        general_layout = QFormLayout(general_tab)
+        # Button layout
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
         
-        general_layout.addRow("Name:", QLabel(self.task_data.get('name', 'N/A')))
-        general_layout.addRow("Status:", QLabel(self.task_data.get('status', 'N/A')))
-        general_layout.addRow("Author:", QLabel(self.task_data.get('author', 'N/A')))
-        general_layout.addRow("Description:", QLabel(self.task_data.get('comment', 'N/A')))
-        general_layout.addRow("Last Run:", QLabel(self.task_data.get('last_run', 'N/A')))
-        general_layout.addRow("Next Run:", QLabel(self.task_data.get('next_run', 'N/A')))
-        general_layout.addRow("Last Result:", QLabel(self.task_data.get('last_result', 'N/A')))
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+        
+        layout.addLayout(button_layout)
         
-        tab_widget.addTab(general_tab, "General")
+        self._ensure_tab(self.tab_widget.currentIndex())
         
-        # Actions tab
-        actions_tab = QWidget()
-        actions_layout = QVBoxLayout(actions_tab)
+    def _ensure_tab(self, index):
+        """Build the contents of a tab if it has not been built yet.
+        
+        Args:
+            index: Tab index
+        """
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        self._tab_builders[index][1](self.tab_widget.widget(index))
+        
+    def _add_rows(self, layout, rows):
+        """Add a label row for each task field.
+        
+        Args:
+            layout: Form layout to fill
+            rows: (label, task_data key) pairs
+        """
+        for label, key in rows:
+            layout.addRow(label, QLabel(self.task_data.get(key, 'N/A')))
+            
+    def _build_general(self, tab):
+        """Build the General tab.
+        
+        Args:
+            tab: Tab page widget
+        """
+        general_layout = QFormLayout(tab)
+        
+        self._add_rows(general_layout, _GENERAL_ROWS)
+        
+    def _build_actions(self, tab):
+        """Build the Actions tab.
+        
+        Args:
+            tab: Tab page widget
+        """
+        actions_layout = QVBoxLayout(tab)
         
         actions_layout.addWidget(QLabel("Task to Run:"))
         task_command = QTextEdit()
@@ -56,53 +145,34 @@ class TaskDetailsDialog(QDialog):
         actions_layout.addWidget(start_in_label)
         
         actions_layout.addStretch()
-        tab_widget.addTab(actions_tab, "Actions")
-        
-        # Schedule tab
-        schedule_tab = QWidget()
-        schedule_layout = QFormLayout(schedule_tab)
-        
-        schedule_layout.addRow("Schedule Type:", QLabel(self.task_data.get('schedule_type', 'N/A')))
-        schedule_layout.addRow("Schedule:", QLabel(self.task_data.get('schedule', 'N/A')))
-        schedule_layout.addRow("Start Time:", QLabel(self.task_data.get('start_time', 'N/A')))
-        schedule_layout.addRow("Start Date:", QLabel(self.task_data.get('start_date', 'N/A')))
-        schedule_layout.addRow("End Date:", QLabel(self.task_data.get('end_date', 'N/A')))
-        schedule_layout.addRow("Days:", QLabel(self.task_data.get('days', 'N/A')))
-        schedule_layout.addRow("Months:", QLabel(self.task_data.get('months', 'N/A')))
-        
-        tab_widget.addTab(schedule_tab, "Schedule")
-        
-        # Settings tab
-        settings_tab = QWidget()
-        settings_layout = QFormLayout(settings_tab)
         
-        settings_layout.addRow("Run As User:", QLabel(self.task_data.get('run_as_user', 'N/A')))
-        settings_layout.addRow("Task State:", QLabel(self.task_data.get('scheduled_task_state', 'N/A')))
-        settings_layout.addRow("Power Management:", QLabel(self.task_data.get('power_management', 'N/A')))
-        settings_layout.addRow("Idle Time:", QLabel(self.task_data.get('idle_time', 'N/A')))
-        settings_layout.addRow("Delete if not rescheduled:", QLabel(self.task_data.get('delete_task_if_not_rescheduled', 'N/A')))
-        settings_layout.addRow("Stop if runs too long:", QLabel(self.task_data.get('stop_task_if_runs_x_hours_and_x_mins', 'N/A')))
+    def _build_schedule(self, tab):
+        """Build the Schedule tab.
         
-        tab_widget.addTab(settings_tab, "Settings")
+        Args:
+            tab: Tab page widget
+        """
+        schedule_layout = QFormLayout(tab)
         
-        layout.addWidget(tab_widget)
+        self._add_rows(schedule_layout, _SCHEDULE_ROWS)
         
-        # Button layout
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
+    def _build_settings(self, tab):
+        """Build the Settings tab.
         
-        close_button = QPushButton("Close")
-        close_button.clicked.connect(self.accept)
-        button_layout.addWidget(close_button)
+        Args:
+            tab: Tab page widget
+        """
+        settings_layout = QFormLayout(tab)
         
-        layout.addLayout(button_layout)
+        self._add_rows(settings_layout, _SETTINGS_ROWS)
 
 class CreateTaskDialog(QDialog):
     """Dialog for creating a new scheduled task."""
     
+    logger = setup_logger("CreateTaskDialog")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.logger = setup_logger(self.__class__.__name__)
         self.setup_ui()
         
     def setup_ui(self):
@@ -145,15 +215,7 @@ class CreateTaskDialog(QDialog):
         trigger_layout = QFormLayout(trigger_group)
         
         self.trigger_type = QComboBox()
-        self.trigger_type.addItems([
-            "Daily",
-            "Weekly", 
-            "Monthly",
-            "Once",
-            "At startup",
-            "At logon",
-            "When idle"
-        ])
+        self.trigger_type.addItems(_TRIGGER_TYPES)
         trigger_layout.addRow("Trigger Type:", self.trigger_type)
         
         self.start_time = QDateTimeEdit(QDateTime.currentDateTime())
@@ -1,61 +1,384 @@
 """Task Scheduler manager for Windows scheduled tasks."""
+import csv
+import functools
+import os
+import re
 import subprocess
+import sys
 import json
-import xml.etree.ElementTree as ET
 from datetime import datetime
+import pythoncom
+import pywintypes
+import win32com.client
 from src.core.logger import setup_logger
 
+# Use lxml's faster parser when it is installed
+try:
+    from lxml import etree as ET
+    # Whitespace-only text and comments are dropped while parsing, so only
+    # elements are left as children, as with ElementTree
+    _XML_PARSER = ET.XMLParser(remove_blank_text=True, remove_comments=True)
+    _XML_COMMENT_PARSER = ET.XMLParser(remove_blank_text=True)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _XML_PARSER = None
+    _XML_COMMENT_PARSER = None
+
+# schtasks declares UTF-16 although its output is decoded to str already,
+# and lxml refuses str input that carries an encoding declaration
+_XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+
+# Namespace-qualified tags of the task definition schema
+_NS = '{http://schemas.microsoft.com/windows/2004/02/mit/task}'
+_REG_INFO = f'{_NS}RegistrationInfo'
+_AUTHOR = f'{_NS}Author'
+_DESCRIPTION = f'{_NS}Description'
+_TRIGGERS = f'{_NS}Triggers'
+_ACTIONS = f'{_NS}Actions'
+_COMMAND = f'{_NS}Command'
+_ARGUMENTS = f'{_NS}Arguments'
+# Top-level sections of a task definition collected by TaskDetails
+_SECTIONS = frozenset((_TRIGGERS, _ACTIONS))
+_AUTHOR_PATH = f'{_REG_INFO}/{_AUTHOR}'
+_DESCRIPTION_PATH = f'{_REG_INFO}/{_DESCRIPTION}'
+
+# With lxml the text selectors are compiled once into XPath evaluators;
+# ElementTree falls back to findtext with the paths above
+if _XML_PARSER is not None:
+    _XPATH_NS = {'t': _NS[1:-1]}
+    _XP_AUTHOR = ET.XPath('t:RegistrationInfo/t:Author/text()', namespaces=_XPATH_NS, smart_strings=False)
+    _XP_DESCRIPTION = ET.XPath('t:RegistrationInfo/t:Description/text()', namespaces=_XPATH_NS, smart_strings=False)
+    _XP_COMMAND = ET.XPath('t:Command/text()', namespaces=_XPATH_NS, smart_strings=False)
+    _XP_ARGUMENTS = ET.XPath('t:Arguments/text()', namespaces=_XPATH_NS, smart_strings=False)
+else:
+    _XP_AUTHOR = _XP_DESCRIPTION = _XP_COMMAND = _XP_ARGUMENTS = None
+
+# Task dictionary key -> column of the verbose schtasks CSV output
+_FIELD_MAP = {
+    'name': 'TaskName',
+    'status': 'Status',
+    'next_run': 'Next Run Time',
+    'last_run': 'Last Run Time',
+    'last_result': 'Last Result',
+    'author': 'Author',
+    'task_to_run': 'Task To Run',
+    'start_in': 'Start In',
+    'comment': 'Comment',
+    'scheduled_task_state': 'Scheduled Task State',
+    'idle_time': 'Idle Time',
+    'power_management': 'Power Management',
+    'run_as_user': 'Run As User',
+    'delete_task_if_not_rescheduled': 'Delete Task If Not Rescheduled',
+    'stop_task_if_runs_x_hours_and_x_mins': 'Stop Task If Runs X Hours and X Mins',
+    'schedule': 'Schedule',
+    'schedule_type': 'Schedule Type',
+    'start_time': 'Start Time',
+    'start_date': 'Start Date',
+    'end_date': 'End Date',
+    'days': 'Days',
+    'months': 'Months',
+    'repeat_every': 'Repeat: Every',
+    'repeat_until_time': 'Repeat: Until: Time',
+    'repeat_until_duration': 'Repeat: Until: Duration',
+    'repeat_stop_if_still_running': 'Repeat: Stop If Still Running'
+}
+
+# Columns with only a handful of distinct values, interned so that rows
+# share one string object per value
+_LOW_CARDINALITY = {
+    'Status', 'Power Management', 'Scheduled Task State', 'Schedule Type',
+    'Run As User', 'Author', 'Last Result'
+}
+
+
+def _parse_xml(text, keep_comments=False):
+    """Parse XML printed by schtasks.
+    
+    Args:
+        text: XML text
+        keep_comments: Whether comments are kept as elements
+        
+    Returns:
+        Root element
+    """
+    text = _XML_DECLARATION.sub('', text, count=1)
+    if not keep_comments:
+        return ET.fromstring(text, _XML_PARSER)
+    if _XML_COMMENT_PARSER is None:
+        # ElementTree parsers can only be used once
+        return ET.fromstring(text, ET.XMLParser(target=ET.TreeBuilder(insert_comments=True)))
+    return ET.fromstring(text, _XML_COMMENT_PARSER)
+
+
+# schtasks is started by absolute path, without a console window
+_SCHTASKS = os.path.join(os.environ.get('SystemRoot', r'C:\Windows'), 'System32', 'schtasks.exe')
+_STARTUPINFO = subprocess.STARTUPINFO()
+_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+
+def _run_schtasks(*args):
+    """Run schtasks.exe and capture its output.
+    
+    Args:
+        *args: Command line arguments
+        
+    Returns:
+        subprocess.CompletedProcess: Finished process with text output
+        
+    Raises:
+        subprocess.CalledProcessError: If schtasks fails
+    """
+    return subprocess.run(
+        [_SCHTASKS, *args], capture_output=True, text=True, check=True,
+        startupinfo=_STARTUPINFO, creationflags=subprocess.CREATE_NO_WINDOW
+    )
+
+
+def _popen_schtasks(*args):
+    """Start schtasks.exe with its output readable as it is written.
+    
+    Args:
+        *args: Command line arguments
+        
+    Returns:
+        subprocess.Popen: Running process with a text stdout pipe
+    """
+    return subprocess.Popen(
+        [_SCHTASKS, *args], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, startupinfo=_STARTUPINFO, creationflags=subprocess.CREATE_NO_WINDOW
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _query_task_xml(task_name):
+    """Get the XML definition of a task.
+    
+    Results are cached until SchedulerManager.invalidate is called.
+    
+    Args:
+        task_name: Full task name
+        
+    Returns:
+        str: Task XML printed by schtasks
+        
+    Raises:
+        subprocess.CalledProcessError: If schtasks fails
+    """
+    return _run_schtasks('/query', '/tn', task_name, '/xml').stdout
+
+
+def _child_elements(parent):
+    """Get the element children of an element, skipping comments.
+    
+    Args:
+        parent: Parent element, or None
+        
+    Returns:
+        list: Child elements
+    """
+    if parent is None:
+        return []
+    # Prefetched definitions keep their comments
+    return [child for child in parent if child.tag is not ET.Comment]
+
+
+def _find_text(element, path, xpath):
+    """Get the text of the first element matching a path.
+    
+    Args:
+        element: Element the path is relative to
+        path: ElementTree path
+        xpath: Compiled lxml XPath returning the same text, or None
+        
+    Returns:
+        str: Element text, or None if there is no matching element
+    """
+    if xpath is None:
+        return element.findtext(path)
+    texts = xpath(element)
+    return texts[0] if texts else None
+
+
+# Namespace-qualified tag -> local name, filled as tags are seen
+_LOCAL_NAMES = {}
+
+
+def _type_name(element):
+    """Get the tag of an element without its namespace.
+    
+    Args:
+        element: Trigger or action element
+        
+    Returns:
+        str: Tag name, e.g. "TimeTrigger" or "Exec"
+    """
+    tag = element.tag
+    name = _LOCAL_NAMES.get(tag)
+    if name is None:
+        name = _LOCAL_NAMES[tag] = tag.rpartition('}')[2]
+    return name
+
+
+class TaskDetails:
+    """Details of a scheduled task, read from its XML definition on demand.
+    
+    The definition is parsed on first access and each detail is extracted
+    only when it is read, so callers that need one field do not pay for
+    walking every trigger and action.
+    """
+    
+    logger = setup_logger("TaskDetails")
+    
+    def __init__(self, name, xml=None, root=None):
+        """Initialize task details.
+        
+        Args:
+            name: Full task name
+            xml: Task XML printed by schtasks
+            root: Already parsed <Task> element, used instead of xml
+        """
+        self.name = name
+        self._xml = xml
+        if root is not None:
+            self.__dict__['_root'] = root
+            
+    @functools.cached_property
+    def _root(self):
+        try:
+            return _parse_xml(self._xml)
+        except Exception as e:
+            self.logger.debug(f"Error parsing task XML for {self.name}: {e}")
+            return None
+        finally:
+            # The raw XML is not needed once it has been parsed
+            self._xml = None
+            
+    @functools.cached_property
+    def author(self):
+        """str: Task author, or None if not set."""
+        if self._root is None:
+            return None
+        return _find_text(self._root, _AUTHOR_PATH, _XP_AUTHOR)
+        
+    @functools.cached_property
+    def description(self):
+        """str: Task description, or None if not set."""
+        if self._root is None:
+            return None
+        return _find_text(self._root, _DESCRIPTION_PATH, _XP_DESCRIPTION)
+        
+    @functools.cached_property
+    def _sections(self):
+        # One pass over the top-level children instead of a find() per section
+        sections = {}
+        if self._root is not None:
+            for child in self._root:
+                if child.tag in _SECTIONS:
+                    sections.setdefault(child.tag, child)
+        return sections
+        
+    @functools.cached_property
+    def triggers(self):
+        """list: Trigger dictionaries with their type, or None without triggers."""
+        triggers = self._sections.get(_TRIGGERS)
+        if triggers is None:
+            return None
+        return [{'type': _type_name(trigger)} for trigger in _child_elements(triggers)]
+        
+    @functools.cached_property
+    def actions(self):
+        """list: Action dictionaries with type, command and arguments, or None."""
+        actions = self._sections.get(_ACTIONS)
+        if actions is None:
+            return None
+        result = []
+        for action in _child_elements(actions):
+            action_info = {'type': _type_name(action)}
+            command = _find_text(action, _COMMAND, _XP_COMMAND)
+            if command is not None:
+                action_info['command'] = command
+            arguments = _find_text(action, _ARGUMENTS, _XP_ARGUMENTS)
+            if arguments is not None:
+                action_info['arguments'] = arguments
+            result.append(action_info)
+        return result
+        
+    def to_dict(self):
+        """Get all details as a dictionary.
+        
+        Only details present in the definition are included.
+        
+        Returns:
+            dict: Task details keyed by 'name', 'author', 'description',
+                'triggers' and 'actions'
+        """
+        details = {'name': self.name}
+        for key in ('author', 'description', 'triggers', 'actions'):
+            value = getattr(self, key)
+            if value is not None:
+                details[key] = value
+        return details
+
+
 class SchedulerManager:
     """Manager for Windows Task Scheduler operations."""
     
+    logger = setup_logger("SchedulerManager")
+    
     def __init__(self):
-        self.logger = setup_logger(self.__class__.__name__)
+        # Task name -> parsed <Task> definition from the last prefetch
+        self._task_xml_cache = None
         
     def get_scheduled_tasks(self):
-        """Get list of all scheduled tasks."""
-        try:
-            # Use schtasks command to get task list
-            result = subprocess.run([
-                'schtasks', '/query', '/fo', 'csv', '/v'
-            ], capture_output=True, text=True, check=True)
+        """Get the names, next run times and states of all scheduled tasks.
+        
+        Only the three columns of the short schtasks listing are queried.
+        Use get_scheduled_tasks_verbose for every column.
+        
+        Returns:
+            list: Task dictionaries with 'name', 'next_run' and 'status'
+        """
+        return self._query_tasks(verbose=False)
+        
+    def get_scheduled_tasks_verbose(self):
+        """Get list of all scheduled tasks with every schtasks column.
+        
+        Returns:
+            list: Task dictionaries with one key per _FIELD_MAP entry
+        """
+        return self._query_tasks(verbose=True)
+        
+    def _query_tasks(self, verbose):
+        """Query the task list from schtasks.
+        
+        Args:
+            verbose: Whether every column is queried or only the short listing
             
+        Returns:
+            list: Task dictionaries, empty on failure
+        """
+        args = ('/query', '/fo', 'csv', '/v') if verbose else ('/query', '/fo', 'csv')
+        try:
             tasks = []
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                headers = [h.strip('"') for h in lines[0].split('","')]
-                for line in lines[1:]:
-                    if line.strip():
-                        values = [v.strip('"') for v in line.split('","')]
-                        if len(values) >= len(headers):
-                            task_data = dict(zip(headers, values))
-                            tasks.append({
-                                'name': task_data.get('TaskName', ''),
-                                'status': task_data.get('Status', ''),
-                                'next_run': task_data.get('Next Run Time', ''),
-                                'last_run': task_data.get('Last Run Time', ''),
-                                'last_result': task_data.get('Last Result', ''),
-                                'author': task_data.get('Author', ''),
-                                'task_to_run': task_data.get('Task To Run', ''),
-                                'start_in': task_data.get('Start In', ''),
-                                'comment': task_data.get('Comment', ''),
-                                'scheduled_task_state': task_data.get('Scheduled Task State', ''),
-                                'idle_time': task_data.get('Idle Time', ''),
-                                'power_management': task_data.get('Power Management', ''),
-                                'run_as_user': task_data.get('Run As User', ''),
-                                'delete_task_if_not_rescheduled': task_data.get('Delete Task If Not Rescheduled', ''),
-                                'stop_task_if_runs_x_hours_and_x_mins': task_data.get('Stop Task If Runs X Hours and X Mins', ''),
-                                'schedule': task_data.get('Schedule', ''),
-                                'schedule_type': task_data.get('Schedule Type', ''),
-                                'start_time': task_data.get('Start Time', ''),
-                                'start_date': task_data.get('Start Date', ''),
-                                'end_date': task_data.get('End Date', ''),
-                                'days': task_data.get('Days', ''),
-                                'months': task_data.get('Months', ''),
-                                'repeat_every': task_data.get('Repeat: Every', ''),
-                                'repeat_until_time': task_data.get('Repeat: Until: Time', ''),
-                                'repeat_until_duration': task_data.get('Repeat: Until: Duration', ''),
-                                'repeat_stop_if_still_running': task_data.get('Repeat: Stop If Still Running', '')
-                            })
+            # Rows are parsed while schtasks is still writing the list
+            with _popen_schtasks(*args) as process:
+                # The csv module handles quoted commas and quotes inside values
+                reader = csv.DictReader(process.stdout, restval='')
+                first_column = reader.fieldnames[0] if reader.fieldnames else None
+                for row in reader:
+                    # schtasks repeats the header row for every task folder
+                    if row[first_column] == first_column:
+                        continue
+                    for column in _LOW_CARDINALITY:
+                        value = row.get(column)
+                        if value:
+                            row[column] = sys.intern(value)
+                    if verbose:
+                        tasks.append({key: row.get(column, '') for key, column in _FIELD_MAP.items()})
+                    else:
+                        tasks.append({key: row[column] for key, column in _FIELD_MAP.items() if column in row})
+            if process.returncode:
+                raise subprocess.CalledProcessError(process.returncode, process.args)
             
             self.logger.debug(f"Retrieved {len(tasks)} scheduled tasks")
             return tasks
@@ -68,67 +391,21 @@ class SchedulerManager:
             return []
     
     def get_task_details(self, task_name):
-        """Get detailed information about a specific task."""
+        """Get detailed information about a specific task.
+        
+        Args:
+            task_name: Full task name
+            
+        Returns:
+            TaskDetails: Lazily parsed task details, or None on failure
+        """
         try:
-            # Get task XML definition
-            result = subprocess.run([
-                'schtasks', '/query', '/tn', task_name, '/xml'
-            ], capture_output=True, text=True, check=True)
-            
-            # Parse XML to get detailed information
-            root = ET.fromstring(result.stdout)
-            
-            # Extract key information from XML
-            details = {
-                'name': task_name,
-                'xml_content': result.stdout
-            }
-            
-            # Try to extract common elements
-            try:
-                registration_info = root.find('.//{http://schemas.microsoft.com/windows/2004/02/mit/task}RegistrationInfo')
-                if registration_info is not None:
-                    author = registration_info.find('.//{http://schemas.microsoft.com/windows/2004/02/mit/task}Author')
-                    if author is not None:
-                        details['author'] = author.text
-                    
-                    description = registration_info.find('.//{http://schemas.microsoft.com/windows/2004/02/mit/task}Description')
-                    if description is not None:
-                        details['description'] = description.text
-                
-                # Get triggers
-                triggers = root.find('.//{http://schemas.microsoft.com/windows/2004/02/mit/task}Triggers')
-                if triggers is not None:
-                    details['triggers'] = []
-                    for trigger in triggers:
-                        trigger_info = {
-                            'type': trigger.tag.split('}')[-1] if '}' in trigger.tag else trigger.tag
-                        }
-                        # Add trigger-specific details as needed
-                        details['triggers'].append(trigger_info)
-                
-                # Get actions
-                actions = root.find('.//{http://schemas.microsoft.com/windows/2004/02/mit/task}Actions')
-                if actions is not None:
-                    details['actions'] = []
-                    for action in actions:
-                        action_info = {
-                            'type': action.tag.split('}')[-1] if '}' in action.tag else action.tag
-                        }
-                        exec_elem = action.find('.//{http://schemas.microsoft.com/windows/2004/02/mit/task}Command')
-                        if exec_elem is not None:
-                            action_info['command'] = exec_elem.text
-                        
-                        args_elem = action.find('.//{http://schemas.microsoft.com/windows/2004/02/mit/task}Arguments')
-                        if args_elem is not None:
-                            action_info['arguments'] = args_elem.text
-                            
-                        details['actions'].append(action_info)
-                        
-            except Exception as e:
-                self.logger.debug(f"Error parsing task XML details: {e}")
-            
-            return details
+            # Use the definition from the last prefetch if there is one
+            root = self._task_xml_cache.get(task_name) if self._task_xml_cache else None
+            if root is not None:
+                return TaskDetails(task_name, root=root)
+            # The XML is only parsed once a detail is read
+            return TaskDetails(task_name, xml=_query_task_xml(task_name))
             
         except subprocess.CalledProcessError as e:
             self.logger.error(f"Failed to get task details for {task_name}: {e}")
@@ -137,70 +414,239 @@ class SchedulerManager:
             self.logger.error(f"Error getting task details for {task_name}: {e}")
             return None
     
-    def run_task(self, task_name):
-        """Run a scheduled task immediately."""
+    def prefetch_task_details(self):
+        """Load the definitions of all tasks with a single schtasks call.
+        
+        Following get_task_details calls read the loaded definitions instead
+        of querying each task, until invalidate is called.
+        
+        Returns:
+            bool: True if the definitions were loaded
+        """
         try:
-            subprocess.run([
-                'schtasks', '/run', '/tn', task_name
-            ], check=True, capture_output=True)
+            result = _run_schtasks('/query', '/xml', 'ONE')
             
-            self.logger.info(f"Successfully ran task: {task_name}")
+            root = _parse_xml(result.stdout, keep_comments=True)
+            
+            # Every <Task> is preceded by a comment holding the task's full name
+            cache = {}
+            task_name = None
+            for child in root:
+                if child.tag is ET.Comment:
+                    task_name = (child.text or '').strip()
+                elif task_name:
+                    cache[task_name] = child
+                    task_name = None
+                    
+            self._task_xml_cache = cache
+            self.logger.debug(f"Prefetched {len(cache)} task definitions")
             return True
             
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to run task {task_name}: {e}")
+            self.logger.error(f"Failed to prefetch task definitions: {e}")
             return False
         except Exception as e:
-            self.logger.error(f"Error running task {task_name}: {e}")
+            self.logger.error(f"Error prefetching task definitions: {e}")
             return False
+            
+    def invalidate(self):
+        """Drop cached task data so that it is queried again."""
+        self._task_xml_cache = None
+        _query_task_xml.cache_clear()
     
-    def enable_task(self, task_name):
-        """Enable a scheduled task."""
-        try:
-            subprocess.run([
-                'schtasks', '/change', '/tn', task_name, '/enable'
-            ], check=True, capture_output=True)
+    def _get_folder_and_name(self, service, task_name):
+        """Split a full task name into its folder and its name.
+        
+        Args:
+            service: Connected Schedule.Service COM object
+            task_name: Full task name, such as \\Folder\\Task
             
-            self.logger.info(f"Successfully enabled task: {task_name}")
+        Returns:
+            tuple: (ITaskFolder COM object, task name within the folder)
+        """
+        folder_path, _, name = task_name.rpartition('\\')
+        return service.GetFolder(folder_path or '\\'), name
+        
+    def _get_registered_task(self, service, task_name):
+        """Get a registered task.
+        
+        Args:
+            service: Connected Schedule.Service COM object
+            task_name: Full task name
+            
+        Returns:
+            IRegisteredTask COM object
+        """
+        folder, name = self._get_folder_and_name(service, task_name)
+        return folder.GetTask(name)
+        
+    def _apply_to_task(self, service, task_name, operation, verb, past):
+        """Apply an operation to one task and log the outcome.
+        
+        Args:
+            service: Connected Schedule.Service COM object
+            task_name: Full task name
+            operation: Callable that performs the operation, called with
+                the service and the task name
+            verb: Verb for log messages, such as 'enable'
+            past: Past tense of verb, such as 'enabled'
+            
+        Returns:
+            bool: True if the operation succeeded
+        """
+        try:
+            operation(service, task_name)
+            self.logger.info(f"Successfully {past} task: {task_name}")
             return True
+        except pywintypes.com_error as e:
+            self.logger.error(f"Failed to {verb} task {task_name}: {e}")
+        except Exception as e:
+            self.logger.error(f"Error trying to {verb} task {task_name}: {e}")
+        return False
+        
+    def _apply_with_service(self, task_names, operation, verb, past):
+        """Connect to the Task Scheduler service and apply an operation.
+        
+        COM must be initialized on the calling thread. The connection is
+        released when this method returns.
+        
+        Args:
+            task_names: List of full task names
+            operation: Callable that performs the operation, called with
+                the service and a task name
+            verb: Verb for log messages, such as 'enable'
+            past: Past tense of verb, such as 'enabled'
             
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to enable task {task_name}: {e}")
-            return False
+        Returns:
+            dict: Task name -> True if the operation succeeded
+        """
+        service = win32com.client.Dispatch('Schedule.Service')
+        service.Connect()
+        return {
+            task_name: self._apply_to_task(service, task_name, operation, verb, past)
+            for task_name in task_names
+        }
+        
+    def _apply_to_tasks(self, task_names, operation, verb, past):
+        """Apply an operation to several tasks over one service connection.
+        
+        Args:
+            task_names: Full task names
+            operation: Callable that performs the operation, called with
+                the service and a task name
+            verb: Verb for log messages, such as 'enable'
+            past: Past tense of verb, such as 'enabled'
+            
+        Returns:
+            dict: Task name -> True if the operation succeeded
+        """
+        task_names = list(task_names)
+        # COM is set up for this call only; the service and every object
+        # obtained from it are released before COM is uninitialized
+        pythoncom.CoInitialize()
+        try:
+            results = self._apply_with_service(task_names, operation, verb, past)
         except Exception as e:
-            self.logger.error(f"Error enabling task {task_name}: {e}")
-            return False
+            self.logger.error(f"Failed to connect to the Task Scheduler service: {e}")
+            results = {task_name: False for task_name in task_names}
+        finally:
+            pythoncom.CoUninitialize()
+                
+        if any(results.values()):
+            self.invalidate()
+        return results
+        
+    def _run_registered_task(self, service, task_name):
+        """Start a registered task.
+        
+        Args:
+            service: Connected Schedule.Service COM object
+            task_name: Full task name
+        """
+        self._get_registered_task(service, task_name).Run('')
+        
+    def _delete_registered_task(self, service, task_name):
+        """Delete a registered task.
+        
+        Args:
+            service: Connected Schedule.Service COM object
+            task_name: Full task name
+        """
+        folder, name = self._get_folder_and_name(service, task_name)
+        folder.DeleteTask(name, 0)
+        
+    def _set_task_enabled(self, service, task_name, enabled):
+        """Enable or disable a registered task.
+        
+        Args:
+            service: Connected Schedule.Service COM object
+            task_name: Full task name
+            enabled: New enabled state
+        """
+        self._get_registered_task(service, task_name).Enabled = enabled
+        
+    def run_tasks(self, task_names):
+        """Run several scheduled tasks immediately.
+        
+        Args:
+            task_names: Full task names
+            
+        Returns:
+            dict: Task name -> True if the task was started
+        """
+        return self._apply_to_tasks(
+            task_names, self._run_registered_task, "run", "ran")
+        
+    def enable_tasks(self, task_names):
+        """Enable several scheduled tasks.
+        
+        Args:
+            task_names: Full task names
+            
+        Returns:
+            dict: Task name -> True if the task was enabled
+        """
+        return self._apply_to_tasks(
+            task_names, lambda service, name: self._set_task_enabled(service, name, True),
+            "enable", "enabled")
+        
+    def disable_tasks(self, task_names):
+        """Disable several scheduled tasks.
+        
+        Args:
+            task_names: Full task names
+            
+        Returns:
+            dict: Task name -> True if the task was disabled
+        """
+        return self._apply_to_tasks(
+            task_names, lambda service, name: self._set_task_enabled(service, name, False),
+            "disable", "disabled")
+        
+    def delete_tasks(self, task_names):
+        """Delete several scheduled tasks.
+        
+        Args:
+            task_names: Full task names
+            
+        Returns:
+            dict: Task name -> True if the task was deleted
+        """
+        return self._apply_to_tasks(
+            task_names, self._delete_registered_task, "delete", "deleted")
+        
+    def run_task(self, task_name):
+        """Run a scheduled task immediately."""
+        return self.run_tasks([task_name])[task_name]
+    
+    def enable_task(self, task_name):
+        """Enable a scheduled task."""
+        return self.enable_tasks([task_name])[task_name]
     
     def disable_task(self, task_name):
         """Disable a scheduled task."""
-        try:
-            subprocess.run([
-                'schtasks', '/change', '/tn', task_name, '/disable'
-            ], check=True, capture_output=True)
-            
-            self.logger.info(f"Successfully disabled task: {task_name}")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to disable task {task_name}: {e}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Error disabling task {task_name}: {e}")
-            return False
+        return self.disable_tasks([task_name])[task_name]
     
     def delete_task(self, task_name):
         """Delete a scheduled task."""
-        try:
-            subprocess.run([
-                'schtasks', '/delete', '/tn', task_name, '/f'
-            ], check=True, capture_output=True)
-            
-            self.logger.info(f"Successfully deleted task: {task_name}")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to delete task {task_name}: {e}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Error deleting task {task_name}: {e}")
-            return False
+        return self.delete_tasks([task_name])[task_name]
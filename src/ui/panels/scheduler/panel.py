@@ -1,21 +1,80 @@
 """Scheduler panel for Windows Task Scheduler management."""
 from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
                           QMessageBox, QSplitter, QTextEdit, QGroupBox)
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
 from src.ui.base.base_panel import BasePanel
 from .manager import SchedulerManager
 from .tree_widget import SchedulerTreeWidget
 from .dialogs import TaskDetailsDialog, CreateTaskDialog, ConfirmTaskActionDialog
 from src.core.logger import setup_logger
 
+class TaskActionWorker(QThread):
+    """Worker thread for running task actions in the background."""
+    
+    action_finished = pyqtSignal(str, dict)  # action, task name -> success
+    
+    def __init__(self, manager, action, task_names):
+        super().__init__()
+        self.manager = manager
+        self.action = action
+        self.task_names = task_names
+        
+    def run(self):
+        """Apply the action to the tasks in background thread."""
+        operations = {
+            'run': self.manager.run_tasks,
+            'enable': self.manager.enable_tasks,
+            'disable': self.manager.disable_tasks,
+            'delete': self.manager.delete_tasks
+        }
+        try:
+            results = operations[self.action](self.task_names)
+        except Exception:
+            results = {name: False for name in self.task_names}
+        self.action_finished.emit(self.action, results)
+
+class SchedulerRefreshWorker(QThread):
+    """Worker thread for querying the scheduled task list in the background."""
+    
+    tasks_ready = pyqtSignal()  # snapshot and error hold the result
+    
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+        # Tasks of the last query, and its error message if it failed
+        self.snapshot = []
+        self.error = None
+        
+    def run(self):
+        """Query the task list in background thread."""
+        try:
+            self.manager.invalidate()
+            self.snapshot = self.manager.get_scheduled_tasks_verbose()
+            self.error = None
+        except Exception as e:
+            self.snapshot = []
+            self.error = str(e)
+        self.tasks_ready.emit()
+
 class SchedulerPanel(BasePanel):
     """Panel for managing Windows scheduled tasks."""
     
+    # Message shown when an action succeeds
+    ACTION_DONE = {
+        'run': 'started',
+        'enable': 'enabled',
+        'disable': 'disabled',
+        'delete': 'deleted'
+    }
+    
     def __init__(self, parent=None):
         self.manager = SchedulerManager()
+        self.action_worker = None
         
         # Initialize imported config items
         self.imported_config_items = set()
+        # Plain names of the imported tasks, looked up when highlighting
+        self.imported_task_names = set()
         
         super().__init__(parent)
         
@@ -37,6 +96,18 @@ class SchedulerPanel(BasePanel):
         
         self.main_layout.addWidget(splitter)
         
+        # Refreshes requested after changes are coalesced into one
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)
+        self._refresh_timer.timeout.connect(self.refresh_tasks)
+        
+        # The task list is queried off the UI thread
+        self.refresh_worker = SchedulerRefreshWorker(self.manager)
+        self.refresh_worker.tasks_ready.connect(self.on_tasks_ready)
+        self.refresh_worker.finished.connect(self.on_refresh_finished)
+        self._refresh_pending = False
+        
         # Load initial data with deferred initialization
         QTimer.singleShot(1000, self.deferred_initialization)
         
@@ -97,7 +168,8 @@ class SchedulerPanel(BasePanel):
         self.info_text = QTextEdit()
         self.info_text.setReadOnly(True)
         self.info_text.setMaximumHeight(150)
-        self.info_text.setPlainText("Select a task to view details...")
+        self._last_info_text = None
+        self.set_info_text("Select a task to view details...")
         layout.addWidget(self.info_text)
         
         return bottom_widget
@@ -117,33 +189,57 @@ class SchedulerPanel(BasePanel):
             self.logger.error(f"Error during SchedulerPanel initialization: {e}")
             
     def refresh_tasks(self):
-        """Refresh the list of scheduled tasks."""
-        try:
-            tasks = self.manager.get_scheduled_tasks()
-            self.task_tree.populate_tasks(tasks)
-            
-            # Highlight imported config items
-            self.highlight_imported_tasks()
+        """Refresh the list of scheduled tasks in a background thread."""
+        if self.refresh_worker.isRunning():
+            # Query again once the running refresh is done
+            self._refresh_pending = True
+            return
+        self.refresh_worker.start()
+        
+    def on_refresh_finished(self):
+        """Start a refresh that was requested while the last one was running."""
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_worker.start()
             
-            self.info_text.setPlainText(f"Loaded {len(tasks)} scheduled tasks.")
+    def on_tasks_ready(self):
+        """Show the task list queried by the refresh worker."""
+        try:
+            if self.refresh_worker.error:
+                raise RuntimeError(self.refresh_worker.error)
+            tasks = self.refresh_worker.snapshot
+            
+            # Fill the tree without repainting, re-sorting or emitting
+            # signals for every inserted item
+            self.task_tree.setUpdatesEnabled(False)
+            self.task_tree.blockSignals(True)
+            self.task_tree.setSortingEnabled(False)
+            try:
+                # Imported config items are highlighted as the rows are set
+                self.task_tree.populate_tasks(tasks, self.imported_task_names)
+            finally:
+                self.task_tree.setSortingEnabled(True)
+                self.task_tree.blockSignals(False)
+                self.task_tree.setUpdatesEnabled(True)
+            # The selection was cleared while signals were blocked
+            self.on_task_selection_changed()
+            
+            self.set_info_text(f"Loaded {len(tasks)} scheduled tasks.")
             self.logger.info(f"Refreshed {len(tasks)} scheduled tasks")
         except Exception as e:
             self.logger.error(f"Failed to refresh tasks: {str(e)}")
             QMessageBox.critical(self, "Error", f"Failed to refresh tasks:\n{str(e)}")
             
+    def schedule_refresh(self):
+        """Refresh the task list shortly, once for a burst of requests."""
+        self._refresh_timer.start()
+        
     def highlight_imported_tasks(self):
         """Highlight tasks that are marked as imported from configuration."""
         try:
-            # Iterate through all items in the tree
-            for item in self.task_tree.get_all_items():
-                task_data = item.data(0, Qt.ItemDataRole.UserRole)
-                if task_data and task_data.get('name'):
-                    task_name = task_data.get('name')
-                    
-                    # Check if this task is in the imported config
-                    if f"scheduler:task:{task_name}" in self.imported_config_items:
-                        self.task_tree.highlight_item(item)
-                        
+            # The model highlights rows by name when they are painted
+            self.task_tree.set_highlighted_tasks(self.imported_task_names)
+            
         except Exception as e:
             self.logger.error(f"Error highlighting imported tasks: {str(e)}")
             
@@ -167,9 +263,22 @@ class SchedulerPanel(BasePanel):
             info_text += f"Last Run: {selected_task.get('last_run', 'N/A')}\n"
             info_text += f"Last Result: {selected_task.get('last_result', 'N/A')}\n"
             info_text += f"Command: {selected_task.get('task_to_run', 'N/A')}"
-            self.info_text.setPlainText(info_text)
+            self.set_info_text(info_text)
         else:
-            self.info_text.setPlainText("Select a task to view details...")
+            self.set_info_text("Select a task to view details...")
+            
+    def set_info_text(self, text):
+        """Show text in the task information box.
+        
+        The box is only updated when the text changes, so re-selecting a
+        task does not lay out the same document again.
+        
+        Args:
+            text: Text to show
+        """
+        if text != self._last_info_text:
+            self.info_text.setPlainText(text)
+            self._last_info_text = text
             
     def run_selected_task(self):
         """Run the selected task immediately."""
@@ -177,16 +286,7 @@ class SchedulerPanel(BasePanel):
         if not task_name:
             return
             
-        try:
-            if self.manager.run_task(task_name):
-                QMessageBox.information(self, "Success", f"Task '{task_name}' has been started.")
-                # Refresh to show updated status
-                QTimer.singleShot(1000, self.refresh_tasks)
-            else:
-                QMessageBox.warning(self, "Failed", f"Failed to run task '{task_name}'.")
-        except Exception as e:
-            self.logger.error(f"Error running task: {e}")
-            QMessageBox.critical(self, "Error", f"Error running task:\n{str(e)}")
+        self.start_task_action('run', task_name)
             
     def enable_selected_task(self):
         """Enable the selected task."""
@@ -194,15 +294,7 @@ class SchedulerPanel(BasePanel):
         if not task_name:
             return
             
-        try:
-            if self.manager.enable_task(task_name):
-                QMessageBox.information(self, "Success", f"Task '{task_name}' has been enabled.")
-                self.refresh_tasks()
-            else:
-                QMessageBox.warning(self, "Failed", f"Failed to enable task '{task_name}'.")
-        except Exception as e:
-            self.logger.error(f"Error enabling task: {e}")
-            QMessageBox.critical(self, "Error", f"Error enabling task:\n{str(e)}")
+        self.start_task_action('enable', task_name)
             
     def disable_selected_task(self):
         """Disable the selected task."""
@@ -211,16 +303,8 @@ class SchedulerPanel(BasePanel):
             return
             
         dialog = ConfirmTaskActionDialog("disable", task_name, self)
-        if dialog.exec() == QMessageBox.StandardButton.Yes:
-            try:
-                if self.manager.disable_task(task_name):
-                    QMessageBox.information(self, "Success", f"Task '{task_name}' has been disabled.")
-                    self.refresh_tasks()
-                else:
-                    QMessageBox.warning(self, "Failed", f"Failed to disable task '{task_name}'.")
-            except Exception as e:
-                self.logger.error(f"Error disabling task: {e}")
-                QMessageBox.critical(self, "Error", f"Error disabling task:\n{str(e)}")
+        if dialog.exec():
+            self.start_task_action('disable', task_name)
                 
     def delete_selected_task(self):
         """Delete the selected task."""
@@ -229,16 +313,55 @@ class SchedulerPanel(BasePanel):
             return
             
         dialog = ConfirmTaskActionDialog("delete", task_name, self)
-        if dialog.exec() == QMessageBox.StandardButton.Yes:
-            try:
-                if self.manager.delete_task(task_name):
-                    QMessageBox.information(self, "Success", f"Task '{task_name}' has been deleted.")
-                    self.refresh_tasks()
-                else:
-                    QMessageBox.warning(self, "Failed", f"Failed to delete task '{task_name}'.")
-            except Exception as e:
-                self.logger.error(f"Error deleting task: {e}")
-                QMessageBox.critical(self, "Error", f"Error deleting task:\n{str(e)}")
+        if dialog.exec():
+            self.start_task_action('delete', task_name)
+            
+    def set_action_buttons_enabled(self, enabled):
+        """Enable or disable the buttons that change tasks.
+        
+        Args:
+            enabled: Whether the buttons are enabled
+        """
+        for button in (self.run_button, self.enable_button,
+                       self.disable_button, self.delete_button):
+            button.setEnabled(enabled)
+            
+    def start_task_action(self, action, task_name):
+        """Apply an action to a task in a background thread.
+        
+        Args:
+            action: 'run', 'enable', 'disable' or 'delete'
+            task_name: Full task name
+        """
+        if self.action_worker and self.action_worker.isRunning():
+            return
+            
+        self.set_action_buttons_enabled(False)
+        self.action_worker = TaskActionWorker(self.manager, action, [task_name])
+        self.action_worker.action_finished.connect(self.on_task_action_finished)
+        self.action_worker.start()
+        
+    def on_task_action_finished(self, action, results):
+        """Handle the result of a task action.
+        
+        Args:
+            action: Action that was applied
+            results: Dictionary of task name -> success
+        """
+        self.set_action_buttons_enabled(self.task_tree.get_selected_task() is not None)
+        
+        for task_name, success in results.items():
+            if success:
+                QMessageBox.information(self, "Success", f"Task '{task_name}' has been {self.ACTION_DONE[action]}.")
+            else:
+                QMessageBox.warning(self, "Failed", f"Failed to {action} task '{task_name}'.")
+                
+        if any(results.values()):
+            if action == 'run':
+                # Give the task a moment to start before showing its status
+                QTimer.singleShot(1000, self.schedule_refresh)
+            else:
+                self.schedule_refresh()
                 
     def show_task_details(self):
         """Show detailed information about the selected task."""
@@ -253,7 +376,7 @@ class SchedulerPanel(BasePanel):
             
             if detailed_info:
                 # Merge the basic task info with detailed info
-                combined_data = {**selected_task, **detailed_info}
+                combined_data = {**selected_task, **detailed_info.to_dict()}
             else:
                 combined_data = selected_task
                 
@@ -267,8 +390,12 @@ class SchedulerPanel(BasePanel):
     def cleanup(self):
         """Clean up resources when the panel is destroyed."""
         try:
-            # Stop any running operations
-            pass
+            # Let a running task action and refresh finish
+            if self.action_worker and self.action_worker.isRunning():
+                self.action_worker.wait()
+            self._refresh_pending = False
+            if self.refresh_worker.isRunning():
+                self.refresh_worker.wait()
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
             
@@ -301,6 +428,9 @@ class SchedulerPanel(BasePanel):
                 
             success = False
             
+            # Query the existing tasks once instead of once per configured task
+            existing_names = {task['name'] for task in self.manager.get_scheduled_tasks()}
+            
             # Process each task in the configuration
             for task_config in tasks_config:
                 if not isinstance(task_config, dict):
@@ -324,13 +454,11 @@ class SchedulerPanel(BasePanel):
                 # Create task dialog would normally be used here, but we're applying directly
                 try:
                     # Check if task already exists
-                    existing_tasks = self.manager.get_scheduled_tasks()
-                    task_exists = any(task['name'] == task_name for task in existing_tasks)
-                    
-                    if task_exists:
+                    if task_name in existing_names:
                         # Delete existing task first
                         self.logger.info(f"Replacing existing task: {task_name}")
-                        self.manager.delete_task(task_name)
+                        if self.manager.delete_task(task_name):
+                            existing_names.discard(task_name)
                     
                     # Create the task with configuration
                     result = self.manager.create_task(
@@ -343,6 +471,7 @@ class SchedulerPanel(BasePanel):
                     
                     if result:
                         self.logger.info(f"Created scheduled task: {task_name}")
+                        existing_names.add(task_name)
                         
                         # Set enabled state if needed
                         if not enabled:
@@ -357,7 +486,7 @@ class SchedulerPanel(BasePanel):
                     self.logger.error(f"Error creating scheduled task '{task_name}': {str(e)}")
             
             # Refresh the task list to show updated state
-            self.refresh_tasks()
+            self.schedule_refresh()
             return success
             
         except Exception as e:
@@ -374,11 +503,14 @@ class SchedulerPanel(BasePanel):
         
         try:
             # Get current scheduled tasks
-            tasks = self.manager.get_scheduled_tasks()
+            tasks = self.manager.get_scheduled_tasks_verbose()
             
             # Filter out system tasks and create exportable task configurations
             exportable_tasks = []
             
+            # Load all task definitions at once instead of one schtasks call per task
+            self.manager.prefetch_task_details()
+            
             for task in tasks:
                 # Skip Microsoft and Windows system tasks
                 if task['name'].startswith('\\Microsoft\\') or task['name'].startswith('\\Windows\\'):
@@ -394,8 +526,8 @@ class SchedulerPanel(BasePanel):
                 task_config = {
                     'name': task['name'],
                     'command': task.get('task_to_run', ''),
-                    'description': task_details.get('description', ''),
-                    'schedule_type': task_details.get('trigger_type', 'ONCE'),
+                    'description': task_details.description or '',
+                    'schedule_type': 'ONCE',
                     'enabled': task.get('status', '') == 'Ready'
                 }
                 
@@ -429,6 +561,7 @@ class SchedulerPanel(BasePanel):
         
         # Clear previous imported items
         self.imported_config_items.clear()
+        self.imported_task_names.clear()
         
         if not isinstance(config, dict):
             self.logger.error("Invalid configuration format")
@@ -463,6 +596,7 @@ class SchedulerPanel(BasePanel):
                 
                 # Mark this task as imported from config for highlighting
                 self.mark_as_imported_config(f"scheduler:task:{task_name}")
+                self.imported_task_names.add(task_name)
                 self.logger.debug(f"Marked scheduled task for highlighting: {task_name}")
                 
                 # Check if task exists
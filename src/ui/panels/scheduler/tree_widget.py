@@ -1,28 +1,225 @@
-"""Tree widget for displaying scheduled tasks."""
-from PyQt6.QtWidgets import QTreeWidget, QTreeWidgetItem, QHeaderView
-from PyQt6.QtCore import Qt
+"""Tree view and table model for displaying scheduled tasks."""
+from PyQt6.QtWidgets import QTreeView, QHeaderView
+from PyQt6.QtCore import (Qt, pyqtSignal, QAbstractTableModel, QModelIndex,
+                          QSortFilterProxyModel)
 from src.core.logger import setup_logger
 
-class SchedulerTreeWidget(QTreeWidget):
-    """Tree widget for displaying Windows scheduled tasks."""
+
+def _status_color(status):
+    """Get the text color of a task status.
+    
+    Args:
+        status: Task status as reported by schtasks
+    
+    Returns:
+        Qt.GlobalColor: Status color, or None for the default color
+    """
+    status = status.lower()
+    if status == 'ready':
+        return Qt.GlobalColor.darkGreen
+    if status == 'running':
+        return Qt.GlobalColor.blue
+    if status == 'disabled':
+        return Qt.GlobalColor.red
+    if 'error' in status or 'failed' in status:
+        return Qt.GlobalColor.darkRed
+    return None
+
+
+class SchedulerTaskModel(QAbstractTableModel):
+    """Table model listing scheduled tasks."""
+    
+    HEADERS = [
+        "Task Name",
+        "Status",
+        "Next Run",
+        "Last Run",
+        "Last Result",
+        "Author",
+        "Task To Run"
+    ]
+    # Task dictionary key shown in each column
+    KEYS = ('name', 'status', 'next_run', 'last_run', 'last_result', 'author', 'task_to_run')
+    STATUS_COLUMN = 1
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Each row is [column texts, task data, status color, is_virtual]
+        self._rows = []
+        # Names of tasks imported from configuration
+        self._highlighted = set()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Get the number of tasks."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Get the number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Get cell data for visible cells."""
+        if not index.isValid():
+            return None
+        texts, task, status_color, is_virtual = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return texts[index.column()]
+        if role == Qt.ItemDataRole.UserRole:
+            return task
+        
+        highlighted = is_virtual or texts[0] in self._highlighted
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return Qt.GlobalColor.cyan if highlighted else None
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if highlighted:
+                return Qt.GlobalColor.darkBlue
+            return status_color if index.column() == self.STATUS_COLUMN else None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if is_virtual:
+                return "Virtual task from configuration file (not created yet)"
+            if highlighted:
+                return "Imported from configuration file"
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Get column header labels."""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def _make_row(self, task):
+        """Build the row of a scheduled task.
+        
+        Args:
+            task: Task dictionary
+        
+        Returns:
+            list: Row in the format stored in _rows
+        """
+        texts = tuple(task.get(key, '') for key in self.KEYS)
+        return [texts, task, _status_color(texts[self.STATUS_COLUMN]), False]
+    
+    def set_tasks(self, tasks, highlighted_names=None):
+        """Replace the listed tasks.
+        
+        Args:
+            tasks: Task dictionaries
+            highlighted_names: Names of tasks to highlight, or None to keep
+                the current highlighting
+        """
+        self.beginResetModel()
+        self._rows = [self._make_row(task) for task in tasks]
+        if highlighted_names is not None:
+            self._highlighted = set(highlighted_names)
+        self.endResetModel()
+    
+    def add_virtual_task(self, task):
+        """Append a task from imported configuration that does not exist yet.
+        
+        Args:
+            task: Task configuration dictionary
+        """
+        texts = (
+            task.get('name', ''),
+            "Virtual (Not Applied)",
+            "N/A",  # Next Run
+            "N/A",  # Last Run
+            "N/A",  # Last Result
+            "Config Import",  # Author
+            task.get('command', '')
+        )
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([texts, task, None, True])
+        self.endInsertRows()
+    
+    def update_task(self, task_name, updated_task):
+        """Replace the data of a listed task.
+        
+        Args:
+            task_name: Name of the task to update
+            updated_task: New task dictionary
+        
+        Returns:
+            bool: True if the task was found
+        """
+        row = self.find_row(task_name)
+        if row < 0:
+            return False
+        self._rows[row] = self._make_row(updated_task)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+        return True
+    
+    def set_highlighted_names(self, names):
+        """Set which tasks are highlighted as imported from configuration.
+        
+        Args:
+            names: Iterable of task names
+        """
+        self._highlighted = set(names)
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, len(self.HEADERS) - 1)
+            )
+    
+    def find_row(self, task_name):
+        """Find the row of a task.
+        
+        Args:
+            task_name: Name of the task
+        
+        Returns:
+            int: Row number, or -1 if the task is not listed
+        """
+        for row, (texts, _, _, _) in enumerate(self._rows):
+            if texts[0] == task_name:
+                return row
+        return -1
+    
+    def task(self, row):
+        """Get the data of the task in a row.
+        
+        Args:
+            row: Row number
+        
+        Returns:
+            dict: Task dictionary
+        """
+        return self._rows[row][1]
+    
+    def tasks(self):
+        """Get the data of all listed tasks.
+        
+        Returns:
+            list: Task dictionaries in row order
+        """
+        return [row[1] for row in self._rows]
+
+
+class SchedulerTreeWidget(QTreeView):
+    """Tree view for displaying Windows scheduled tasks."""
+    
+    # Signal emitted whenever the selection changes
+    itemSelectionChanged = pyqtSignal()
+    
+    # Signal emitted when a task is double-clicked
+    itemDoubleClicked = pyqtSignal()
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = setup_logger(self.__class__.__name__)
         self.setup_ui()
-        
+    
     def setup_ui(self):
-        """Set up the tree widget."""
-        # Set headers
-        self.setHeaderLabels([
-            "Task Name",
-            "Status",
-            "Next Run",
-            "Last Run",
-            "Last Result",
-            "Author",
-            "Task To Run"
-        ])
+        """Set up the tree view."""
+        self.task_model = SchedulerTaskModel(self)
+        self.task_proxy = QSortFilterProxyModel(self)
+        self.task_proxy.setSourceModel(self.task_model)
+        self.setModel(self.task_proxy)
+        
+        # Flat list with rows of the same height
+        self.setRootIsDecorated(False)
+        self.setUniformRowHeights(True)
         
         # Configure columns
         header = self.header()
@@ -35,8 +232,8 @@ class SchedulerTreeWidget(QTreeWidget):
         header.setSectionResizeMode(6, QHeaderView.ResizeMode.Stretch)           # Task To Run
         
         # Set selection behavior
-        self.setSelectionBehavior(QTreeWidget.SelectionBehavior.SelectRows)
-        self.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        self.setSelectionBehavior(QTreeView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QTreeView.SelectionMode.SingleSelection)
         
         # Enable sorting
         self.setSortingEnabled(True)
@@ -45,92 +242,51 @@ class SchedulerTreeWidget(QTreeWidget):
         # Set alternating row colors
         self.setAlternatingRowColors(True)
         
-    def populate_tasks(self, tasks):
-        """Populate the tree with scheduled tasks."""
-        self.clear()
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.doubleClicked.connect(self._on_double_clicked)
+        
+    def _on_selection_changed(self, selected, deselected):
+        """Forward selection changes as itemSelectionChanged."""
+        self.itemSelectionChanged.emit()
+        
+    def _on_double_clicked(self, index):
+        """Forward double-clicks as itemDoubleClicked."""
+        self.itemDoubleClicked.emit()
+    
+    def populate_tasks(self, tasks, imported_names=None):
+        """Populate the view with scheduled tasks.
+        
+        Args:
+            tasks: Task dictionaries
+            imported_names: Names of tasks imported from configuration to
+                highlight, or None to keep the current highlighting
+        """
+        self.task_model.set_tasks(tasks or [], imported_names)
         
         if not tasks:
             self.logger.debug("No scheduled tasks to display")
             return
-            
-        for task in tasks:
-            try:
-                item = QTreeWidgetItem([
-                    task.get('name', ''),
-                    task.get('status', ''),
-                    task.get('next_run', ''),
-                    task.get('last_run', ''),
-                    task.get('last_result', ''),
-                    task.get('author', ''),
-                    task.get('task_to_run', '')
-                ])
-                
-                # Store full task data in the item
-                item.setData(0, Qt.ItemDataRole.UserRole, task)
-                
-                # Set status-based styling
-                status = task.get('status', '').lower()
-                if status == 'ready':
-                    item.setForeground(1, Qt.GlobalColor.darkGreen)
-                elif status == 'running':
-                    item.setForeground(1, Qt.GlobalColor.blue)
-                elif status == 'disabled':
-                    item.setForeground(1, Qt.GlobalColor.red)
-                elif 'error' in status or 'failed' in status:
-                    item.setForeground(1, Qt.GlobalColor.darkRed)
-                
-                self.addTopLevelItem(item)
-                
-            except Exception as e:
-                self.logger.error(f"Error adding task item: {e}")
-                continue
         
         self.logger.debug(f"Populated tree with {len(tasks)} scheduled tasks")
-        
+    
     def get_selected_task(self):
         """Get the currently selected task data."""
-        current_item = self.currentItem()
-        if current_item:
-            return current_item.data(0, Qt.ItemDataRole.UserRole)
+        rows = self.selectionModel().selectedRows()
+        if rows:
+            return self.task_model.task(self.task_proxy.mapToSource(rows[0]).row())
         return None
-        
+    
     def get_selected_task_name(self):
         """Get the name of the currently selected task."""
         task = self.get_selected_task()
         if task:
             return task.get('name', '')
         return None
-        
+    
     def refresh_task_item(self, task_name, updated_task):
-        """Refresh a specific task item with updated data."""
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item and item.text(0) == task_name:
-                # Update the item with new data
-                item.setText(0, updated_task.get('name', ''))
-                item.setText(1, updated_task.get('status', ''))
-                item.setText(2, updated_task.get('next_run', ''))
-                item.setText(3, updated_task.get('last_run', ''))
-                item.setText(4, updated_task.get('last_result', ''))
-                item.setText(5, updated_task.get('author', ''))
-                item.setText(6, updated_task.get('task_to_run', ''))
-                
-                # Update stored data
-                item.setData(0, Qt.ItemDataRole.UserRole, updated_task)
-                
-                # Update status styling
-                status = updated_task.get('status', '').lower()
-                if status == 'ready':
-                    item.setForeground(1, Qt.GlobalColor.darkGreen)
-                elif status == 'running':
-                    item.setForeground(1, Qt.GlobalColor.blue)
-                elif status == 'disabled':
-                    item.setForeground(1, Qt.GlobalColor.red)
-                elif 'error' in status or 'failed' in status:
-                    item.setForeground(1, Qt.GlobalColor.darkRed)
-                
-                break
-
+        """Refresh a specific task row with updated data."""
+        self.task_model.update_task(task_name, updated_task)
+    
     def add_virtual_task(self, task):
         """Add a virtual task entry from imported configuration.
         
@@ -140,73 +296,43 @@ class SchedulerTreeWidget(QTreeWidget):
         
         Args:
             task: Dictionary containing task data
-            
+        
         Returns:
-            QTreeWidgetItem: Created tree item
+            bool: True if the task was added
         """
         try:
-            item = QTreeWidgetItem([
-                task.get('name', ''),
-                "Virtual (Not Applied)",
-                "N/A",  # Next Run
-                "N/A",  # Last Run
-                "N/A",  # Last Result
-                "Config Import",  # Author
-                task.get('command', '')
-            ])
-            
-            # Store full task data in the item
-            item.setData(0, Qt.ItemDataRole.UserRole, task)
-            
-            # Apply highlighting for virtual item
-            self.highlight_item(item, is_virtual=True)
-            
-            self.addTopLevelItem(item)
+            self.task_model.add_virtual_task(task)
             self.logger.debug(f"Added virtual task: {task.get('name', '')}")
-            return item
-            
+            return True
+        
         except Exception as e:
             self.logger.error(f"Error adding virtual task item: {e}")
-            return None
+            return False
     
-    def highlight_item(self, item, is_virtual=False):
-        """Highlight an item to indicate it's from imported configuration.
+    def set_highlighted_tasks(self, task_names):
+        """Highlight tasks to indicate they are from imported configuration.
         
         Args:
-            item: QTreeWidgetItem to highlight
-            is_virtual: Whether this is a virtual entry (not in system yet)
+            task_names: Iterable of task names
         """
-        for col in range(self.columnCount()):
-            item.setBackground(col, Qt.GlobalColor.cyan)
-            item.setForeground(col, Qt.GlobalColor.darkBlue)
-            
-            if is_virtual:
-                item.setToolTip(col, "Virtual task from configuration file (not created yet)")
-            else:
-                item.setToolTip(col, "Imported from configuration file")
+        self.task_model.set_highlighted_names(task_names)
     
-    def get_all_items(self):
-        """Get all items in the tree.
+    def get_all_tasks(self):
+        """Get all tasks in the view.
         
         Returns:
-            list: List of all QTreeWidgetItems
+            list: Task dictionaries
         """
-        items = []
-        for i in range(self.topLevelItemCount()):
-            items.append(self.topLevelItem(i))
-        return items
-        
+        return self.task_model.tasks()
+    
     def find_task_by_name(self, task_name):
-        """Find a task item by name.
+        """Find a task by name.
         
         Args:
             task_name: Name of the task to find
-            
+        
         Returns:
-            QTreeWidgetItem: Found item or None
+            dict: Task data or None
         """
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            if item and item.text(0) == task_name:
-                return item
-        return None
+        row = self.task_model.find_row(task_name)
+        return self.task_model.task(row) if row >= 0 else None
@@ -0,0 +1,139 @@
+"""Unit tests for the .reg file parser."""
+import pytest
+
+winreg = pytest.importorskip("winreg")
+
+from src.ui.panels.registry.reg_file import parse_reg_file
+
+HEADER = "Windows Registry Editor Version 5.00\r\n\r\n"
+
+
+def _parse(tmp_path, body, encoding='utf-16'):
+    """Write a .reg file and parse it.
+
+    Args:
+        tmp_path: Directory to write the file to
+        body: File contents after the header
+        encoding: File encoding
+
+    Returns:
+        tuple: Result of parse_reg_file
+    """
+    path = tmp_path / "test.reg"
+    path.write_bytes((HEADER + body).encode(encoding))
+    return parse_reg_file(str(path))
+
+
+def _values(operations):
+    """Drop the key creations from parsed operations."""
+    return [op for op in operations if op[1] is not None]
+
+
+def test_every_key_is_created(tmp_path):
+    operations, skipped = _parse(
+        tmp_path,
+        '[HKEY_CURRENT_USER\\Software\\Empty]\r\n\r\n'
+        '[HKEY_CURRENT_USER\\Software\\Full]\r\n"A"="1"\r\n'
+    )
+    assert operations == [
+        ('HKEY_CURRENT_USER\\Software\\Empty', None, winreg.REG_NONE, None),
+        ('HKEY_CURRENT_USER\\Software\\Full', None, winreg.REG_NONE, None),
+        ('HKEY_CURRENT_USER\\Software\\Full', 'A', winreg.REG_SZ, '1'),
+    ]
+    assert skipped == []
+
+
+def test_root_only_section(tmp_path):
+    operations, _ = _parse(tmp_path, '[HKEY_CURRENT_USER]\r\n"A"=dword:00000001\r\n')
+    assert operations == [
+        ('HKEY_CURRENT_USER', None, winreg.REG_NONE, None),
+        ('HKEY_CURRENT_USER', 'A', winreg.REG_DWORD, 1),
+    ]
+
+
+def test_quoted_names(tmp_path):
+    operations, _ = _parse(
+        tmp_path,
+        '[HKEY_CURRENT_USER\\Software\\Test]\r\n'
+        '"Say \\"hi\\""="a\\\\b"\r\n'
+        '"Eq=Name"="x=y"\r\n'
+    )
+    assert _values(operations) == [
+        ('HKEY_CURRENT_USER\\Software\\Test', 'Say "hi"', winreg.REG_SZ, 'a\\b'),
+        ('HKEY_CURRENT_USER\\Software\\Test', 'Eq=Name', winreg.REG_SZ, 'x=y'),
+    ]
+
+
+def test_default_value(tmp_path):
+    operations, _ = _parse(tmp_path, '[HKEY_CURRENT_USER\\Software\\Test]\r\n@="default"\r\n')
+    assert _values(operations) == [
+        ('HKEY_CURRENT_USER\\Software\\Test', '', winreg.REG_SZ, 'default'),
+    ]
+
+
+def test_hex_types(tmp_path):
+    operations, _ = _parse(
+        tmp_path,
+        '[HKEY_CURRENT_USER\\Software\\Test]\r\n'
+        '"Bin"=hex:01,02,ff\r\n'
+        '"None"=hex(0):\r\n'
+        '"Expand"=hex(2):25,00,41,00,25,00,00,00\r\n'
+        '"Multi"=hex(7):61,00,00,00,62,00,00,00,00,00\r\n'
+        '"Qword"=hex(b):02,01,00,00,00,00,00,00\r\n'
+        '"Dword"=dword:0000002a\r\n'
+    )
+    key = 'HKEY_CURRENT_USER\\Software\\Test'
+    assert _values(operations) == [
+        (key, 'Bin', winreg.REG_BINARY, b'\x01\x02\xff'),
+        (key, 'None', winreg.REG_NONE, b''),
+        (key, 'Expand', winreg.REG_EXPAND_SZ, '%A%'),
+        (key, 'Multi', winreg.REG_MULTI_SZ, ['a', 'b']),
+        (key, 'Qword', winreg.REG_QWORD, 0x102),
+        (key, 'Dword', winreg.REG_DWORD, 42),
+    ]
+
+
+def test_line_continuations(tmp_path):
+    operations, _ = _parse(
+        tmp_path,
+        '[HKEY_CURRENT_USER\\Software\\Test]\r\n'
+        '"Bin"=hex:01,02,\\\r\n'
+        '  03,04\r\n'
+    )
+    assert _values(operations) == [
+        ('HKEY_CURRENT_USER\\Software\\Test', 'Bin', winreg.REG_BINARY, b'\x01\x02\x03\x04'),
+    ]
+
+
+def test_value_deletion(tmp_path):
+    operations, _ = _parse(tmp_path, '[HKEY_CURRENT_USER\\Software\\Test]\r\n"Old"=-\r\n')
+    assert _values(operations) == [
+        ('HKEY_CURRENT_USER\\Software\\Test', 'Old', winreg.REG_NONE, None),
+    ]
+
+
+def test_key_deletion_is_skipped(tmp_path):
+    operations, skipped = _parse(
+        tmp_path,
+        '[-HKEY_CURRENT_USER\\Software\\Gone]\r\n"Ignored"="1"\r\n'
+    )
+    assert operations == []
+    assert skipped == ['HKEY_CURRENT_USER\\Software\\Gone']
+
+
+def test_comments_and_utf8(tmp_path):
+    operations, _ = _parse(
+        tmp_path,
+        '; comment\r\n[HKEY_CURRENT_USER\\Software\\Test]\r\n"Name"="é"\r\n',
+        encoding='utf-8-sig'
+    )
+    assert _values(operations) == [
+        ('HKEY_CURRENT_USER\\Software\\Test', 'Name', winreg.REG_SZ, 'é'),
+    ]
+
+
+def test_missing_header(tmp_path):
+    path = tmp_path / "test.reg"
+    path.write_text('[HKEY_CURRENT_USER\\Software\\Test]\r\n')
+    with pytest.raises(ValueError):
+        parse_reg_file(str(path))